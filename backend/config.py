@@ -16,9 +16,115 @@ class Settings(BaseSettings):
     sportmonks_api_token: str = os.getenv("SPORTMONKS_API_TOKEN", "YOUR_TOKEN_HERE").strip('"').strip("'")
     fastapi_host: str = os.getenv("FASTAPI_HOST", "127.0.0.1")
     fastapi_port: int = int(os.getenv("FASTAPI_PORT", "8000"))
+    # gunicorn worker processes (gunicorn.conf.py) — one per core by default
+    web_concurrency: int = int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1)))
 
-    # SportMonks base URL
-    sportmonks_base_url: str = "https://api.sportmonks.com/v3/football"
+    # SportMonks base URL (point at benchmarks/mock_sportmonks.py for offline load tests)
+    sportmonks_base_url: str = os.getenv("SPORTMONKS_BASE_URL", "https://api.sportmonks.com/v3/football").rstrip("/")
+
+    # Upstream HTTP client — one pooled client shared by every request
+    upstream_http2: bool = os.getenv("UPSTREAM_HTTP2", "false").lower() in ("1", "true", "yes")
+    upstream_max_connections: int = int(os.getenv("UPSTREAM_MAX_CONNECTIONS", "100"))
+    upstream_max_keepalive_connections: int = int(os.getenv("UPSTREAM_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    upstream_keepalive_expiry: float = float(os.getenv("UPSTREAM_KEEPALIVE_EXPIRY", "30.0"))
+    upstream_connect_timeout: float = float(os.getenv("UPSTREAM_CONNECT_TIMEOUT", "5.0"))
+    upstream_read_timeout: float = float(os.getenv("UPSTREAM_READ_TIMEOUT", "30.0"))
+    upstream_write_timeout: float = float(os.getenv("UPSTREAM_WRITE_TIMEOUT", "10.0"))
+    upstream_pool_timeout: float = float(os.getenv("UPSTREAM_POOL_TIMEOUT", "5.0"))
+
+    # Upstream transport: live API, live + record every response, or replay recorded snapshots only
+    upstream_mode: str = os.getenv("UPSTREAM_MODE", "live").lower()
+    snapshot_dir: str = os.getenv("SNAPSHOT_DIR", "data/snapshots")
+
+    # Response cache — per-endpoint TTLs (seconds), LRU byte budget, stale-while-revalidate window
+    cache_enabled: bool = os.getenv("CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+    cache_max_bytes: int = int(os.getenv("CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    cache_stale_while_revalidate: float = float(os.getenv("CACHE_STALE_WHILE_REVALIDATE", "300"))
+    cache_ttl_pre_match: float = float(os.getenv("CACHE_TTL_PRE_MATCH", "120"))
+    cache_ttl_post_match: float = float(os.getenv("CACHE_TTL_POST_MATCH", "300"))
+    cache_ttl_upcoming: float = float(os.getenv("CACHE_TTL_UPCOMING", "60"))
+    cache_ttl_season: float = float(os.getenv("CACHE_TTL_SEASON", "600"))
+    # Adaptive TTLs (backend/services/ttl_policy.py) — from each page's kick-off and created_at times
+    cache_adaptive_ttl: bool = os.getenv("CACHE_ADAPTIVE_TTL", "true").lower() in ("1", "true", "yes")
+    cache_ttl_kickoff: float = float(os.getenv("CACHE_TTL_KICKOFF", "30"))
+    cache_kickoff_window: float = float(os.getenv("CACHE_KICKOFF_WINDOW", str(2 * 3600)))
+    cache_live_window: float = float(os.getenv("CACHE_LIVE_WINDOW", str(3 * 3600)))
+    cache_quiet_fraction: float = float(os.getenv("CACHE_QUIET_FRACTION", "0.1"))
+    cache_ttl_max: float = float(os.getenv("CACHE_TTL_MAX", "1800"))
+    cache_archive_after: float = float(os.getenv("CACHE_ARCHIVE_AFTER", str(14 * 86400)))
+    cache_ttl_archive: float = float(os.getenv("CACHE_TTL_ARCHIVE", str(30 * 86400)))
+
+    # Cache tier shared by every worker on the host (SQLite) — turned on by gunicorn.conf.py
+    shared_cache_enabled: bool = os.getenv("SHARED_CACHE_ENABLED", "false").lower() in ("1", "true", "yes")
+    shared_cache_path: str = os.getenv("SHARED_CACHE_PATH", "data/shared_cache.db")
+    shared_cache_max_bytes: int = int(os.getenv("SHARED_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+    shared_cache_lease: float = float(os.getenv("SHARED_CACHE_LEASE", "5"))
+    # Lease on the background jobs (store sync, prefetch) held by one worker; a standby takes over
+    # within this many seconds of the holder dying
+    leader_lease: float = float(os.getenv("LEADER_LEASE", "30"))
+
+    # Prefetch — hot feeds loaded at startup (within a time budget) and refreshed before they expire.
+    # Defaults match what the Streamlit app asks for on a first visit: latest, upcoming, season 23614
+    prefetch_enabled: bool = os.getenv("PREFETCH_ENABLED", "true").lower() in ("1", "true", "yes")
+    prefetch_feeds: str = os.getenv("PREFETCH_FEEDS", "pre-match,post-match,pre-match/upcoming")
+    prefetch_seasons: str = os.getenv("PREFETCH_SEASONS", "23614")  # pre- and post-match news of each
+    prefetch_pages: int = int(os.getenv("PREFETCH_PAGES", "1"))
+    prefetch_includes: str = os.getenv("PREFETCH_INCLUDES", "fixture.participants;league;lines")  # comma-separated
+    prefetch_order: str = os.getenv("PREFETCH_ORDER", "desc")
+    prefetch_per_page: int = int(os.getenv("PREFETCH_PER_PAGE", "50"))
+    prefetch_startup_budget: float = float(os.getenv("PREFETCH_STARTUP_BUDGET", "15"))
+    prefetch_concurrency: int = int(os.getenv("PREFETCH_CONCURRENCY", "4"))
+    prefetch_refresh_ahead: float = float(os.getenv("PREFETCH_REFRESH_AHEAD", "0.8"))  # fraction of the TTL
+
+    # Response compression (gzip / br / zstd) — bodies below the threshold are sent as-is
+    compression_enabled: bool = os.getenv("COMPRESSION_ENABLED", "true").lower() in ("1", "true", "yes")
+    compression_min_bytes: int = int(os.getenv("COMPRESSION_MIN_BYTES", "1024"))
+
+    # Entity cache — leagues/teams/fixtures joined locally so news calls only ask upstream for `lines`
+    entity_cache_enabled: bool = os.getenv("ENTITY_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+    entity_ttl: float = float(os.getenv("ENTITY_TTL", str(7 * 24 * 3600)))
+    entity_fixture_ttl: float = float(os.getenv("ENTITY_FIXTURE_TTL", str(6 * 3600)))
+    entity_max_entries: int = int(os.getenv("ENTITY_MAX_ENTRIES", "50000"))
+
+    # Image proxy — logos fetched once into a disk cache and served as thumbnails (`images=proxy`)
+    image_cache_dir: str = os.getenv("IMAGE_CACHE_DIR", "data/images")
+    image_max_bytes: int = int(os.getenv("IMAGE_MAX_BYTES", str(2 * 1024 * 1024)))
+    public_base_url: str = os.getenv("PUBLIC_BASE_URL", "")  # how browsers reach this API; default: request URL
+
+    # Prometheus /metrics (set PROMETHEUS_MULTIPROC_DIR as well when running several workers)
+    metrics_enabled: bool = os.getenv("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+
+    # Server-Timing header on every response; per-request sampling profiler (?profile=1 / X-Profile: 1)
+    server_timing_enabled: bool = os.getenv("SERVER_TIMING_ENABLED", "true").lower() in ("1", "true", "yes")
+    profiling_enabled: bool = os.getenv("PROFILING_ENABLED", "false").lower() in ("1", "true", "yes")
+    profile_dir: str = os.getenv("PROFILE_DIR", "data/profiles")
+    profile_interval: float = float(os.getenv("PROFILE_INTERVAL", "0.005"))
+
+    # Upstream rate limiting — SportMonks allows a fixed number of calls per entity per hour
+    rate_limit_capacity: int = int(os.getenv("RATE_LIMIT_CAPACITY", "3000"))
+    rate_limit_window: float = float(os.getenv("RATE_LIMIT_WINDOW", "3600"))
+    rate_limit_background_reserve: int = int(os.getenv("RATE_LIMIT_BACKGROUND_RESERVE", "300"))
+    rate_limit_interactive_max_wait: float = float(os.getenv("RATE_LIMIT_INTERACTIVE_MAX_WAIT", "10"))
+
+    # Season crawler — pages fetched concurrently and a hard stop for runaway feeds
+    crawl_concurrency: int = int(os.getenv("CRAWL_CONCURRENCY", "4"))
+    crawl_max_pages: int = int(os.getenv("CRAWL_MAX_PAGES", "500"))
+
+    # Batch season endpoint — upstream calls in flight per request, and seasons per request
+    batch_concurrency: int = int(os.getenv("BATCH_CONCURRENCY", "6"))
+    batch_max_seasons: int = int(os.getenv("BATCH_MAX_SEASONS", "24"))
+
+    # Local SQLite article store + incremental background sync
+    store_enabled: bool = os.getenv("STORE_ENABLED", "true").lower() in ("1", "true", "yes")
+    store_path: str = os.getenv("STORE_PATH", "data/sportmonks.db")
+    store_sync_interval: float = float(os.getenv("STORE_SYNC_INTERVAL", "300"))
+    store_sync_initial_pages: int = int(os.getenv("STORE_SYNC_INITIAL_PAGES", "10"))
+    store_sync_max_pages: int = int(os.getenv("STORE_SYNC_MAX_PAGES", "5"))
+
+    # Live push (SSE / WebSocket) — shared poll cadence and per-client event buffer
+    live_poll_interval: float = float(os.getenv("LIVE_POLL_INTERVAL", "30"))
+    live_queue_size: int = int(os.getenv("LIVE_QUEUE_SIZE", "100"))
+    live_heartbeat_interval: float = float(os.getenv("LIVE_HEARTBEAT_INTERVAL", "15"))
 
     class Config:
         env_file = ".env"
@@ -3,25 +3,97 @@ FastAPI Backend for SportMonks News API Explorer.
 Proxies SportMonks Football News API — real data from Pro plan.
 """
 
-from fastapi import FastAPI, Query
+import asyncio
+import os
+import time
+from datetime import datetime, timezone
+import orjson
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Path, Query, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse, Response, StreamingResponse
 from typing import Optional
+from urllib.parse import urlsplit
 
+from backend.services.cache import CacheEntry
+from backend.services.competitions import competition_index
+from backend.services.crawler import crawl_pages
+from backend.services.encoding import EncodedBody, encoded_response
+from backend.services.images import THUMBNAIL_SIZES, image_proxy, sniff_media_type
+from backend.services.leader import background_jobs
+from backend.services.live import news_broadcaster
+from backend.services.merged_feed import (
+    advance_positions, decode_keyset_cursor, decode_keyset_state, decode_merged_cursor, encode_keyset_cursor,
+    encode_merged_cursor, merged_latest, next_keyset_cursor, resume_after, sort_key, with_next_cursor,
+)
+from backend.services.metrics import MetricsMiddleware, render_metrics
+from backend.services.normalize import normalize_payload
+from backend.services.prefetch import prefetcher
 from backend.services.sportmonks import sportmonks_service
+from backend.services.store import FEEDS, STORE_INCLUDE, article_store, run_sync_loop
+from backend.services.timing import ServerTimingMiddleware, phase
+from backend.services.ttl_policy import POLICIES, parse_time, ttl_policy
 from backend.config import settings
 
+
+# Cursor of the next page on the cursor-paginated routes, sent as a header so a raw upstream body can
+# go out untouched; `pagination.next_cursor` carries it too whenever the body is rebuilt anyway.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the pooled SportMonks client and start the store sync and prefetch; undo it all on shutdown.
+    Under gunicorn only the worker holding the leader lease runs the sync and the prefetcher."""
+    await sportmonks_service.start()
+    if settings.store_enabled and sportmonks_service.entities is not None:
+        # Warm start: leagues, teams and recent fixtures from the last run, so slim requests start right away
+        sportmonks_service.entities.warm_start(
+            await asyncio.to_thread(article_store.load_entities, settings.entity_max_entries)
+        )
+    if settings.store_enabled:
+        background_jobs.add(
+            "store-sync", lambda: run_sync_loop(sportmonks_service, article_store, settings.store_sync_interval)
+        )
+    if settings.prefetch_enabled and sportmonks_service.cache is not None:
+        # The app is ready at once, hot pages land in the cache within PREFETCH_STARTUP_BUDGET
+        background_jobs.add("prefetch", prefetcher.run)
+    background_jobs.start()
+    try:
+        yield
+    finally:
+        await background_jobs.stop()
+        await news_broadcaster.close()
+        await image_proxy.close()
+        await sportmonks_service.close()
+
+
 app = FastAPI(
     title="SportMonks News API Explorer",
     description="FastAPI backend — Real SportMonks Football News API (Pro plan)",
     version="3.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+if settings.server_timing_enabled:
+    app.add_middleware(
+        ServerTimingMiddleware,
+        profiling=settings.profiling_enabled,
+        profile_dir=settings.profile_dir,
+        interval=settings.profile_interval,
+    )
+
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 
@@ -42,42 +114,403 @@ async def token_status():
     return {"configured": configured, "token_preview": f"{clean[:8]}..." if configured else "NOT SET"}
 
 
+@app.get("/api/stats", tags=["Health"])
+async def service_stats():
+    """Cache hit/miss and request-coalescing counters."""
+    return {
+        **sportmonks_service.stats(),
+        "live": news_broadcaster.stats(),
+        "images": image_proxy.stats(),
+        "prefetch": prefetcher.stats(),
+        "background_jobs": background_jobs.stats(),
+    }
+
+
+@app.get("/api/cache/entries", tags=["Health"])
+async def cache_entries(
+    policy: Optional[str] = Query(None, description=f"Only entries given this TTL policy ({', '.join(POLICIES)})"),
+    limit: int = Query(100, ge=1, le=1000),
+):
+    """Cached upstream responses with the TTL each one was given and why, soonest to expire first."""
+    cache = sportmonks_service.cache
+    if cache is None:
+        raise HTTPException(status_code=404, detail="The response cache is disabled (CACHE_ENABLED=false)")
+    now = time.monotonic()
+    entries = sorted(
+        (e for e in cache.entries() if policy is None or e.ttl_policy == policy), key=lambda e: e.expires_at
+    )
+    return {
+        "total": len(entries),
+        "policies": ttl_policy.stats(),
+        "entries": [
+            {
+                "key": urlsplit(e.key)._replace(scheme="", netloc="").geturl(),
+                "ttl_policy": e.ttl_policy,
+                "ttl_reason": e.ttl_reason,
+                "ttl": round(e.ttl, 1),
+                "age": round(now - e.stored_at, 1),
+                "expires_in": round(e.expires_at - now, 1),
+                "fresh": e.is_fresh(now),
+                "bytes": e.size,
+            }
+            for e in entries[:limit]
+        ],
+    }
+
+
+@app.get("/metrics", tags=["Health"], include_in_schema=False)
+async def prometheus_metrics():
+    """Prometheus scrape endpoint."""
+    if not settings.metrics_enabled:
+        raise HTTPException(status_code=404, detail="Metrics are disabled (METRICS_ENABLED=false)")
+    body, content_type = render_metrics()
+    return Response(body, media_type=content_type)
+
+
+@app.get("/api/profiles/{name}", tags=["Health"], include_in_schema=False)
+async def get_profile(name: str = Path(..., pattern=r"^[\w.-]+\.collapsed$")):
+    """A saved request profile (name from the `X-Profile` response header), collapsed-stack format."""
+    if not settings.profiling_enabled:
+        raise HTTPException(status_code=404, detail="Profiling is disabled (PROFILING_ENABLED=false)")
+    path = os.path.join(settings.profile_dir, name)
+    if not os.path.isfile(path):
+        raise HTTPException(status_code=404, detail="Unknown profile")
+    return FileResponse(path, media_type="text/plain")
+
+
+# ──────────────────────────────────────────────
+# COMPETITIONS — slugs accepted by `competitions=`
+# ──────────────────────────────────────────────
+
+def parse_competitions(value: Optional[str]) -> frozenset:
+    try:
+        return competition_index.parse(value)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.get("/api/competitions", tags=["Competitions"])
+async def list_competitions():
+    """Competitions that can be passed to the news endpoints' `competitions` filter."""
+    return {
+        "data": [
+            {"slug": slug, "name": info["name"], "group": info["group"]}
+            for slug, info in competition_index.competitions.items()
+        ]
+    }
+
+
+# ──────────────────────────────────────────────
+# RESPONSES — upstream bytes passed through untouched unless we transform them;
+# compressed and ETag-validated (304 Not Modified) either way
+# ──────────────────────────────────────────────
+
+def image_base(request: Request, images: str) -> Optional[str]:
+    """Base URL browsers use to reach /api/images, or None to keep the CDN image paths."""
+    if images != "proxy":
+        return None
+    return (settings.public_base_url or str(request.base_url)).rstrip("/")
+
+
+# The store syncs the global feeds only, and only so many pages deep — a keyset walk of a season or
+# the upcoming list through it would end early without saying so. Those routes page by number.
+LOCAL_ONLY_CURSOR = (
+    "cursor pagination here reads the local store, which only partly covers this feed — "
+    "page with `page`, or pass source=local to walk what the store holds"
+)
+
+
+def parse_cursor(cursor: Optional[str], order: str) -> Optional[tuple]:
+    if not cursor:
+        return None
+    try:
+        return decode_keyset_cursor(cursor, order)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+async def continue_walk(feed: str, include: str, order: str, per_page: int, cursor: str) -> dict:
+    """The page after a cursor: from the store while the sync holds every article of that range,
+    otherwise upstream, by the page number the cursor's offset falls on — a walk never ends early
+    because the store's history does."""
+    try:
+        state = decode_keyset_state(cursor, order)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    after, offset = state["after"], state["offset"]
+    if settings.store_enabled:
+        with phase("store"):
+            found = await asyncio.to_thread(article_store.covered_page, (feed,), include, order, per_page, after)
+        if found is not None:
+            payload, _ = found
+            data, pagination = payload["data"], payload["pagination"]
+            pagination["next_cursor"] = encode_keyset_cursor(
+                order, sort_key(data[-1]), offset + len(data)
+            ) if pagination["has_more"] else None
+            return payload
+    entry = await sportmonks_service.request_news(f"news/{feed}", include, order, per_page, offset // per_page + 1)
+    return resume_after(entry.payload, order, after)
+
+
+def transform(
+    payload: dict, order: str, slugs: frozenset, shape: str, images_at: Optional[str] = None, keyset: bool = False
+) -> dict:
+    """Keyset cursor of an upstream page (`keyset`), then the competition filter,
+    the requested response shape and image path rewriting."""
+    with phase("transform"):
+        if keyset:
+            # Computed before filtering, so the next page resumes after the last article upstream sent
+            payload = with_next_cursor(payload, order)
+        payload = competition_index.filter_payload(payload, slugs)
+        if shape == "normalized":
+            payload = normalize_payload(payload)
+        return image_proxy.rewrite(payload, images_at) if images_at else payload
+
+
+def serialize(payload: dict) -> bytes:
+    with phase("serialize"):
+        return orjson.dumps(payload)
+
+
+def upstream_response(
+    request: Request, entry: CacheEntry, order: str, slugs: frozenset = frozenset(), shape: str = "full",
+    images: str = "origin", keyset: bool = False,
+) -> Response:
+    """Raw upstream body when nothing changes the payload; otherwise the transformed payload via orjson.
+    Either way the bytes are built once per cache entry and reused. A keyset cursor alone doesn't
+    rebuild the body — it goes out in the X-Next-Cursor header."""
+    images_at = image_base(request, images)
+    if slugs or shape != "full" or images_at or not entry.body:
+        encoded = entry.representation(
+            (slugs, shape, images_at, keyset),
+            lambda: serialize(transform(entry.payload, order, slugs, shape, images_at, keyset)),
+        )
+    else:
+        encoded = entry.representation()
+    response = encoded_response(request, encoded, status_code=error_status(entry.payload))
+    if keyset:
+        set_next_cursor(response, next_keyset_cursor(entry.payload, order))
+    return response
+
+
+def keyset_response(request: Request, payload: dict) -> Response:
+    """json_response for a cursor-paginated payload, with its cursor in the header too."""
+    response = json_response(request, payload)
+    set_next_cursor(response, (payload.get("pagination") or {}).get("next_cursor"))
+    return response
+
+
+def set_next_cursor(response: Response, cursor: Optional[str]):
+    if cursor:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
+
+
+def json_response(request: Request, payload: dict) -> Response:
+    """Per-request payloads (local store, merged feed, search) — same negotiation, nothing to reuse."""
+    return encoded_response(request, EncodedBody(serialize(payload)), status_code=error_status(payload))
+
+
+def error_status(payload: dict) -> int:
+    """Upstream failures go out as real HTTP errors (the body still explains them), not as 200s."""
+    if not payload.get("error"):
+        return 200
+    return 429 if payload.get("status_code") == 429 else 502
+
+
+# ──────────────────────────────────────────────
+# IMAGES — logos proxied through a disk cache (`images=proxy` on the news routes)
+# ──────────────────────────────────────────────
+
+@app.get("/api/images/{image_hash}", tags=["Images"])
+async def get_image(
+    image_hash: str = Path(..., pattern="^[0-9a-f]{32}$"),
+    size: Optional[int] = Query(None, description=f"Thumbnail size in px: {', '.join(map(str, THUMBNAIL_SIZES))}"),
+):
+    """A proxied logo, original or thumbnail. The URL never changes meaning, so it is cached forever."""
+    if size is not None and size not in THUMBNAIL_SIZES:
+        raise HTTPException(status_code=400, detail=f"size must be one of {', '.join(map(str, THUMBNAIL_SIZES))}")
+    data = await image_proxy.get(image_hash, size)
+    if data is None:
+        raise HTTPException(status_code=404, detail="Unknown image")
+    return Response(
+        data,
+        media_type=sniff_media_type(data),
+        headers={"Cache-Control": "public, max-age=31536000, immutable"},
+    )
+
+
+# ──────────────────────────────────────────────
+# LOCAL STORE — `source=local` answers without an upstream call
+# ──────────────────────────────────────────────
+
+async def query_store(feeds: tuple, include, order, per_page, page, **filters) -> dict:
+    if not settings.store_enabled:
+        raise HTTPException(status_code=503, detail="Local article store is disabled (STORE_ENABLED=false)")
+    with phase("store"):
+        return await asyncio.to_thread(
+            article_store.query_articles, feeds, include, order, per_page, page, **filters
+        )
+
+
+@app.get("/api/news/search", tags=["News — Search"])
+async def search_news(
+    request: Request,
+    q: str = Query(..., min_length=1, description='Words, "exact phrases" and prefix* terms'),
+    feed: Optional[str] = Query("all", pattern="^(all|pre-match|post-match)$"),
+    include: Optional[str] = Query("fixture.participants;league"),
+    per_page: Optional[int] = Query(25, ge=1, le=100),
+    page: Optional[int] = Query(1, ge=1),
+):
+    """Full-text search over article titles and paragraphs in the local store, BM25-ranked."""
+    if not settings.store_enabled:
+        raise HTTPException(status_code=503, detail="Local article store is disabled (STORE_ENABLED=false)")
+    feeds = FEEDS if feed == "all" else (feed,)
+    try:
+        payload = await asyncio.to_thread(article_store.search, q, feeds, include, per_page, page)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return json_response(request, payload)
+
+
+@app.get("/api/store/status", tags=["Health"])
+async def store_status():
+    """Row counts and per-feed sync high-water marks of the local article store."""
+    if not settings.store_enabled:
+        return {"enabled": False}
+    return {"enabled": True, **await asyncio.to_thread(article_store.stats)}
+
+
+def parse_since(value: Optional[str]) -> tuple:
+    """(version, None) for a version token, (None, "YYYY-MM-DD HH:MM:SS" UTC) for a timestamp."""
+    if not value:
+        return None, None
+    if value.isdigit():
+        return int(value), None
+    moment = parse_time(value)
+    if moment is None:
+        raise HTTPException(status_code=400, detail="since must be a version from a previous call or a timestamp")
+    return None, datetime.fromtimestamp(moment, timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+@app.get("/api/news/changes", tags=["News — Changes"])
+async def get_news_changes(
+    request: Request,
+    since: Optional[str] = Query(None, description="`version` of the previous call, or a timestamp; omit to get the current version"),
+    feeds: Optional[str] = Query("pre-match,post-match", description="pre-match, post-match or both"),
+    include: Optional[str] = Query("fixture.participants;league;lines"),
+    limit: int = Query(100, ge=1, le=500),
+    competitions: Optional[str] = Query(None, description="e.g. premier-league,fa-cup"),
+    shape: Optional[str] = Query("full", pattern="^(full|normalized)$", description="`normalized` sends each fixture, league and team once"),
+    images: Optional[str] = Query("origin", pattern="^(origin|proxy)$", description="`proxy` points image paths at /api/images"),
+):
+    """Articles the local store inserted or changed since a version, so clients patch what they hold
+    instead of downloading whole pages again. Pass the returned `version` as `since` next time.
+    Each feed's first page is read through the response cache first: a page fetched upstream on the
+    way is recorded in the store, so the delta is never older than a full page load would be."""
+    if not settings.store_enabled:
+        raise HTTPException(status_code=503, detail="Local article store is disabled (STORE_ENABLED=false)")
+    since_version, since_time = parse_since(since)
+    selected = tuple(dict.fromkeys(part.strip() for part in (feeds or "").split(",") if part.strip()))
+    if not selected or any(feed not in FEEDS for feed in selected):
+        raise HTTPException(status_code=400, detail=f"feeds must be a subset of: {', '.join(FEEDS)}")
+    slugs = parse_competitions(competitions)
+    if since_version is not None or since_time is not None:
+        await asyncio.gather(*(
+            sportmonks_service.request_news(f"news/{feed}", STORE_INCLUDE, "desc", 50, 1) for feed in selected
+        ))
+    with phase("store"):
+        payload = await asyncio.to_thread(
+            article_store.changes, selected, since_version, since_time, include, limit
+        )
+    with phase("transform"):
+        payload = competition_index.filter_payload(payload, slugs)
+        if shape == "normalized":
+            payload = normalize_payload(payload)
+        images_at = image_base(request, images)
+        if images_at:
+            payload = image_proxy.rewrite(payload, images_at)
+    return json_response(request, payload)
+
+
 # ──────────────────────────────────────────────
 # NEWS ENDPOINTS — PRE-MATCH (Real API data)
 # ──────────────────────────────────────────────
 
 @app.get("/api/news/pre-match", tags=["News — Pre-Match"])
 async def get_pre_match_news(
+    request: Request,
     include: Optional[str] = Query("fixture.participants;league;lines"),
     order: Optional[str] = Query("desc"),
     per_page: Optional[int] = Query(50),
     page: Optional[int] = Query(1),
+    competitions: Optional[str] = Query(None, description="e.g. premier-league,fa-cup"),
+    source: Optional[str] = Query("live", pattern="^(live|local)$"),
+    cursor: Optional[str] = Query(None, description="`X-Next-Cursor` header of the previous page (read from the local store where it holds the range)"),
+    shape: Optional[str] = Query("full", pattern="^(full|normalized)$", description="`normalized` sends each fixture, league and team once"),
+    images: Optional[str] = Query("origin", pattern="^(origin|proxy)$", description="`proxy` points image paths at /api/images"),
 ):
     """All available pre-match news articles (LIVE from SportMonks)."""
-    return await sportmonks_service.get_pre_match_news(include, order, per_page, page)
+    slugs = parse_competitions(competitions)
+    if source == "local":
+        after = parse_cursor(cursor, order)
+        payload = await query_store(("pre-match",), include, order, per_page, page, after=after)
+        return keyset_response(request, transform(payload, order, slugs, shape, image_base(request, images)))
+    if cursor:
+        payload = await continue_walk("pre-match", include, order, per_page, cursor)
+        return keyset_response(request, transform(payload, order, slugs, shape, image_base(request, images)))
+    entry = await sportmonks_service.request_news("news/pre-match", include, order, per_page, page)
+    return upstream_response(request, entry, order, slugs, shape, images, keyset=True)
 
 
 @app.get("/api/news/pre-match/seasons/{season_id}", tags=["News — Pre-Match"])
 async def get_pre_match_news_by_season(
     season_id: int,
+    request: Request,
     include: Optional[str] = Query("fixture.participants;league;lines"),
     order: Optional[str] = Query("desc"),
     per_page: Optional[int] = Query(50),
     page: Optional[int] = Query(1),
+    competitions: Optional[str] = Query(None, description="e.g. premier-league,fa-cup"),
+    source: Optional[str] = Query("live", pattern="^(live|local)$"),
+    cursor: Optional[str] = Query(None, description="`pagination.next_cursor` of the previous `source=local` page"),
+    shape: Optional[str] = Query("full", pattern="^(full|normalized)$", description="`normalized` sends each fixture, league and team once"),
+    images: Optional[str] = Query("origin", pattern="^(origin|proxy)$", description="`proxy` points image paths at /api/images"),
 ):
     """Pre-match news filtered by season ID (LIVE)."""
-    return await sportmonks_service.get_pre_match_news_by_season(season_id, include, order, per_page, page)
+    slugs = parse_competitions(competitions)
+    if cursor and source != "local":
+        raise HTTPException(status_code=400, detail=LOCAL_ONLY_CURSOR)
+    if source == "local":
+        after = parse_cursor(cursor, order)
+        payload = await query_store(("pre-match",), include, order, per_page, page, season_id=season_id, after=after)
+        return json_response(request, transform(payload, order, slugs, shape, image_base(request, images)))
+    entry = await sportmonks_service.request_news(f"news/pre-match/seasons/{season_id}", include, order, per_page, page)
+    return upstream_response(request, entry, order, slugs, shape, images)
 
 
 @app.get("/api/news/pre-match/upcoming", tags=["News — Pre-Match"])
 async def get_pre_match_news_upcoming(
+    request: Request,
     include: Optional[str] = Query("fixture.participants;league;lines"),
     order: Optional[str] = Query("desc"),
     per_page: Optional[int] = Query(50),
     page: Optional[int] = Query(1),
+    competitions: Optional[str] = Query(None, description="e.g. premier-league,fa-cup"),
+    source: Optional[str] = Query("live", pattern="^(live|local)$"),
+    cursor: Optional[str] = Query(None, description="`pagination.next_cursor` of the previous `source=local` page"),
+    shape: Optional[str] = Query("full", pattern="^(full|normalized)$", description="`normalized` sends each fixture, league and team once"),
+    images: Optional[str] = Query("origin", pattern="^(origin|proxy)$", description="`proxy` points image paths at /api/images"),
 ):
     """Pre-match news for upcoming fixtures (LIVE)."""
-    return await sportmonks_service.get_pre_match_news_upcoming(include, order, per_page, page)
+    slugs = parse_competitions(competitions)
+    if cursor and source != "local":
+        raise HTTPException(status_code=400, detail=LOCAL_ONLY_CURSOR)
+    if source == "local":
+        after = parse_cursor(cursor, order)
+        payload = await query_store(("pre-match",), include, order, per_page, page, upcoming=True, after=after)
+        return json_response(request, transform(payload, order, slugs, shape, image_base(request, images)))
+    entry = await sportmonks_service.request_news("news/pre-match/upcoming", include, order, per_page, page)
+    return upstream_response(request, entry, order, slugs, shape, images)
 
 
 # ──────────────────────────────────────────────
@@ -86,22 +519,279 @@ async def get_pre_match_news_upcoming(
 
 @app.get("/api/news/post-match", tags=["News — Post-Match"])
 async def get_post_match_news(
+    request: Request,
     include: Optional[str] = Query("fixture.participants;league;lines"),
     order: Optional[str] = Query("desc"),
     per_page: Optional[int] = Query(50),
     page: Optional[int] = Query(1),
+    competitions: Optional[str] = Query(None, description="e.g. premier-league,fa-cup"),
+    source: Optional[str] = Query("live", pattern="^(live|local)$"),
+    cursor: Optional[str] = Query(None, description="`X-Next-Cursor` header of the previous page (read from the local store where it holds the range)"),
+    shape: Optional[str] = Query("full", pattern="^(full|normalized)$", description="`normalized` sends each fixture, league and team once"),
+    images: Optional[str] = Query("origin", pattern="^(origin|proxy)$", description="`proxy` points image paths at /api/images"),
 ):
     """All available post-match news articles (LIVE from SportMonks)."""
-    return await sportmonks_service.get_post_match_news(include, order, per_page, page)
+    slugs = parse_competitions(competitions)
+    if source == "local":
+        after = parse_cursor(cursor, order)
+        payload = await query_store(("post-match",), include, order, per_page, page, after=after)
+        return keyset_response(request, transform(payload, order, slugs, shape, image_base(request, images)))
+    if cursor:
+        payload = await continue_walk("post-match", include, order, per_page, cursor)
+        return keyset_response(request, transform(payload, order, slugs, shape, image_base(request, images)))
+    entry = await sportmonks_service.request_news("news/post-match", include, order, per_page, page)
+    return upstream_response(request, entry, order, slugs, shape, images, keyset=True)
 
 
 @app.get("/api/news/post-match/seasons/{season_id}", tags=["News — Post-Match"])
 async def get_post_match_news_by_season(
     season_id: int,
+    request: Request,
     include: Optional[str] = Query("fixture.participants;league;lines"),
     order: Optional[str] = Query("desc"),
     per_page: Optional[int] = Query(50),
     page: Optional[int] = Query(1),
+    competitions: Optional[str] = Query(None, description="e.g. premier-league,fa-cup"),
+    source: Optional[str] = Query("live", pattern="^(live|local)$"),
+    cursor: Optional[str] = Query(None, description="`pagination.next_cursor` of the previous `source=local` page"),
+    shape: Optional[str] = Query("full", pattern="^(full|normalized)$", description="`normalized` sends each fixture, league and team once"),
+    images: Optional[str] = Query("origin", pattern="^(origin|proxy)$", description="`proxy` points image paths at /api/images"),
 ):
     """Post-match news filtered by season ID (LIVE)."""
-    return await sportmonks_service.get_post_match_news_by_season(season_id, include, order, per_page, page)
+    slugs = parse_competitions(competitions)
+    if cursor and source != "local":
+        raise HTTPException(status_code=400, detail=LOCAL_ONLY_CURSOR)
+    if source == "local":
+        after = parse_cursor(cursor, order)
+        payload = await query_store(("post-match",), include, order, per_page, page, season_id=season_id, after=after)
+        return json_response(request, transform(payload, order, slugs, shape, image_base(request, images)))
+    entry = await sportmonks_service.request_news(f"news/post-match/seasons/{season_id}", include, order, per_page, page)
+    return upstream_response(request, entry, order, slugs, shape, images)
+
+
+# ──────────────────────────────────────────────
+# NEWS ENDPOINTS — COMBINED (pre-match + post-match)
+# ──────────────────────────────────────────────
+
+# merged_latest side -> the store feed it reads
+LATEST_SIDES = {"pre": "pre-match", "post": "post-match"}
+
+
+@app.get("/api/news/latest", tags=["News — Combined"])
+async def get_latest_news(
+    request: Request,
+    include: Optional[str] = Query("fixture.participants;league;lines"),
+    order: Optional[str] = Query("desc"),
+    per_page: Optional[int] = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="`X-Next-Cursor` header (or `pagination.next_cursor`) of the previous page"),
+    competitions: Optional[str] = Query(None, description="e.g. premier-league,fa-cup"),
+    shape: Optional[str] = Query("full", pattern="^(full|normalized)$", description="`normalized` sends each fixture, league and team once"),
+    images: Optional[str] = Query("origin", pattern="^(origin|proxy)$", description="`proxy` points image paths at /api/images"),
+):
+    """Pre-match and post-match news merged by created_at, fetched concurrently, cursor-paginated."""
+    sources = {
+        "pre": sportmonks_service.get_pre_match_news,
+        "post": sportmonks_service.get_post_match_news,
+    }
+    slugs = parse_competitions(competitions)
+    images_at = image_base(request, images)
+    try:
+        state = decode_merged_cursor(cursor, order) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if state and state["after"] and settings.store_enabled:
+        # Keyset continuation over both feeds where the store holds the whole range — new articles
+        # at the head can't shift it; the side positions still move on, for when the store runs out
+        with phase("store"):
+            found = await asyncio.to_thread(
+                article_store.covered_page, FEEDS, include, order, per_page, state["after"]
+            )
+        if found is not None:
+            payload, counts = found
+            data, pagination = payload["data"], payload["pagination"]
+            positions = advance_positions(state["pos"], {side: counts[feed] for side, feed in LATEST_SIDES.items()})
+            pagination["next_cursor"] = (
+                encode_merged_cursor(order, positions, sort_key(data[-1])) if pagination["has_more"] else None
+            )
+            return keyset_response(request, transform(payload, order, slugs, shape, images_at))
+    try:
+        payload = await merged_latest(sources, include, order, per_page, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return keyset_response(request, transform(payload, order, slugs, shape, images_at))
+
+
+# ──────────────────────────────────────────────
+# NEWS ENDPOINTS — BATCH (many seasons in one call)
+# ──────────────────────────────────────────────
+
+def parse_season_ids(value: str) -> list:
+    try:
+        ids = list(dict.fromkeys(int(part) for part in value.split(",") if part.strip()))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="season_ids must be comma-separated integers")
+    if not ids:
+        raise HTTPException(status_code=400, detail="season_ids is empty")
+    if len(ids) > settings.batch_max_seasons:
+        raise HTTPException(status_code=400, detail=f"At most {settings.batch_max_seasons} seasons per request")
+    return ids
+
+
+def parse_kinds(value: str) -> list:
+    kinds = list(dict.fromkeys(part.strip() for part in value.split(",") if part.strip()))
+    unknown = [kind for kind in kinds if kind not in FEEDS]
+    if unknown or not kinds:
+        raise HTTPException(status_code=400, detail=f"kinds must be a subset of: {', '.join(FEEDS)}")
+    return kinds
+
+
+@app.get("/api/news/seasons", tags=["News — Batch"])
+async def get_news_for_seasons(
+    request: Request,
+    season_ids: str = Query(..., description="e.g. 23614,23672,23670"),
+    kinds: Optional[str] = Query("pre-match,post-match", description="pre-match, post-match or both"),
+    include: Optional[str] = Query("fixture.participants;league;lines"),
+    order: Optional[str] = Query("desc"),
+    per_page: Optional[int] = Query(50),
+    page: Optional[int] = Query(1),
+    competitions: Optional[str] = Query(None, description="e.g. premier-league,fa-cup"),
+    shape: Optional[str] = Query("full", pattern="^(full|normalized)$", description="`normalized` sends each fixture, league and team once"),
+    images: Optional[str] = Query("origin", pattern="^(origin|proxy)$", description="`proxy` points image paths at /api/images"),
+    concurrency: Optional[int] = Query(None, ge=1, le=16, description="Upstream calls in flight (default BATCH_CONCURRENCY)"),
+):
+    """One page of news per season and kind in a single round trip. Upstream calls overlap under a
+    concurrency cap, cached pages are reused, and failed seasons are reported next to the rest."""
+    ids = parse_season_ids(season_ids)
+    feeds = parse_kinds(kinds)
+    slugs = parse_competitions(competitions)
+    images_at = image_base(request, images)
+    limit = concurrency or settings.batch_concurrency
+    semaphore = asyncio.Semaphore(limit)
+    started = time.perf_counter()
+
+    async def fetch(season_id: int, kind: str) -> dict:
+        async with semaphore:
+            requested_at = time.monotonic()
+            entry = await sportmonks_service.request_news(
+                f"news/{kind}/seasons/{season_id}", include, order, per_page, page
+            )
+        result = {"season_id": season_id, "kind": kind, "cached": entry.stored_at < requested_at}
+        if entry.payload.get("error"):
+            return {**result, "ok": False, "status_code": error_status(entry.payload),
+                    "message": entry.payload.get("message")}
+        return {**result, "ok": True, **transform(entry.payload, order, slugs, shape, images_at)}
+
+    results = await asyncio.gather(*(fetch(season_id, kind) for season_id in ids for kind in feeds))
+    failed = [r for r in results if not r["ok"]]
+    payload = {
+        "results": results,
+        "summary": {
+            "requested": len(results),
+            "succeeded": len(results) - len(failed),
+            "failed": len(failed),
+            "cached": sum(1 for r in results if r["cached"]),
+            "concurrency": limit,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        },
+    }
+    if failed and len(failed) == len(results):
+        # Nothing succeeded — surface it as the upstream error it is; partial failures stay 200
+        payload["error"] = True
+        payload["status_code"] = 429 if all(r["status_code"] == 429 for r in failed) else 502
+    return json_response(request, payload)
+
+
+# ──────────────────────────────────────────────
+# SEASON CRAWL — every page, streamed as NDJSON
+# ──────────────────────────────────────────────
+# Pages are fetched past the response cache (fetch_uncached): a crawl reads each page once, and up
+# to CRAWL_MAX_PAGES of them would otherwise evict the pages interactive readers keep hitting.
+
+def ndjson_stream(fetch_page, concurrency: Optional[int]):
+    async def lines():
+        async for event in crawl_pages(fetch_page, concurrency):
+            yield orjson.dumps(event) + b"\n"
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@app.get("/api/news/pre-match/seasons/{season_id}/crawl", tags=["News — Pre-Match"])
+async def crawl_pre_match_news_by_season(
+    season_id: int,
+    include: Optional[str] = Query("fixture.participants;league;lines"),
+    order: Optional[str] = Query("desc"),
+    per_page: Optional[int] = Query(50),
+    concurrency: Optional[int] = Query(None, ge=1, le=16),
+):
+    """Every pre-match article of a season, streamed as NDJSON events with trailing metadata."""
+    async def fetch_page(page: int) -> dict:
+        return await sportmonks_service.fetch_uncached(
+            f"news/pre-match/seasons/{season_id}", include, order, per_page, page
+        )
+    return ndjson_stream(fetch_page, concurrency)
+
+
+@app.get("/api/news/post-match/seasons/{season_id}/crawl", tags=["News — Post-Match"])
+async def crawl_post_match_news_by_season(
+    season_id: int,
+    include: Optional[str] = Query("fixture.participants;league;lines"),
+    order: Optional[str] = Query("desc"),
+    per_page: Optional[int] = Query(50),
+    concurrency: Optional[int] = Query(None, ge=1, le=16),
+):
+    """Every post-match article of a season, streamed as NDJSON events with trailing metadata."""
+    async def fetch_page(page: int) -> dict:
+        return await sportmonks_service.fetch_uncached(
+            f"news/post-match/seasons/{season_id}", include, order, per_page, page
+        )
+    return ndjson_stream(fetch_page, concurrency)
+
+
+# ──────────────────────────────────────────────
+# LIVE PUSH — new/changed articles via SSE or WebSocket
+# ──────────────────────────────────────────────
+
+@app.get("/api/news/stream", tags=["News — Live"])
+async def stream_news(
+    request: Request,
+    competitions: Optional[str] = Query(None, description="e.g. premier-league,fa-cup"),
+):
+    """Server-Sent Events: one event per newly created or changed article."""
+    subscriber = news_broadcaster.subscribe(parse_competitions(competitions))
+
+    async def events():
+        try:
+            yield f"retry: {int(settings.live_poll_interval * 1000)}\n\n"
+            while not await request.is_disconnected():
+                event = await subscriber.next_event(timeout=settings.live_heartbeat_interval)
+                if event is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: {event['type']}\ndata: {orjson.dumps(event).decode()}\n\n"
+        finally:
+            news_broadcaster.unsubscribe(subscriber)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.websocket("/api/news/ws")
+async def news_websocket(websocket: WebSocket, competitions: Optional[str] = None):
+    """WebSocket variant of /api/news/stream — each message is one JSON event."""
+    try:
+        slugs = competition_index.parse(competitions)
+    except ValueError as e:
+        await websocket.close(code=1008, reason=str(e))
+        return
+    await websocket.accept()
+    subscriber = news_broadcaster.subscribe(slugs)
+    try:
+        while True:
+            event = await subscriber.next_event(timeout=settings.live_heartbeat_interval)
+            await websocket.send_json(event or {"type": "keep-alive"})
+    except WebSocketDisconnect:
+        pass
+    finally:
+        news_broadcaster.unsubscribe(subscriber)
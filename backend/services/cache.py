@@ -0,0 +1,211 @@
+"""
+Response Cache Module.
+In-process TTL + LRU cache for SportMonks responses, bounded by a byte budget.
+Entries past their TTL stay servable for a stale-while-revalidate window.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Hashable, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+from backend.config import settings
+from backend.services.encoding import EncodedBody
+
+# Only these query params shape the response — everything else (api_token!) is dropped
+CACHE_KEY_PARAMS = ("include", "order", "per_page", "page")
+
+# Encoded bodies kept per entry: the raw body plus a few transformed (e.g. filtered) renderings
+MAX_REPRESENTATIONS = 8
+
+
+@dataclass
+class CacheEntry:
+    """An upstream response — parsed payload and the raw body bytes — plus freshness bookkeeping.
+    Its size counts the raw body, every rendered representation and their compressed variants."""
+
+    key: str
+    payload: dict
+    body: bytes
+    stored_at: float
+    expires_at: float
+    stale_until: float
+    ttl: float = 0.0
+    ttl_policy: str = "default"
+    ttl_reason: str = ""
+    representations: dict = field(default_factory=dict, repr=False, compare=False)
+    extra_bytes: int = field(default=0, repr=False, compare=False)
+    # Set by the ResponseCache holding the entry, so growth after put() counts against its budget
+    on_resize: Optional[Callable[["CacheEntry", int], None]] = field(default=None, repr=False, compare=False)
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + self.extra_bytes
+
+    def _grow(self, delta: int):
+        self.extra_bytes += delta
+        if self.on_resize is not None:
+            self.on_resize(self, delta)
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.expires_at
+
+    def is_servable(self, now: float) -> bool:
+        return now < self.stale_until
+
+    def representation(self, variant: Hashable = None, render: Optional[Callable[[], bytes]] = None) -> EncodedBody:
+        """The raw body (variant None) or a rendering of the payload, hashed and compressed once per entry."""
+        encoded = self.representations.get(variant)
+        if encoded is None:
+            if len(self.representations) >= MAX_REPRESENTATIONS:
+                dropped = self.representations.pop(next(iter(self.representations)))
+                dropped.on_grow = None
+                self._grow(-self._representation_bytes(dropped))
+            encoded = EncodedBody(render() if render is not None else self.body, self._grow)
+            self.representations[variant] = encoded
+            self._grow(self._representation_bytes(encoded))
+        return encoded
+
+    def _representation_bytes(self, encoded: EncodedBody) -> int:
+        # The raw-body representation shares `body`, which size() already counts
+        return (0 if encoded.body is self.body else len(encoded.body)) + encoded.variant_bytes
+
+
+def new_entry(
+    key: str, payload: dict, body: bytes, ttl: float, stale_while_revalidate: float = 0.0,
+    ttl_policy: str = "default", ttl_reason: str = "", assigned_ttl: Optional[float] = None,
+) -> CacheEntry:
+    """`ttl` is the freshness left for this copy; `assigned_ttl` what the TTL policy gave the response."""
+    now = time.monotonic()
+    return CacheEntry(
+        key=key,
+        payload=payload,
+        body=body,
+        stored_at=now,
+        expires_at=now + ttl,
+        stale_until=now + ttl + stale_while_revalidate,
+        ttl=ttl if assigned_ttl is None else assigned_ttl,
+        ttl_policy=ttl_policy,
+        ttl_reason=ttl_reason,
+    )
+
+
+def canonical_include(include: str) -> str:
+    """Includes are an unordered set — `league;lines` and `lines;league` are the same request."""
+    parts = [p.strip() for p in str(include).split(";") if p.strip()]
+    return ";".join(sorted(set(parts)))
+
+
+def make_cache_key(url: str, params: dict) -> str:
+    """Canonical key: normalised URL plus the response-shaping params, never the token."""
+    parts = urlsplit(url)
+    path = parts.path.rstrip("/") or "/"
+    base = urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, "", ""))
+    query = []
+    for name in CACHE_KEY_PARAMS:
+        value = params.get(name)
+        if value in (None, ""):
+            continue
+        if name == "include":
+            value = canonical_include(value)
+        query.append(f"{name}={value}")
+    return f"{base}?{'&'.join(query)}"
+
+
+def ttl_for_url(url: str) -> float:
+    """Per-endpoint TTL in seconds — the default that ttl_policy adapts for news pages."""
+    path = urlsplit(url).path
+    if path.endswith("/upcoming"):
+        return settings.cache_ttl_upcoming
+    if "/seasons/" in path:
+        return settings.cache_ttl_season
+    if "/post-match" in path:
+        return settings.cache_ttl_post_match
+    return settings.cache_ttl_pre_match
+
+
+class ResponseCache:
+    """LRU of CacheEntry objects whose summed size (bodies, representations, compressed variants)
+    stays under `max_bytes`."""
+
+    def __init__(self, max_bytes: int, stale_while_revalidate: float):
+        self.max_bytes = max_bytes
+        self.stale_while_revalidate = stale_while_revalidate
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return a servable entry (fresh or stale) and mark it most recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if not entry.is_servable(time.monotonic()):
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def peek(self, key: str) -> Optional[CacheEntry]:
+        """The entry for `key`, if any, without touching LRU order or freshness bookkeeping."""
+        return self._entries.get(key)
+
+    def entries(self) -> list:
+        """Every entry, least recently used first, without touching LRU order."""
+        return list(self._entries.values())
+
+    def put(self, entry: CacheEntry) -> bool:
+        """Store an entry; entries bigger than the whole budget are not cached."""
+        if entry.size > self.max_bytes:
+            return False
+        key = entry.key
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = entry
+        entry.on_resize = self._resized
+        self.total_bytes += entry.size
+        self._evict()
+        return True
+
+    def _resized(self, entry: CacheEntry, delta: int):
+        """A held entry built or dropped a representation or compressed variant."""
+        if self._entries.get(entry.key) is not entry:
+            return
+        self.total_bytes += delta
+        self._evict()
+
+    def _evict(self):
+        while self.total_bytes > self.max_bytes and self._entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            entry.on_resize = None
+            self.total_bytes -= entry.size
+
+    def clear(self):
+        for entry in self._entries.values():
+            entry.on_resize = None
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,125 @@
+"""
+Competition Filter Module.
+Server-side league/competition filtering for news payloads.
+League names are matched once through an Aho-Corasick keyword automaton compiled at startup;
+the result is remembered per league id, so every later article is a single dict lookup.
+"""
+
+from collections import deque
+from typing import Iterable, Optional
+
+# Same competitions and keywords the Streamlit sidebar offers, addressed by slug
+COMPETITIONS = {
+    "premier-league": {"name": "Premier League", "group": "English Leagues", "keywords": ["premier league"]},
+    "championship": {"name": "Championship", "group": "English Leagues", "keywords": ["championship"]},
+    "league-one": {"name": "League One", "group": "English Leagues", "keywords": ["league one"]},
+    "league-two": {"name": "League Two", "group": "English Leagues", "keywords": ["league two"]},
+    "fa-cup": {"name": "FA Cup", "group": "Domestic Cups", "keywords": ["fa cup"]},
+    "carabao-cup": {"name": "Carabao Cup", "group": "Domestic Cups", "keywords": ["carabao", "efl cup", "league cup"]},
+    "champions-league": {"name": "Champions League", "group": "European Competitions", "keywords": ["champions league", "ucl"]},
+    "europa-league": {"name": "Europa League", "group": "European Competitions", "keywords": ["europa league"]},
+    "conference-league": {"name": "Conference League", "group": "European Competitions", "keywords": ["conference league"]},
+}
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton: finds every keyword in a text in one left-to-right pass."""
+
+    def __init__(self, keywords: dict):
+        # keywords: lowercase keyword -> label reported when it matches
+        self._goto: list = [{}]
+        self._fail: list = [0]
+        self._out: list = [set()]
+        for keyword, label in keywords.items():
+            state = 0
+            for char in keyword:
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(set())
+                state = nxt
+            self._out[state].add(label)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(char, 0)
+                self._out[nxt] |= self._out[self._fail[nxt]]
+
+    def search(self, text: str) -> frozenset:
+        found = set()
+        state = 0
+        for char in text.lower():
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            if self._out[state]:
+                found |= self._out[state]
+        return frozenset(found)
+
+
+class CompetitionIndex:
+    """Maps articles to competition slugs — by league id once learned, by league name otherwise."""
+
+    def __init__(self, competitions: dict):
+        self.competitions = competitions
+        self.automaton = KeywordAutomaton({
+            keyword: slug
+            for slug, info in competitions.items()
+            for keyword in info["keywords"]
+        })
+        self.by_league_id: dict = {}
+
+    def parse(self, value: Optional[str]) -> frozenset:
+        """`premier-league,fa-cup` -> frozenset of slugs. Raises ValueError on unknown slugs."""
+        if not value:
+            return frozenset()
+        slugs = frozenset(s.strip().lower() for s in value.split(",") if s.strip())
+        unknown = slugs - self.competitions.keys()
+        if unknown:
+            raise ValueError(f"Unknown competitions: {', '.join(sorted(unknown))}")
+        return slugs
+
+    def learn(self, league_id: Optional[int], league_name: str) -> frozenset:
+        slugs = self.automaton.search(league_name)
+        if league_id is not None:
+            self.by_league_id[league_id] = slugs
+        return slugs
+
+    def competitions_for(self, article: dict) -> frozenset:
+        league = article.get("league")
+        league = league if isinstance(league, dict) else {}
+        league_id = article.get("league_id", league.get("id"))
+        known = self.by_league_id.get(league_id)
+        if known is not None:
+            return known
+        name = league.get("name")
+        if not name:
+            return frozenset()
+        return self.learn(league_id, name)
+
+    def filter_articles(self, articles: Iterable, slugs: frozenset) -> list:
+        return [a for a in articles if isinstance(a, dict) and self.competitions_for(a) & slugs]
+
+    def filter_payload(self, payload: dict, slugs: frozenset) -> dict:
+        """Copy of `payload` holding only matching articles — the (cached) original is left untouched."""
+        if not slugs or payload.get("error") or not isinstance(payload.get("data"), list):
+            return payload
+        articles = payload["data"]
+        matched = self.filter_articles(articles, slugs)
+        return {
+            **payload,
+            "data": matched,
+            "filter": {"competitions": sorted(slugs), "matched": len(matched), "total": len(articles)},
+        }
+
+
+competition_index = CompetitionIndex(COMPETITIONS)
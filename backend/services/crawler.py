@@ -0,0 +1,101 @@
+"""
+Pagination Crawler Module.
+Walks every page of a paginated SportMonks feed with bounded concurrency
+and yields events as each page lands — nothing beyond the in-flight window is buffered.
+"""
+
+import asyncio
+import time
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+from backend.config import settings
+
+FetchPage = Callable[[int], Awaitable[dict]]
+
+
+async def crawl_pages(
+    fetch_page: FetchPage,
+    concurrency: Optional[int] = None,
+    max_pages: Optional[int] = None,
+) -> AsyncIterator[dict]:
+    """
+    Yield `article` and `progress` events for every page, then one trailing `meta` event.
+
+    SportMonks pagination only reports `has_more`, not a page total, so pages past
+    the first are fetched speculatively in a sliding window of `concurrency` and the
+    end of the feed is pinned by the first page reporting `has_more: false` (or no data).
+    """
+    concurrency = max(1, concurrency or settings.crawl_concurrency)
+    max_pages = max_pages or settings.crawl_max_pages
+    started = time.perf_counter()
+    running: dict = {}
+    last_page: Optional[int] = None
+    pages_done = 0
+    articles = 0
+    errors = []
+
+    def consume(page: int, payload: dict):
+        """Update the end-of-feed marker from one page; returns its articles if still in range."""
+        nonlocal last_page
+        if payload.get("error"):
+            errors.append({"page": page, "status_code": payload.get("status_code"), "message": payload.get("message")})
+            last_page = page - 1 if last_page is None else min(last_page, page - 1)
+            return []
+        data = payload.get("data") or []
+        has_more = (payload.get("pagination") or {}).get("has_more", False)
+        if not data:
+            last_page = page - 1 if last_page is None else min(last_page, page - 1)
+        elif not has_more:
+            last_page = page if last_page is None else min(last_page, page)
+        if last_page is not None and page > last_page:
+            return []
+        return data
+
+    try:
+        first = await fetch_page(1)
+        for article in consume(1, first):
+            articles += 1
+            yield {"type": "article", "page": 1, "article": article}
+        pages_done = 1
+        yield {"type": "progress", "page": 1, "pages_done": pages_done, "articles": articles}
+
+        next_page = 2
+        while True:
+            while (
+                len(running) < concurrency
+                and next_page <= max_pages
+                and (last_page is None or next_page <= last_page)
+            ):
+                running[asyncio.create_task(fetch_page(next_page))] = next_page
+                next_page += 1
+            if not running:
+                break
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                page = running.pop(task)
+                for article in consume(page, task.result()):
+                    articles += 1
+                    yield {"type": "article", "page": page, "article": article}
+                pages_done += 1
+                yield {"type": "progress", "page": page, "pages_done": pages_done, "articles": articles}
+
+            # Pages speculatively launched past the end of the feed are no longer needed
+            if last_page is not None:
+                for task, page in list(running.items()):
+                    if page > last_page:
+                        task.cancel()
+                        running.pop(task)
+    finally:
+        for task in running:
+            task.cancel()
+
+    yield {
+        "type": "meta",
+        "page_count": last_page if last_page is not None else pages_done,
+        "pages_fetched": pages_done,
+        "articles": articles,
+        "truncated": last_page is None and next_page > max_pages,
+        "errors": errors,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
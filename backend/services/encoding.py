@@ -0,0 +1,117 @@
+"""
+Response Encoding Module.
+Content negotiation (zstd / br / gzip) and strong ETags for JSON responses.
+A body is hashed once and each compressed variant is built at most once, then reused
+for as long as the body lives — cached upstream entries never pay for compression twice.
+"""
+
+import gzip
+import hashlib
+from typing import Callable, Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from backend.config import settings
+from backend.services.timing import phase
+
+try:
+    import brotli
+except ImportError:  # optional — br is simply not offered
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional — zstd is simply not offered
+    zstandard = None
+
+# Server preference when the client rates several codings equally
+COMPRESSORS = {}
+if zstandard is not None:
+    COMPRESSORS["zstd"] = zstandard.ZstdCompressor(level=3).compress
+if brotli is not None:
+    COMPRESSORS["br"] = lambda body: brotli.compress(body, quality=5)
+COMPRESSORS["gzip"] = lambda body: gzip.compress(body, compresslevel=6)
+
+
+class EncodedBody:
+    """One response body, its strong ETag and the compressed variants built for it so far.
+    `on_grow` is told the size of each variant as it is built (cache entries count them)."""
+
+    __slots__ = ("body", "tag", "_variants", "on_grow")
+
+    def __init__(self, body: bytes, on_grow: Optional[Callable[[int], None]] = None):
+        self.body = body
+        self.tag = hashlib.blake2b(body, digest_size=16).hexdigest()
+        self._variants: dict = {}
+        self.on_grow = on_grow
+
+    @property
+    def variant_bytes(self) -> int:
+        return sum(len(compressed) for compressed in self._variants.values())
+
+    def etag(self, coding: Optional[str] = None) -> str:
+        # Each encoding is its own representation, so it gets its own strong validator
+        return f'"{self.tag}-{coding}"' if coding else f'"{self.tag}"'
+
+    def variant(self, coding: Optional[str]) -> bytes:
+        if coding is None:
+            return self.body
+        compressed = self._variants.get(coding)
+        if compressed is None:
+            with phase("compress"):
+                compressed = self._variants[coding] = COMPRESSORS[coding](self.body)
+            if self.on_grow is not None:
+                self.on_grow(len(compressed))
+        return compressed
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """True when any validator in `If-None-Match` names this body, in whatever encoding."""
+        if not if_none_match:
+            return False
+        for candidate in if_none_match.split(","):
+            candidate = candidate.strip()
+            if candidate == "*":
+                return True
+            if candidate.startswith("W/"):
+                candidate = candidate[2:]
+            if candidate.strip('"').split("-", 1)[0] == self.tag:
+                return True
+        return False
+
+
+def negotiate(accept_encoding: Optional[str], size: int) -> Optional[str]:
+    """Best coding the client accepts (q > 0), or None to send the body uncompressed."""
+    if not settings.compression_enabled or not accept_encoding or size < settings.compression_min_bytes:
+        return None
+    weights = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[name.strip().lower()] = quality
+    wildcard = weights.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for coding in COMPRESSORS:
+        quality = weights.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def encoded_response(
+    request: Request, encoded: EncodedBody, media_type: str = "application/json", status_code: int = 200
+) -> Response:
+    """304 when the client already holds this body, otherwise the best-compressed variant."""
+    coding = negotiate(request.headers.get("accept-encoding"), len(encoded.body))
+    headers = {"ETag": encoded.etag(coding), "Vary": "Accept-Encoding", "Cache-Control": "no-cache"}
+    if status_code == 200 and encoded.matches(request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=headers)
+    if coding:
+        headers["Content-Encoding"] = coding
+    return Response(encoded.variant(coding), status_code=status_code, media_type=media_type, headers=headers)
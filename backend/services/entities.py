@@ -0,0 +1,169 @@
+"""
+Entity Cache Module.
+Long-lived in-process cache of the leagues, teams and fixtures embedded in news responses.
+Once an article's entities are known, news calls ask SportMonks for `lines` only and the
+league / fixture / participants are joined back in locally, in the same shape upstream returns.
+Warm-started from the local article store so a restart does not begin cold.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+from backend.services.store import parse_includes
+
+# Includes this cache can answer locally, and the ones that still have to come from upstream
+JOINABLE_INCLUDES = frozenset({"league", "fixture", "fixture.participants"})
+UPSTREAM_INCLUDES = frozenset({"lines"})
+
+
+class EntityCache:
+    """Leagues, teams and fixtures by id, each with the time it was last seen upstream."""
+
+    def __init__(self, ttl: float, fixture_ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.fixture_ttl = fixture_ttl
+        self.max_entries = max_entries
+        self.leagues: "OrderedDict[int, tuple]" = OrderedDict()  # id -> (seen_at, league)
+        self.teams: "OrderedDict[int, tuple]" = OrderedDict()  # id -> (seen_at, team without meta)
+        # id -> (seen_at, fixture without participants, [(team_id, meta)] or None if never included)
+        self.fixtures: "OrderedDict[int, tuple]" = OrderedDict()
+        self.slim_fetches = 0
+        self.bulk_fetches = 0
+        self.fallbacks = 0
+
+    def __len__(self) -> int:
+        return len(self.leagues) + len(self.teams) + len(self.fixtures)
+
+    def _put(self, table: OrderedDict, key, value: tuple):
+        table[key] = value
+        table.move_to_end(key)
+        while len(table) > self.max_entries:
+            table.popitem(last=False)
+
+    def _fresh(self, table: OrderedDict, key, ttl: float, now: float) -> Optional[tuple]:
+        item = table.get(key)
+        if item is None or now - item[0] > ttl:
+            return None
+        return item
+
+    # ──────────────────────────────────────────────
+    # LEARNING
+    # ──────────────────────────────────────────────
+
+    def learn_league(self, league, now: Optional[float] = None):
+        if isinstance(league, dict) and league.get("id") is not None:
+            self._put(self.leagues, league["id"], (now or time.monotonic(), league))
+
+    def learn_fixture(self, fixture, now: Optional[float] = None):
+        """A fixture as embedded in news (`fixture.participants`) or from /fixtures (`participants;league`)."""
+        if not isinstance(fixture, dict) or fixture.get("id") is None:
+            return
+        now = now or time.monotonic()
+        self.learn_league(fixture.get("league"), now)
+        participants = fixture.get("participants")
+        refs = None
+        if isinstance(participants, list):
+            refs = []
+            for participant in participants:
+                if not isinstance(participant, dict) or participant.get("id") is None:
+                    continue
+                team = {k: v for k, v in participant.items() if k != "meta"}
+                self._put(self.teams, team["id"], (now, team))
+                refs.append((team["id"], participant.get("meta") or {}))
+        elif fixture["id"] in self.fixtures:
+            # A response without participants does not make the ones we know stale
+            refs = self.fixtures[fixture["id"]][2]
+        row = {k: v for k, v in fixture.items() if k not in ("participants", "league")}
+        self._put(self.fixtures, fixture["id"], (now, row, refs))
+
+    def learn(self, payload: dict):
+        """Remember every entity embedded in a news payload."""
+        if payload.get("error") or not isinstance(payload.get("data"), list):
+            return
+        now = time.monotonic()
+        for article in payload["data"]:
+            if isinstance(article, dict):
+                self.learn_league(article.get("league"), now)
+                self.learn_fixture(article.get("fixture"), now)
+
+    def warm_start(self, entities: dict):
+        """Load leagues, teams and fixtures read from the article store (ArticleStore.load_entities)."""
+        now = time.monotonic()
+        for league in entities.get("leagues", []):
+            self.learn_league(league, now)
+        for fixture in entities.get("fixtures", []):
+            self.learn_fixture(fixture, now)
+
+    # ──────────────────────────────────────────────
+    # SLIM REQUESTS + LOCAL JOIN
+    # ──────────────────────────────────────────────
+
+    def slim_include(self, include: Optional[str]) -> Optional[str]:
+        """The include to send upstream instead of `include`, or None when this cache can't help."""
+        parts = {p.strip() for p in str(include or "").split(";") if p.strip()}
+        if not len(self) or not parts & JOINABLE_INCLUDES or parts - JOINABLE_INCLUDES - UPSTREAM_INCLUDES:
+            return None
+        return ";".join(sorted(parts & UPSTREAM_INCLUDES))
+
+    def missing_fixtures(self, articles: Iterable, include: Optional[str]) -> Optional[set]:
+        """Fixture ids to bulk-fetch before `articles` can be joined; None if a fetch would not help."""
+        includes = parse_includes(include)
+        now = time.monotonic()
+        missing = set()
+        for article in articles:
+            if not isinstance(article, dict):
+                continue
+            fixture_id = article.get("fixture_id")
+            league_id = article.get("league_id")
+            fixture = None
+            if fixture_id is not None:
+                fixture = self._fresh(self.fixtures, fixture_id, self.fixture_ttl, now)
+            if "league" in includes and league_id is not None:
+                if self._fresh(self.leagues, league_id, self.ttl, now) is None:
+                    if fixture_id is None:
+                        return None
+                    missing.add(fixture_id)
+            if "fixture" in includes and fixture_id is not None:
+                if fixture is None:
+                    missing.add(fixture_id)
+                elif "fixture.participants" in includes:
+                    refs = fixture[2]
+                    if refs is None or any(self._fresh(self.teams, t, self.ttl, now) is None for t, _ in refs):
+                        missing.add(fixture_id)
+        return missing
+
+    def join_payload(self, payload: dict, include: Optional[str]) -> dict:
+        """Copy of a slim payload with league / fixture / participants attached as upstream would."""
+        includes = parse_includes(include)
+        articles = []
+        for article in payload["data"]:
+            if not isinstance(article, dict):
+                articles.append(article)
+                continue
+            article = dict(article)
+            if "fixture" in includes:
+                item = self.fixtures.get(article.get("fixture_id"))
+                fixture = None
+                if item is not None:
+                    fixture = dict(item[1])
+                    if "fixture.participants" in includes:
+                        fixture["participants"] = [
+                            {**self.teams[team_id][1], "meta": meta} for team_id, meta in item[2] or []
+                        ]
+                article["fixture"] = fixture
+            if "league" in includes:
+                item = self.leagues.get(article.get("league_id"))
+                article["league"] = item[1] if item is not None else None
+            articles.append(article)
+        return {**payload, "data": articles}
+
+    def stats(self) -> dict:
+        return {
+            "leagues": len(self.leagues),
+            "teams": len(self.teams),
+            "fixtures": len(self.fixtures),
+            "slim_fetches": self.slim_fetches,
+            "bulk_fetches": self.bulk_fetches,
+            "fallbacks": self.fallbacks,
+        }
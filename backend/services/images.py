@@ -0,0 +1,213 @@
+"""
+Image Proxy Module.
+Team and league logos are fetched from the SportMonks CDN once, kept in a disk cache keyed by
+the hash of their URL, and served at the sizes the frontend draws them (68px and 32px).
+`images=proxy` on the news routes rewrites every `image_path` to point here. Each hash's origin
+URL is also written next to its images, so any worker (or a restarted one) can serve it.
+"""
+
+import asyncio
+import hashlib
+import io
+import logging
+import os
+from typing import Optional
+
+import httpx
+
+from backend.config import settings
+
+try:
+    from PIL import Image
+except ImportError:  # optional — without Pillow every size is served as the original image
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+# .team-logo and .league-badge-img in frontend/app.py
+THUMBNAIL_SIZES = (68, 32)
+
+SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+)
+
+
+def image_hash(url: str) -> str:
+    return hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+
+
+def sniff_media_type(data: bytes) -> str:
+    for signature, media_type in SIGNATURES:
+        if data.startswith(signature):
+            return media_type
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    if b"<svg" in data[:512]:
+        return "image/svg+xml"
+    return "application/octet-stream"
+
+
+def make_thumbnail(data: bytes, size: int) -> Optional[bytes]:
+    """Fit the image into a size×size box as PNG (keeps logo transparency); None if it can't be decoded."""
+    if Image is None:
+        return None
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            image = image.convert("RGBA")
+            image.thumbnail((size, size), Image.LANCZOS)
+            out = io.BytesIO()
+            image.save(out, format="PNG", optimize=True)
+            return out.getvalue()
+    except Exception as e:
+        logger.warning("Could not thumbnail image: %s", e)
+        return None
+
+
+def _read(path: str) -> Optional[bytes]:
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def _write(path: str, data: bytes):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)  # atomic: readers never see a half-written file
+
+
+class ImageProxy:
+    """Registry of proxied image URLs plus the on-disk original/thumbnail cache."""
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._sources: dict = {}  # image hash -> origin URL, learned while rewriting or read from disk
+        self._inflight: dict = {}
+        self._client: Optional[httpx.AsyncClient] = None
+        self.disk_hits = 0
+        self.fetches = 0
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    # ──────────────────────────────────────────────
+    # RESPONSE REWRITING
+    # ──────────────────────────────────────────────
+
+    def register(self, url: str) -> str:
+        digest = image_hash(url)
+        if digest not in self._sources:
+            self._sources[digest] = url
+            # Once per image and process: the URL a page now links to must outlive this worker
+            path = self._source_path(digest)
+            if not os.path.exists(path):
+                _write(path, url.encode())
+        return digest
+
+    def _source_path(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, digest[:2], f"{digest}.url")
+
+    def _source(self, digest: str) -> Optional[str]:
+        """Origin URL of a hash registered by any process, or None."""
+        url = self._sources.get(digest)
+        if url is None:
+            raw = _read(self._source_path(digest))
+            url = raw.decode(errors="replace").strip() if raw else None
+            if url is None or image_hash(url) != digest:
+                return None
+            self._sources[digest] = url
+        return url
+
+    def rewrite(self, value, base_url: str):
+        """Copy of `value` with every http(s) `image_path` pointing at /api/images/{hash}."""
+        if isinstance(value, dict):
+            out = {}
+            for key, item in value.items():
+                if key == "image_path" and isinstance(item, str) and item.startswith(("http://", "https://")):
+                    out[key] = f"{base_url}/api/images/{self.register(item)}"
+                elif isinstance(item, (dict, list)):
+                    out[key] = self.rewrite(item, base_url)
+                else:
+                    out[key] = item
+            return out
+        if isinstance(value, list):
+            return [self.rewrite(item, base_url) if isinstance(item, (dict, list)) else item for item in value]
+        return value
+
+    # ──────────────────────────────────────────────
+    # SERVING
+    # ──────────────────────────────────────────────
+
+    def _path(self, digest: str, size: Optional[int]) -> str:
+        return os.path.join(self.cache_dir, digest[:2], f"{digest}-{size or 'orig'}")
+
+    async def get(self, digest: str, size: Optional[int] = None) -> Optional[bytes]:
+        """Image bytes at `size` (None = original), or None if the hash was never seen."""
+        data = await asyncio.to_thread(_read, self._path(digest, size))
+        if data is not None:
+            self.disk_hits += 1
+            return data
+        # Single-flight per file: a page of cards asking for one badge triggers one fetch
+        key = (digest, size)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(digest, size))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _load(self, digest: str, size: Optional[int]) -> Optional[bytes]:
+        original = await asyncio.to_thread(_read, self._path(digest, None))
+        if original is None:
+            original = await self._fetch(digest)
+            if original is None:
+                return None
+            await asyncio.to_thread(_write, self._path(digest, None), original)
+        if size is None:
+            return original
+        if Image is None:
+            return original
+        # Undecodable images (e.g. SVG) are stored as-is so they are not retried on every request
+        thumbnail = await asyncio.to_thread(make_thumbnail, original, size) or original
+        await asyncio.to_thread(_write, self._path(digest, size), thumbnail)
+        return thumbnail
+
+    async def _fetch(self, digest: str) -> Optional[bytes]:
+        url = await asyncio.to_thread(self._source, digest)
+        if url is None:
+            return None
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=10.0, follow_redirects=True)
+        self.fetches += 1
+        try:
+            response = await self._client.get(url)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.warning("Image fetch failed for %s: %s", url, e)
+            return None
+        if len(response.content) > self.max_bytes:
+            logger.warning("Image %s is larger than IMAGE_MAX_BYTES, not proxied", url)
+            return None
+        return response.content
+
+    def stats(self) -> dict:
+        return {
+            "known_images": len(self._sources),
+            "disk_hits": self.disk_hits,
+            "fetches": self.fetches,
+            "thumbnails": Image is not None,
+            # Proxied image URLs only work for browsers when this is set — clients check it first
+            "public_base_url": settings.public_base_url or None,
+        }
+
+
+image_proxy = ImageProxy(settings.image_cache_dir, settings.image_max_bytes)
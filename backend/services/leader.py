@@ -0,0 +1,98 @@
+"""
+Leader Election Module.
+Every gunicorn worker runs the app lifespan, but the store sync and the prefetcher only need to run
+once per host. They run in the worker holding a lease row in the shared cache database; the others
+stand by and take over once the holder stops renewing it (shutdown, crash, hung event loop).
+"""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Optional
+
+from backend.config import settings
+from backend.services.sportmonks import sportmonks_service
+
+logger = logging.getLogger(__name__)
+
+LEASE_KEY = "leader:background-jobs"
+
+
+class BackgroundJobs:
+    """Coroutines run only while this worker is the leader — always, without a shared cache,
+    since a single process has nobody to defer to."""
+
+    def __init__(self, shared_cache, lease: float):
+        self.shared_cache = shared_cache
+        self.lease = lease
+        self._factories: dict = {}
+        self._tasks: dict = {}
+        self._elector: Optional[asyncio.Task] = None
+        self._held_until = 0.0
+        self.leader = False
+        self.terms = 0
+
+    def add(self, name: str, factory: Callable[[], Awaitable]):
+        self._factories[name] = factory
+
+    def start(self):
+        if self.shared_cache is None:
+            self._lead()
+        else:
+            self._elector = asyncio.create_task(self._elect())
+
+    async def _elect(self):
+        """Background task: renew (or try to take) the lease three times per lease period."""
+        while True:
+            try:
+                held = await asyncio.to_thread(self.shared_cache.renew, LEASE_KEY, self.lease)
+                if held:
+                    self._held_until = time.monotonic() + self.lease
+            except Exception as e:
+                # A busy database doesn't end a term early — the lease is ours until it runs out
+                logger.warning("Leader lease renewal failed: %s", e)
+                held = self.leader and time.monotonic() < self._held_until
+            if held and not self.leader:
+                logger.info("Worker became leader: running %s", ", ".join(self._factories) or "no jobs")
+                self._lead()
+            elif not held and self.leader:
+                logger.info("Worker lost the leader lease: stopping background jobs")
+                await self._step_down()
+            await asyncio.sleep(self.lease / 3)
+
+    def _lead(self):
+        self.leader = True
+        self.terms += 1
+        for name, factory in self._factories.items():
+            self._tasks[name] = asyncio.create_task(factory())
+
+    async def _step_down(self):
+        self.leader = False
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def stop(self):
+        if self._elector is not None:
+            self._elector.cancel()
+            await asyncio.gather(self._elector, return_exceptions=True)
+            self._elector = None
+        was_leader = self.leader
+        await self._step_down()
+        if was_leader and self.shared_cache is not None:
+            # Free the lease now so a standby takes over at its next renewal, not a full lease later
+            await asyncio.to_thread(self.shared_cache.release, LEASE_KEY)
+
+    def stats(self) -> dict:
+        return {
+            "leader": self.leader,
+            "elected": self.shared_cache is not None,
+            "lease": self.lease if self.shared_cache is not None else None,
+            "terms": self.terms,
+            "jobs": sorted(self._tasks),
+        }
+
+
+background_jobs = BackgroundJobs(sportmonks_service.shared_cache, settings.leader_lease)
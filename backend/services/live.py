@@ -0,0 +1,161 @@
+"""
+Live News Module.
+One shared poller diffs successive first pages of the pre-match and post-match feeds
+and fans new or changed articles out to every SSE/WebSocket subscriber.
+The poller only runs while someone is subscribed, and upstream cost is one poll per
+interval regardless of how many clients are connected.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from typing import Optional
+
+from backend.config import settings
+from backend.services.competitions import competition_index
+from backend.services.sportmonks import sportmonks_service
+
+logger = logging.getLogger(__name__)
+
+LIVE_FEEDS = ("pre-match", "post-match")
+
+
+def fingerprint(article: dict) -> str:
+    raw = json.dumps(article, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode()
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+class Subscriber:
+    """A bounded event queue. When the consumer falls behind, the oldest events are dropped."""
+
+    def __init__(self, max_queue: int, competitions: frozenset = frozenset()):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.competitions = competitions
+        self.dropped = 0
+
+    def offer(self, event: dict):
+        if self.queue.full():
+            # Backpressure: a slow consumer loses its oldest events, never stalls the poller
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+    async def next_event(self, timeout: Optional[float] = None) -> Optional[dict]:
+        """Next event, a `lagged` notice if events were dropped, or None on timeout."""
+        if self.dropped:
+            dropped, self.dropped = self.dropped, 0
+            return {"type": "lagged", "dropped": dropped}
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class NewsBroadcaster:
+    """Shared upstream poller + subscriber fan-out."""
+
+    def __init__(self, service, competition_index, interval: float, max_queue: int):
+        self.service = service
+        self.competition_index = competition_index
+        self.interval = interval
+        self.max_queue = max_queue
+        self.subscribers: set = set()
+        self.polls = 0
+        self._seen: dict = {}  # feed -> {article id: fingerprint} of the last polled page
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self, competitions: frozenset = frozenset()) -> Subscriber:
+        subscriber = Subscriber(self.max_queue, competitions)
+        self.subscribers.add(subscriber)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._poll_loop())
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber):
+        self.subscribers.discard(subscriber)
+
+    async def close(self):
+        self.subscribers.clear()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    # ──────────────────────────────────────────────
+    # POLLING
+    # ──────────────────────────────────────────────
+
+    async def _poll_loop(self):
+        # Stops by itself once the last subscriber leaves
+        while self.subscribers:
+            try:
+                await self.poll_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Live news poll failed: %s", e)
+            await asyncio.sleep(self.interval)
+
+    async def poll_once(self):
+        self.polls += 1
+        # Past the response cache: a page cached under a long TTL would hold news back by that TTL,
+        # not the poll interval. The refresh also updates the cached page for everyone else, and a
+        # copy another worker fetched within the interval is reused instead of calling upstream.
+        entries = await asyncio.gather(*(
+            self.service.refresh(f"news/{feed}", "fixture.participants;league;lines", "desc", 50, 1,
+                                 max_shared_age=self.interval)
+            for feed in LIVE_FEEDS
+        ))
+        for feed, entry in zip(LIVE_FEEDS, entries):
+            payload = entry.payload
+            if payload.get("error"):
+                continue
+            for event in self._diff(feed, payload.get("data") or []):
+                self._broadcast(event)
+
+    def _diff(self, feed: str, articles: list) -> list:
+        """created/updated events versus the previous poll; the very first poll only primes."""
+        events = []
+        previous_page = self._seen.get(feed)
+        current_page = {}
+        for article in reversed(articles):  # oldest first, so clients can append in order
+            if not isinstance(article, dict) or article.get("id") is None:
+                continue
+            digest = fingerprint(article)
+            current_page[article["id"]] = digest
+            if previous_page is None:
+                continue
+            previous = previous_page.get(article["id"])
+            if previous != digest:
+                events.append({
+                    "type": "created" if previous is None else "updated",
+                    "feed": feed,
+                    "article": article,
+                })
+        # Only the latest page is remembered, so memory stays bounded by the page size
+        self._seen[feed] = current_page
+        return events
+
+    def _broadcast(self, event: dict):
+        competitions = None
+        for subscriber in list(self.subscribers):
+            if subscriber.competitions:
+                if competitions is None:
+                    competitions = self.competition_index.competitions_for(event["article"])
+                if not competitions & subscriber.competitions:
+                    continue
+            subscriber.offer(event)
+
+    def stats(self) -> dict:
+        return {
+            "subscribers": len(self.subscribers),
+            "polls": self.polls,
+            "tracked_articles": sum(len(page) for page in self._seen.values()),
+            "polling": self._task is not None and not self._task.done(),
+        }
+
+
+news_broadcaster = NewsBroadcaster(
+    sportmonks_service, competition_index, settings.live_poll_interval, settings.live_queue_size
+)
@@ -0,0 +1,216 @@
+"""
+Merged Feed Module.
+Combines the pre-match and post-match feeds into one "latest" stream:
+both sides are fetched concurrently, merged with a heap-based k-way merge
+(O(n log k) — the upstream pages are already ordered) and de-duplicated by article id.
+Pagination is a cursor recording how far each side has been consumed plus the (created_at, id)
+of the last article, so the local store can continue the walk by keyset where it holds the range.
+"""
+
+import asyncio
+import base64
+import heapq
+import json
+from typing import Optional
+
+# Upstream page size used while merging — matches the frontend default so cache entries are shared
+MERGE_PAGE_SIZE = 50
+
+
+def encode_cursor(state: dict) -> str:
+    raw = json.dumps(state, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str, field: str = "pos") -> dict:
+    """Inverse of encode_cursor. Raises ValueError on anything malformed."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        state = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception as e:
+        raise ValueError("Malformed cursor") from e
+    if not isinstance(state, dict) or not isinstance(state.get(field), (dict, list)):
+        raise ValueError("Malformed cursor")
+    return state
+
+
+def sort_key(article: dict) -> tuple:
+    return (article.get("created_at") or "", article.get("id") or 0)
+
+
+def encode_keyset_cursor(order: str, key: tuple, offset: Optional[int] = None) -> str:
+    """`offset` is how many articles of the upstream feed precede the next one — where paging by
+    number resumes when the store doesn't hold the range after `key`."""
+    state = {"order": order, "after": list(key)}
+    if offset is not None:
+        state["offset"] = offset
+    return encode_cursor(state)
+
+
+def decode_keyset_state(token: str, order: str) -> dict:
+    """The cursor's state with `after` as a (created_at, id) tuple. Raises ValueError if malformed
+    or issued for the other order."""
+    state = decode_cursor(token, "after")
+    if state.get("order") != order:
+        raise ValueError("Cursor was issued for a different sort order")
+    key = state["after"]
+    if len(key) != 2 or not isinstance(key[0], str) or not isinstance(key[1], int):
+        raise ValueError("Malformed cursor")
+    offset = state.get("offset", 0)
+    if not isinstance(offset, int) or offset < 0:
+        raise ValueError("Malformed cursor")
+    return {**state, "after": (key[0], key[1]), "offset": offset}
+
+
+def decode_keyset_cursor(token: str, order: str) -> tuple:
+    """(created_at, id) to continue after. Raises ValueError if malformed or issued for the other order."""
+    return decode_keyset_state(token, order)["after"]
+
+
+def next_keyset_cursor(payload: dict, order: str) -> Optional[str]:
+    """Cursor pointing just past the last article of an upstream page, or None at the end of the feed."""
+    data = payload.get("data")
+    pagination = payload.get("pagination")
+    if payload.get("error") or not isinstance(data, list) or not isinstance(pagination, dict):
+        return None
+    if not data or not pagination.get("has_more"):
+        return None
+    last = data[-1] if isinstance(data[-1], dict) else {}
+    page = int(pagination.get("current_page") or 1)
+    per_page = int(pagination.get("per_page") or len(data))
+    return encode_keyset_cursor(order, sort_key(last), page * per_page)
+
+
+def beyond(key: tuple, after: Optional[tuple], order: str) -> bool:
+    """Whether an article with sort key `key` comes after `after` in the walk's order."""
+    if after is None:
+        return True
+    return key > tuple(after) if order == "asc" else key < tuple(after)
+
+
+def resume_after(payload: dict, order: str, after: tuple) -> dict:
+    """An upstream page fetched by the page number a cursor's offset falls on, without the articles
+    at or before `after` (the feed may have shifted since), with the cursor of the page after it."""
+    data = payload.get("data")
+    if payload.get("error") or not isinstance(data, list):
+        return payload
+    articles = [a for a in data if isinstance(a, dict)]
+    pagination = payload.get("pagination") if isinstance(payload.get("pagination"), dict) else {}
+    cursor = None
+    if pagination.get("has_more"):
+        last = sort_key(articles[-1]) if articles else tuple(after)
+        page = int(pagination.get("current_page") or 1)
+        per_page = int(pagination.get("per_page") or len(data))
+        cursor = encode_keyset_cursor(order, last if beyond(last, after, order) else after, page * per_page)
+    kept = [a for a in articles if beyond(sort_key(a), after, order)]
+    return {**payload, "data": kept, "pagination": {**pagination, "count": len(kept), "next_cursor": cursor}}
+
+
+def advance_positions(positions: dict, consumed: dict) -> dict:
+    """Side positions (page, index) in MERGE_PAGE_SIZE pages moved on by `consumed` articles per side."""
+    moved = {}
+    for name, count in consumed.items():
+        page, index = positions.get(name, (1, 0))
+        absolute = (page - 1) * MERGE_PAGE_SIZE + index + count
+        moved[name] = (absolute // MERGE_PAGE_SIZE + 1, absolute % MERGE_PAGE_SIZE)
+    return {**positions, **moved}
+
+
+def encode_merged_cursor(order: str, positions: dict, after: Optional[tuple]) -> str:
+    return encode_cursor({"order": order, "pos": positions, **({"after": list(after)} if after else {})})
+
+
+def decode_merged_cursor(token: str, order: str) -> dict:
+    """{"pos": side positions, "after": last article's key or None}. A plain keyset cursor is
+    accepted too — its sides restart from the top and skip what `after` already covered."""
+    try:
+        state = decode_cursor(token)
+    except ValueError:
+        return {"pos": {}, "after": decode_keyset_state(token, order)["after"]}
+    if state.get("order", order) != order:
+        raise ValueError("Cursor was issued for a different sort order")
+    after = decode_keyset_state(token, order)["after"] if "after" in state else None
+    return {"pos": state["pos"], "after": after}
+
+
+def with_next_cursor(payload: dict, order: str) -> dict:
+    """Copy of a page with `pagination.next_cursor` pointing just past its last article."""
+    pagination = payload.get("pagination")
+    if payload.get("error") or not isinstance(payload.get("data"), list) or not isinstance(pagination, dict):
+        return payload
+    return {**payload, "pagination": {**pagination, "next_cursor": next_keyset_cursor(payload, order)}}
+
+
+async def collect_side(fetch, include: str, order: str, page: int, offset: int, need: int) -> dict:
+    """Read forward from (page, offset) until `need` items are buffered or the feed ends."""
+    items = []
+    first_payload = None
+    has_more = False
+    while True:
+        payload = await fetch(include, order, MERGE_PAGE_SIZE, page)
+        if payload.get("error"):
+            return {"items": items, "payload": first_payload or payload, "error": payload, "has_more": False}
+        first_payload = first_payload or payload
+        data = payload.get("data") or []
+        for index in range(offset, len(data)):
+            # Remember where the side resumes once this item is consumed
+            items.append((data[index], (page, index + 1)))
+        has_more = bool((payload.get("pagination") or {}).get("has_more"))
+        if len(items) >= need or not has_more or not data:
+            break
+        page, offset = page + 1, 0
+    return {"items": items, "payload": first_payload, "error": None, "has_more": has_more}
+
+
+async def merged_latest(sources: dict, include: str, order: str, limit: int, cursor: Optional[str] = None) -> dict:
+    """
+    One page of the merged feed.
+
+    `sources` maps a side name to a fetch coroutine taking (include, order, per_page, page).
+    """
+    state = decode_merged_cursor(cursor, order) if cursor else {"pos": {}, "after": None}
+    positions = {name: tuple(state["pos"].get(name, (1, 0))) for name in sources}
+
+    sides = await asyncio.gather(*(
+        collect_side(fetch, include, order, *positions[name], limit)
+        for name, fetch in sources.items()
+    ))
+    sides = dict(zip(sources, sides))
+    if all(side["error"] for side in sides.values()):
+        return next(iter(sides.values()))["error"]
+
+    streams = [
+        [(sort_key(article), name, article, resume) for article, resume in side["items"]]
+        for name, side in sides.items()
+    ]
+    merged = heapq.merge(*streams, key=lambda item: item[0], reverse=(order != "asc"))
+
+    data, seen = [], set()
+    new_positions = dict(positions)
+    exhausted = True
+    for _, name, article, resume in merged:
+        if len(data) >= limit:
+            exhausted = False
+            break
+        new_positions[name] = resume
+        if not beyond(sort_key(article), state["after"], order):
+            continue  # shifted back into reach since the previous page
+        article_id = article.get("id")
+        if article_id is not None:
+            if article_id in seen:
+                continue
+            seen.add(article_id)
+        data.append(article)
+
+    has_more = not exhausted or any(side["has_more"] for side in sides.values())
+    next_cursor = None
+    if has_more:
+        next_cursor = encode_merged_cursor(order, new_positions, sort_key(data[-1]) if data else state["after"])
+    first = next((side["payload"] for side in sides.values() if not side["error"]), {}) or {}
+    return {
+        "data": data,
+        "pagination": {"count": len(data), "per_page": limit, "has_more": has_more, "next_cursor": next_cursor},
+        "rate_limit": first.get("rate_limit", {}),
+        "subscription": first.get("subscription", []),
+        "errors": [side["error"] for side in sides.values() if side["error"]],
+    }
@@ -0,0 +1,122 @@
+"""
+Metrics Module.
+Prometheus instrumentation: upstream SportMonks latency and outcomes, route timings,
+in-flight gauges, the last seen rate-limit budget and cache / coalescing counters.
+Under gunicorn, set PROMETHEUS_MULTIPROC_DIR (an empty directory) so every worker
+writes its samples there and /metrics aggregates them.
+"""
+
+import os
+import re
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+
+MULTIPROCESS = bool(os.getenv("PROMETHEUS_MULTIPROC_DIR"))
+
+# Season / fixture ids would make one time series per id — collapse them to a template
+_ID_SEGMENT = re.compile(r"/\d[\d,]*")
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+UPSTREAM_LATENCY = Histogram(
+    "sportmonks_upstream_request_seconds",
+    "Latency of SportMonks requests (scheduler wait excluded)",
+    ["path"],
+    buckets=LATENCY_BUCKETS,
+)
+UPSTREAM_RESPONSES = Counter(
+    "sportmonks_upstream_responses_total",
+    "SportMonks responses by HTTP status code",
+    ["path", "status"],
+)
+UPSTREAM_ERRORS = Counter(
+    "sportmonks_upstream_errors_total",
+    "SportMonks requests that failed, by exception class",
+    ["path", "exception"],
+)
+UPSTREAM_IN_FLIGHT = Gauge(
+    "sportmonks_upstream_in_flight",
+    "SportMonks requests currently on the wire",
+    multiprocess_mode="livesum",
+)
+RATE_LIMIT_REMAINING = Gauge(
+    "sportmonks_rate_limit_remaining",
+    "`rate_limit.remaining` from the most recent SportMonks response",
+    multiprocess_mode="mostrecent",
+)
+CACHE_LOOKUPS = Counter(
+    "sportmonks_cache_lookups_total",
+    "Response cache lookups by result (hit, stale, miss; shared = served from the cross-worker tier)",
+    ["result"],
+)
+COALESCING = Counter(
+    "sportmonks_coalescing_total",
+    "Upstream calls originated vs. joined an identical in-flight call",
+    ["result"],
+)
+ROUTE_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Latency of API routes, by route template",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+ROUTE_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "API requests currently being served",
+    multiprocess_mode="livesum",
+)
+
+
+def upstream_path(url: str, base_url: str) -> str:
+    """`https://…/v3/football/news/pre-match/seasons/23614` -> `news/pre-match/seasons/{id}`."""
+    path = url[len(base_url):] if url.startswith(base_url) else url
+    return _ID_SEGMENT.sub("/{id}", path).strip("/")
+
+
+def render_metrics() -> tuple:
+    """(body, content type) for /metrics — aggregated across workers in multiprocess mode."""
+    registry = REGISTRY
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware timing every HTTP request against its route template."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        ROUTE_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            ROUTE_IN_FLIGHT.dec()
+            route = scope.get("route")
+            ROUTE_LATENCY.labels(
+                scope["method"], getattr(route, "path", "unmatched"), str(status)
+            ).observe(time.perf_counter() - started)
@@ -0,0 +1,62 @@
+"""
+Normalized Shape Module.
+`shape=normalized` — articles reference fixtures, leagues and teams by id, and each entity
+is sent once in a side table instead of once per article.
+On match days many articles share one fixture, so this shrinks the payload several-fold.
+"""
+
+from typing import Optional
+
+
+def _entity_id(value) -> Optional[str]:
+    # JSON object keys are strings, so side tables are keyed by str(id)
+    return None if value is None else str(value)
+
+
+def normalize_payload(payload: dict) -> dict:
+    """Copy of `payload` with nested league/fixture/participant objects lifted into side tables."""
+    if payload.get("error") or not isinstance(payload.get("data"), list):
+        return payload
+    fixtures: dict = {}
+    leagues: dict = {}
+    teams: dict = {}
+    articles = []
+    for article in payload["data"]:
+        if not isinstance(article, dict):
+            articles.append(article)
+            continue
+        article = dict(article)
+
+        league = article.pop("league", None)
+        if isinstance(league, dict) and league.get("id") is not None:
+            article.setdefault("league_id", league["id"])
+            leagues.setdefault(_entity_id(league["id"]), league)
+
+        fixture = article.pop("fixture", None)
+        if isinstance(fixture, dict) and fixture.get("id") is not None:
+            article.setdefault("fixture_id", fixture["id"])
+            key = _entity_id(fixture["id"])
+            if key not in fixtures:
+                fixture = dict(fixture)
+                participants = fixture.pop("participants", None)
+                if isinstance(participants, list):
+                    # Fixture-specific data (home/away, winner) stays on the fixture; the team itself is shared
+                    refs = []
+                    for participant in participants:
+                        if not isinstance(participant, dict) or participant.get("id") is None:
+                            continue
+                        team = {k: v for k, v in participant.items() if k != "meta"}
+                        teams.setdefault(_entity_id(participant["id"]), team)
+                        refs.append({"team_id": participant["id"], "meta": participant.get("meta") or {}})
+                    fixture["participants"] = refs
+                fixtures[key] = fixture
+        articles.append(article)
+
+    return {
+        **payload,
+        "data": articles,
+        "shape": "normalized",
+        "fixtures": fixtures,
+        "leagues": leagues,
+        "teams": teams,
+    }
@@ -0,0 +1,155 @@
+"""
+Prefetch Module.
+Hot feeds from Settings.prefetch_* are loaded into the response cache in the background at startup,
+within a time budget, then refreshed ahead of expiry — so the first request after a deploy is as
+fast as every later one and hot pages never fall out of the cache.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from backend.config import settings
+from backend.services.sportmonks import sportmonks_service
+from backend.services.store import FEEDS
+
+logger = logging.getLogger(__name__)
+
+# Bounds on the refresh loop's sleep, and the retry backoff for pages that failed to load
+MIN_SLEEP = 1.0
+MAX_SLEEP = 60.0
+MAX_BACKOFF = 300.0
+
+
+@dataclass(frozen=True)
+class PrefetchTarget:
+    path: str
+    include: str
+    page: int
+
+
+def _split(value: str) -> list:
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+def prefetch_targets(config=settings) -> list:
+    """Every (feed or season path, include, page) the settings ask to keep warm."""
+    paths = [f"news/{feed.strip('/')}" for feed in _split(config.prefetch_feeds)]
+    for season_id in _split(config.prefetch_seasons):
+        paths.extend(f"news/{feed}/seasons/{int(season_id)}" for feed in FEEDS)
+    return [
+        PrefetchTarget(path, include, page)
+        for path in dict.fromkeys(paths)
+        for include in _split(config.prefetch_includes)
+        for page in range(1, max(1, config.prefetch_pages) + 1)
+    ]
+
+
+class Prefetcher:
+    """Startup warm-up plus a refresh-ahead loop over a fixed list of news pages."""
+
+    def __init__(self, service, targets: list, order: str, per_page: int, concurrency: int,
+                 startup_budget: float, refresh_ahead: float):
+        self.service = service
+        self.targets = targets
+        self.order = order
+        self.per_page = per_page
+        self.concurrency = max(1, concurrency)
+        self.startup_budget = startup_budget
+        self.refresh_ahead = min(max(refresh_ahead, 0.1), 1.0)
+        self._keys = {t: service.news_key(t.path, t.include, order, per_page, t.page)[2] for t in targets}
+        self._failures: dict = {}  # target -> consecutive failures
+        self._retry_at: dict = {}  # target -> monotonic time of the next attempt after a failure
+        self.warmed = 0
+        self.warm_seconds: Optional[float] = None
+        self.refreshes = 0
+        self.errors = 0
+
+    async def _load(self, target: PrefetchTarget, min_shared_ttl: float = 0.0):
+        entry = await self.service.refresh(
+            target.path, target.include, self.order, self.per_page, target.page, min_shared_ttl
+        )
+        if entry.payload.get("error"):
+            self.errors += 1
+            failures = self._failures.get(target, 0) + 1
+            self._failures[target] = failures
+            self._retry_at[target] = time.monotonic() + min(MAX_BACKOFF, 5.0 * 2 ** (failures - 1))
+            logger.warning("Prefetch of %s page %d failed: %s", target.path, target.page, entry.payload.get("message"))
+            return False
+        self._failures.pop(target, None)
+        self._retry_at.pop(target, None)
+        return True
+
+    async def _load_all(self, due: list, timeout: Optional[float] = None) -> int:
+        """Load (target, min_shared_ttl) pairs, `concurrency` at a time; returns how many succeeded."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def one(target: PrefetchTarget, min_shared_ttl: float) -> bool:
+            async with semaphore:
+                return await self._load(target, min_shared_ttl)
+
+        tasks = [asyncio.create_task(one(*item)) for item in due]
+        done, pending = await asyncio.wait(tasks, timeout=timeout) if tasks else (set(), set())
+        for task in pending:
+            # The upstream flight itself is shielded and still lands in the cache
+            task.cancel()
+        return sum(1 for task in done if not task.cancelled() and task.exception() is None and task.result())
+
+    async def warm(self):
+        started = time.perf_counter()
+        self.warmed = await self._load_all([(t, 0.0) for t in self.targets], self.startup_budget)
+        self.warm_seconds = round(time.perf_counter() - started, 3)
+        logger.info("Prefetched %d of %d hot pages in %.2fs", self.warmed, len(self.targets), self.warm_seconds)
+
+    def _due(self, now: float) -> tuple:
+        """(targets to refresh now with their min shared TTL, monotonic time of the next one)."""
+        due, next_at = [], now + MAX_SLEEP
+        for target in self.targets:
+            retry_at = self._retry_at.get(target)
+            if retry_at is not None and retry_at > now:
+                next_at = min(next_at, retry_at)
+                continue
+            entry = self.service.cache.peek(self._keys[target])
+            if entry is None:
+                due.append((target, 0.0))  # evicted, never loaded, or failed last time
+                continue
+            ttl = entry.expires_at - entry.stored_at
+            refresh_at = entry.stored_at + ttl * self.refresh_ahead
+            if refresh_at <= now:
+                due.append((target, ttl * (1 - self.refresh_ahead)))
+            else:
+                next_at = min(next_at, refresh_at)
+        return due, next_at
+
+    async def run(self):
+        """Background task started from the app lifespan."""
+        await self.warm()
+        while True:
+            due, next_at = self._due(time.monotonic())
+            if due:
+                self.refreshes += await self._load_all(due)
+                next_at = time.monotonic()  # look again after the minimum pause
+            await asyncio.sleep(min(MAX_SLEEP, max(MIN_SLEEP, next_at - time.monotonic())))
+
+    def stats(self) -> dict:
+        return {
+            "targets": len(self.targets),
+            "warmed": self.warmed,
+            "warm_seconds": self.warm_seconds,
+            "refreshes": self.refreshes,
+            "errors": self.errors,
+            "backing_off": len(self._retry_at),
+        }
+
+
+prefetcher = Prefetcher(
+    sportmonks_service,
+    prefetch_targets(settings),
+    settings.prefetch_order,
+    settings.prefetch_per_page,
+    settings.prefetch_concurrency,
+    settings.prefetch_startup_budget,
+    settings.prefetch_refresh_ahead,
+)
@@ -0,0 +1,135 @@
+"""
+Upstream Scheduler Module.
+Token bucket kept in sync with the `rate_limit` block SportMonks returns on every response.
+Callers queue by priority: interactive user traffic first, background prefetch/crawl after.
+Background work is held back once the bucket drops to a reserve kept for users.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from enum import IntEnum
+from typing import Optional
+
+
+class Priority(IntEnum):
+    """Lower value is served first."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a caller cannot get a token before its deadline."""
+
+    def __init__(self, resets_in: float):
+        self.resets_in = resets_in
+        super().__init__(f"SportMonks rate limit exhausted — resets in {resets_in:.0f}s")
+
+
+class RateLimitScheduler:
+    """Priority-ordered token bucket refilled when the upstream rate-limit window resets."""
+
+    def __init__(self, capacity: int, window: float, background_reserve: int):
+        self.capacity = capacity
+        self.window = window
+        self.background_reserve = background_reserve
+        self.tokens = float(capacity)
+        self.reset_at = time.monotonic() + window
+        self.remaining: Optional[int] = None  # last value SportMonks reported
+        self.deferred = 0
+        self._waiters: list = []
+        self._seq = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    # ──────────────────────────────────────────────
+    # BUCKET
+    # ──────────────────────────────────────────────
+
+    def _refill(self, now: float):
+        if now >= self.reset_at:
+            self.tokens = float(self.capacity)
+            self.reset_at = now + self.window
+
+    def _allowed(self, priority: Priority) -> bool:
+        floor = 0 if priority == Priority.INTERACTIVE else self.background_reserve
+        return self.tokens - 1 >= floor
+
+    def observe(self, rate_limit: dict):
+        """Sync the bucket with a response's `rate_limit` block (remaining + resets_in_seconds)."""
+        if not isinstance(rate_limit, dict):
+            return
+        remaining = rate_limit.get("remaining")
+        resets_in = rate_limit.get("resets_in_seconds")
+        now = time.monotonic()
+        if isinstance(resets_in, (int, float)):
+            self.reset_at = now + max(0.0, float(resets_in))
+        if isinstance(remaining, (int, float)):
+            self.remaining = int(remaining)
+            self.tokens = float(remaining)
+        self._dispatch()
+
+    def throttled(self, retry_after: Optional[float] = None):
+        """Upstream answered 429 — empty the bucket until the window resets."""
+        self.tokens = 0.0
+        if retry_after is not None:
+            self.reset_at = time.monotonic() + retry_after
+        self._dispatch()
+
+    # ──────────────────────────────────────────────
+    # QUEUE
+    # ──────────────────────────────────────────────
+
+    async def acquire(self, priority: Priority = Priority.INTERACTIVE, timeout: Optional[float] = None):
+        """Take one token, waiting behind higher-priority callers when the budget is short."""
+        now = time.monotonic()
+        self._refill(now)
+        if not self._waiters and self._allowed(priority):
+            self.tokens -= 1
+            return
+
+        if priority != Priority.INTERACTIVE:
+            self.deferred += 1
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        self._dispatch()
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise RateLimitExceeded(max(0.0, self.reset_at - time.monotonic())) from None
+        finally:
+            if not future.done():
+                future.cancel()
+
+    def _dispatch(self):
+        self._refill(time.monotonic())
+        while self._waiters:
+            priority, _, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if not self._allowed(priority):
+                break
+            heapq.heappop(self._waiters)
+            self.tokens -= 1
+            future.set_result(None)
+        self._arm_timer()
+
+    def _arm_timer(self):
+        # Wake the queue when the window resets, if anybody is still waiting
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._waiters:
+            delay = max(0.0, self.reset_at - time.monotonic()) + 0.01
+            self._timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
+
+    def stats(self) -> dict:
+        return {
+            "tokens": int(self.tokens),
+            "remaining": self.remaining,
+            "resets_in_seconds": max(0, round(self.reset_at - time.monotonic())),
+            "queued": sum(1 for _, _, f in self._waiters if not f.done()),
+            "deferred": self.deferred,
+        }
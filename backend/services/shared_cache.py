@@ -0,0 +1,177 @@
+"""
+Shared Cache Module.
+Second cache tier in a SQLite (WAL) file that every gunicorn worker on the host opens, so a
+SportMonks response fetched by one worker is served by all of them. Short leases make the
+workers take turns: one fetches a key from upstream while the others wait for its result, and a
+renewed long lease elects the one worker that runs the background jobs.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    stale_until REAL NOT NULL,
+    ttl_policy TEXT NOT NULL DEFAULT 'default',
+    ttl_reason TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_responses_stored ON responses (stored_at);
+CREATE TABLE IF NOT EXISTS leases (
+    key TEXT PRIMARY KEY,
+    owner INTEGER NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+# Prune dead rows and enforce the byte budget once per this many writes
+PRUNE_EVERY = 200
+
+
+class SharedCache:
+    """Raw response bodies with wall-clock freshness. Blocking methods — call them through asyncio.to_thread."""
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._initialized = False
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lease_waits = 0
+
+    def _conn(self) -> sqlite3.Connection:
+        # One connection per thread, as in ArticleStore; the 5s busy timeout absorbs writer contention
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            if os.path.dirname(self.path):
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        if not self._initialized:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(responses)")}
+            if columns and "ttl_policy" not in columns:
+                # A cache file from before TTL policies were recorded — its rows are cheap to lose
+                conn.execute("DROP TABLE responses")
+            conn.executescript(SCHEMA)
+            self._initialized = True
+        return conn
+
+    # ──────────────────────────────────────────────
+    # RESPONSES
+    # ──────────────────────────────────────────────
+
+    def get(self, key: str) -> Optional[tuple]:
+        """(body, seconds until expiry, seconds until unservable, assigned TTL, TTL policy, reason)
+        for a servable entry, else None."""
+        row = self._conn().execute(
+            "SELECT body, expires_at, stale_until, stored_at, ttl_policy, ttl_reason FROM responses WHERE key = ?",
+            (key,),
+        ).fetchone()
+        now = time.time()
+        if row is None or row[2] <= now:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row[0], row[1] - now, row[2] - now, row[1] - row[3], row[4], row[5]
+
+    def put(self, key: str, body: bytes, ttl: float, stale_while_revalidate: float,
+            ttl_policy: str = "default", ttl_reason: str = ""):
+        if len(body) > self.max_bytes:
+            return
+        now = time.time()
+        conn = self._conn()
+        conn.execute(
+            "INSERT INTO responses (key, body, stored_at, expires_at, stale_until, ttl_policy, ttl_reason) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET body=excluded.body, stored_at=excluded.stored_at, "
+            "expires_at=excluded.expires_at, stale_until=excluded.stale_until, "
+            "ttl_policy=excluded.ttl_policy, ttl_reason=excluded.ttl_reason",
+            (key, body, now, now + ttl, now + ttl + stale_while_revalidate, ttl_policy, ttl_reason),
+        )
+        self._writes += 1
+        if self._writes % PRUNE_EVERY == 0:
+            self.prune()
+
+    def prune(self):
+        """Drop unservable rows, then the oldest ones until the bodies fit in `max_bytes`."""
+        conn = self._conn()
+        now = time.time()
+        conn.execute("DELETE FROM responses WHERE stale_until <= ?", (now,))
+        conn.execute("DELETE FROM leases WHERE expires_at <= ?", (now,))
+        total = conn.execute("SELECT COALESCE(SUM(LENGTH(body)), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        doomed = []
+        for key, size in conn.execute("SELECT key, LENGTH(body) FROM responses ORDER BY stored_at"):
+            if total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+
+    # ──────────────────────────────────────────────
+    # LEASES — one worker fetches, the rest wait
+    # ──────────────────────────────────────────────
+
+    def claim(self, key: str, seconds: float) -> bool:
+        """Take the fetch lease for `key`; False if another live worker holds it."""
+        now = time.time()
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM leases WHERE key = ? AND expires_at <= ?", (key, now))
+            claimed = conn.execute(
+                "INSERT OR IGNORE INTO leases (key, owner, expires_at) VALUES (?, ?, ?)",
+                (key, os.getpid(), now + seconds),
+            ).rowcount == 1
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        if not claimed:
+            self.lease_waits += 1
+        return claimed
+
+    def renew(self, key: str, seconds: float) -> bool:
+        """Take the lease for `key`, or extend it if this process already holds it; False while another
+        live process does. Held leases must be renewed well inside `seconds`."""
+        now = time.time()
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM leases WHERE key = ? AND expires_at <= ?", (key, now))
+            held = conn.execute(
+                "INSERT INTO leases (key, owner, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET expires_at=excluded.expires_at WHERE leases.owner = excluded.owner",
+                (key, os.getpid(), now + seconds),
+            ).rowcount == 1
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return held
+
+    def release(self, key: str):
+        self._conn().execute("DELETE FROM leases WHERE key = ? AND owner = ?", (key, os.getpid()))
+
+    def stats(self) -> dict:
+        row = self._conn().execute("SELECT COUNT(*), COALESCE(SUM(LENGTH(body)), 0) FROM responses").fetchone()
+        return {
+            "path": self.path,
+            "entries": row[0],
+            "bytes": row[1],
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "lease_waits": self.lease_waits,
+        }
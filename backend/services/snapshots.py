@@ -0,0 +1,199 @@
+"""
+Snapshot Transport Module.
+httpx transports behind SportMonksService's UPSTREAM_MODE: `record` tees every successful upstream
+response into append-only segment files, `replay` answers from them instead of the live API.
+Each segment is a data file of raw response bodies plus a fixed-width index (request hash, offset,
+length, status); replay memory-maps the data and reads only the indexes at startup, so opening
+gigabytes of recorded news costs one small read per segment.
+"""
+
+import asyncio
+import glob
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Optional
+
+import httpx
+import orjson
+
+logger = logging.getLogger(__name__)
+
+MODES = ("live", "record", "replay")
+
+# Data file: one record per response — header, JSON metadata (URL, params, time), raw body
+RECORD = struct.Struct(">4sHII")  # magic, status, metadata length, body length
+RECORD_MAGIC = b"SMR1"
+# Index file: one fixed-width entry per record, appended after the record itself is on disk
+INDEX = struct.Struct(">16sQIH")  # request hash, body offset, body length, status
+
+# Never part of the key or the metadata — recordings are portable and carry no credentials
+SECRET_PARAMS = ("api_token",)
+
+
+def request_key(url: httpx.URL) -> bytes:
+    """Hash of path + sorted query (minus the token); the host is ignored so mock and live recordings mix."""
+    params = sorted((k, v) for k, v in url.params.multi_items() if k not in SECRET_PARAMS)
+    canonical = url.path + "?" + "&".join(f"{k}={v}" for k, v in params)
+    return hashlib.blake2b(canonical.encode(), digest_size=16).digest()
+
+
+# ──────────────────────────────────────────────
+# RECORD
+# ──────────────────────────────────────────────
+
+class SegmentWriter:
+    """Appends records to this process's own segment, so gunicorn workers never share a file."""
+
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        name = f"segment-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        self.data_path = os.path.join(directory, f"{name}.dat")
+        self.index_path = os.path.join(directory, f"{name}.idx")
+        self._data = open(self.data_path, "ab")
+        self._index = open(self.index_path, "ab")
+        self._lock = threading.Lock()
+        self.records = 0
+        self.bytes = 0
+
+    def append(self, key: bytes, status: int, metadata: dict, body: bytes):
+        meta = orjson.dumps(metadata)
+        with self._lock:
+            offset = self._data.tell() + RECORD.size + len(meta)
+            self._data.write(RECORD.pack(RECORD_MAGIC, status, len(meta), len(body)) + meta + body)
+            self._data.flush()
+            # Index last: a crash mid-write leaves an unindexed tail that replay never reads
+            self._index.write(INDEX.pack(key, offset, len(body), status))
+            self._index.flush()
+            self.records += 1
+            self.bytes += len(body)
+
+    def close(self):
+        with self._lock:
+            self._data.close()
+            self._index.close()
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Passes requests to the live transport and appends every 2xx response to a segment."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, directory: str):
+        self.transport = transport
+        self.writer = SegmentWriter(directory)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self.transport.handle_async_request(request)
+        if not 200 <= response.status_code < 300:
+            return response
+        # Keep the wire bytes for the caller (Content-Encoding still applies) and store the decoded body
+        try:
+            raw = b"".join([chunk async for chunk in response.stream])
+        finally:
+            await response.aclose()
+        body = httpx.Response(response.status_code, headers=response.headers, content=raw).read()
+        metadata = {
+            "path": request.url.path,
+            "params": {k: v for k, v in request.url.params.items() if k not in SECRET_PARAMS},
+            "recorded_at": time.time(),
+        }
+        await asyncio.to_thread(self.writer.append, request_key(request.url), response.status_code, metadata, body)
+        return httpx.Response(response.status_code, headers=response.headers, content=raw, extensions=response.extensions)
+
+    async def aclose(self):
+        await self.transport.aclose()
+        self.writer.close()
+
+    def stats(self) -> dict:
+        return {"mode": "record", "segment": self.writer.data_path,
+                "records": self.writer.records, "bytes": self.writer.bytes}
+
+
+# ──────────────────────────────────────────────
+# REPLAY
+# ──────────────────────────────────────────────
+
+class SnapshotIndex:
+    """Every segment in a directory, memory-mapped; later recordings of a request win."""
+
+    def __init__(self, directory: str):
+        self.segments: list = []  # (file, mmap) per data file
+        self.entries: dict = {}  # request hash -> (segment number, offset, length, status)
+        for index_path in sorted(glob.glob(os.path.join(directory, "segment-*.idx"))):
+            data_path = index_path[:-4] + ".dat"
+            if not os.path.exists(data_path) or os.path.getsize(data_path) == 0:
+                continue
+            with open(index_path, "rb") as f:
+                raw = f.read()
+            data_file = open(data_path, "rb")
+            data = mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ)
+            number = len(self.segments)
+            self.segments.append((data_file, data))
+            usable = len(raw) - len(raw) % INDEX.size  # ignore a torn trailing entry
+            for key, offset, length, status in INDEX.iter_unpack(raw[:usable]):
+                if offset + length <= len(data):
+                    self.entries[key] = (number, offset, length, status)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: bytes) -> Optional[tuple]:
+        """(status, body bytes) for a request hash, or None if it was never recorded."""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        number, offset, length, status = entry
+        return status, self.segments[number][1][offset:offset + length]
+
+    def close(self):
+        for data_file, data in self.segments:
+            data.close()
+            data_file.close()
+        self.segments = []
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Answers every request from recorded segments; unrecorded requests get a 404."""
+
+    def __init__(self, directory: str):
+        started = time.perf_counter()
+        self.directory = directory
+        self.index = SnapshotIndex(directory)
+        self.hits = 0
+        self.misses = 0
+        logger.info(
+            "Replaying %d recorded responses from %d segments in %s (opened in %.1f ms)",
+            len(self.index), len(self.index.segments), directory, (time.perf_counter() - started) * 1000,
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        found = self.index.get(request_key(request.url))
+        if found is None:
+            self.misses += 1
+            return httpx.Response(
+                404, json={"message": f"No snapshot recorded for {request.url.path}"}, request=request
+            )
+        self.hits += 1
+        status, body = found
+        return httpx.Response(status, headers={"content-type": "application/json"}, content=body, request=request)
+
+    async def aclose(self):
+        self.index.close()
+
+    def stats(self) -> dict:
+        return {"mode": "replay", "directory": self.directory, "responses": len(self.index),
+                "segments": len(self.index.segments), "hits": self.hits, "misses": self.misses}
+
+
+def make_transport(mode: str, directory: str, http2: bool, limits: httpx.Limits) -> Optional[httpx.AsyncBaseTransport]:
+    """The transport for UPSTREAM_MODE, or None for `live` (httpx's own pooled transport)."""
+    if mode == "record":
+        return RecordingTransport(httpx.AsyncHTTPTransport(http2=http2, limits=limits), directory)
+    if mode == "replay":
+        return ReplayTransport(directory)
+    if mode != "live":
+        raise ValueError(f"UPSTREAM_MODE must be one of {', '.join(MODES)}, got {mode!r}")
+    return None
@@ -4,9 +4,25 @@ Handles all HTTP requests to the SportMonks Football News API (Pro plan).
 Endpoints: Pre-Match News, Post-Match News, Season & Upcoming filters.
 """
 
+import asyncio
+import importlib.util
+import time
 import httpx
+import orjson
 from typing import Optional
 from backend.config import settings
+from backend.services.cache import CacheEntry, ResponseCache, make_cache_key, new_entry
+from backend.services.entities import EntityCache
+from backend.services import metrics
+from backend.services.scheduler import Priority, RateLimitExceeded, RateLimitScheduler
+from backend.services.shared_cache import SharedCache
+from backend.services.snapshots import make_transport
+from backend.services.store import article_store, record_fetched_page
+from backend.services.timing import phase
+from backend.services.ttl_policy import ttl_policy
+
+# HTTP/2 needs the optional `h2` package (pip install "httpx[http2]")
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
 
 class SportMonksService:
@@ -15,7 +31,72 @@ class SportMonksService:
     def __init__(self):
         self.base_url = settings.sportmonks_base_url
         self.api_token = settings.sportmonks_api_token
-        self.timeout = 30.0
+        self.timeout = httpx.Timeout(
+            connect=settings.upstream_connect_timeout,
+            read=settings.upstream_read_timeout,
+            write=settings.upstream_write_timeout,
+            pool=settings.upstream_pool_timeout,
+        )
+        self.limits = httpx.Limits(
+            max_connections=settings.upstream_max_connections,
+            max_keepalive_connections=settings.upstream_max_keepalive_connections,
+            keepalive_expiry=settings.upstream_keepalive_expiry,
+        )
+        self.http2 = settings.upstream_http2 and HTTP2_AVAILABLE
+        self.mode = settings.upstream_mode
+        self._client: Optional[httpx.AsyncClient] = None
+        self._transport: Optional[httpx.AsyncBaseTransport] = None
+        self.cache: Optional[ResponseCache] = None
+        if settings.cache_enabled:
+            self.cache = ResponseCache(settings.cache_max_bytes, settings.cache_stale_while_revalidate)
+        self.shared_cache: Optional[SharedCache] = None
+        if settings.shared_cache_enabled:
+            self.shared_cache = SharedCache(settings.shared_cache_path, settings.shared_cache_max_bytes)
+        # Single-flight: cache key -> the one upstream task all identical callers share
+        self._inflight: dict = {}
+        self.originated = 0
+        self.coalesced = 0
+        self.scheduler = RateLimitScheduler(
+            settings.rate_limit_capacity,
+            settings.rate_limit_window,
+            settings.rate_limit_background_reserve,
+        )
+        self.entities: Optional[EntityCache] = None
+        if settings.entity_cache_enabled:
+            self.entities = EntityCache(settings.entity_ttl, settings.entity_fixture_ttl, settings.entity_max_entries)
+
+    # ──────────────────────────────────────────────
+    # CLIENT LIFECYCLE
+    # ──────────────────────────────────────────────
+
+    async def start(self):
+        """Open the shared pooled client (called from the FastAPI lifespan)."""
+        if self._client is None or self._client.is_closed:
+            # record / replay swap in a snapshot transport; live keeps httpx's own pooled one
+            self._transport = make_transport(self.mode, settings.snapshot_dir, self.http2, self.limits)
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+                transport=self._transport,
+            )
+
+    async def close(self):
+        """Close the shared client and release pooled connections."""
+        pending = list(self._inflight.values())
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        # Lazily open the pool if used outside the app lifespan (scripts, shells)
+        if self._client is None or self._client.is_closed:
+            await self.start()
+        return self._client
 
     def _build_params(
         self,
@@ -35,70 +116,336 @@ class SportMonksService:
             params["page"] = page
         return params
 
-    async def _make_request(self, url: str, params: dict) -> dict:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+    async def _fetch(self, url: str, params: dict, priority: Priority = Priority.INTERACTIVE) -> tuple:
+        """One upstream GET behind the rate-limit scheduler. Returns (payload, raw body bytes)."""
+        client = await self._get_client()
+        # Interactive callers give up after a bounded wait; background work queues until the reset
+        timeout = settings.rate_limit_interactive_max_wait if priority == Priority.INTERACTIVE else None
+        path = metrics.upstream_path(url, self.base_url)
+        # Replayed responses cost no quota and carry a stale rate_limit block — bypass the scheduler
+        metered = self.mode != "replay"
+        try:
+            if metered:
+                with phase("upstream-queue"):
+                    await self.scheduler.acquire(priority, timeout)
+            metrics.UPSTREAM_IN_FLIGHT.inc()
+            started = time.perf_counter()
             try:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                return {
-                    "error": True,
-                    "status_code": e.response.status_code,
-                    "message": f"HTTP {e.response.status_code}: {e.response.text[:500]}",
-                }
-            except httpx.RequestError as e:
-                return {"error": True, "message": f"Request Error: {str(e)}"}
-            except Exception as e:
-                return {"error": True, "message": f"Unexpected Error: {str(e)}"}
+                with phase("upstream"):
+                    response = await client.get(url, params=params)
+            finally:
+                metrics.UPSTREAM_IN_FLIGHT.dec()
+                metrics.UPSTREAM_LATENCY.labels(path).observe(time.perf_counter() - started)
+            metrics.UPSTREAM_RESPONSES.labels(path, str(response.status_code)).inc()
+            if response.status_code == 429:
+                retry_after = response.headers.get("Retry-After")
+                self.scheduler.throttled(float(retry_after) if retry_after and retry_after.isdigit() else None)
+            response.raise_for_status()
+            body = response.content
+            with phase("decode"):
+                payload = orjson.loads(body)
+            if isinstance(payload, dict) and metered:
+                self.scheduler.observe(payload.get("rate_limit"))
+                remaining = (payload.get("rate_limit") or {}).get("remaining")
+                if isinstance(remaining, (int, float)):
+                    metrics.RATE_LIMIT_REMAINING.set(remaining)
+            return payload, body
+        except RateLimitExceeded as e:
+            metrics.UPSTREAM_ERRORS.labels(path, type(e).__name__).inc()
+            return {"error": True, "status_code": 429, "message": str(e)}, b""
+        except httpx.HTTPStatusError as e:
+            metrics.UPSTREAM_ERRORS.labels(path, type(e).__name__).inc()
+            return {
+                "error": True,
+                "status_code": e.response.status_code,
+                "message": f"HTTP {e.response.status_code}: {e.response.text[:500]}",
+            }, b""
+        except httpx.RequestError as e:
+            metrics.UPSTREAM_ERRORS.labels(path, type(e).__name__).inc()
+            return {"error": True, "message": f"Request Error: {str(e)}"}, b""
+        except Exception as e:
+            metrics.UPSTREAM_ERRORS.labels(path, type(e).__name__).inc()
+            return {"error": True, "message": f"Unexpected Error: {str(e)}"}, b""
+
+    async def _make_request(self, url: str, params: dict, priority: Priority = Priority.INTERACTIVE) -> dict:
+        return (await self._request(url, params, priority)).payload
+
+    async def _request(self, url: str, params: dict, priority: Priority = Priority.INTERACTIVE) -> CacheEntry:
+        """Cached, coalesced upstream call. The entry carries both the payload and the raw body."""
+        key = make_cache_key(url, params)
+        if self.cache is not None:
+            entry = self.cache.get(key)
+            if entry is not None:
+                if entry.is_fresh(time.monotonic()):
+                    self.cache.hits += 1
+                    metrics.CACHE_LOOKUPS.labels("hit").inc()
+                else:
+                    # Stale-while-revalidate: answer now, refresh behind the caller's back
+                    self.cache.stale_hits += 1
+                    metrics.CACHE_LOOKUPS.labels("stale").inc()
+                    if key not in self._inflight:
+                        self._flight(key, url, params, Priority.BACKGROUND)
+                return entry
+            self.cache.misses += 1
+            metrics.CACHE_LOOKUPS.labels("miss").inc()
+
+        # shield() so one caller disconnecting doesn't cancel the fetch for everyone else
+        return await asyncio.shield(self._flight(key, url, params, priority))
+
+    def _flight(
+        self, key: str, url: str, params: dict, priority: Priority, min_shared_ttl: float = 0.0,
+        max_shared_age: Optional[float] = None,
+    ) -> asyncio.Task:
+        """Join the in-flight upstream call for `key`, or originate one."""
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            metrics.COALESCING.labels("coalesced").inc()
+            return task
+        self.originated += 1
+        metrics.COALESCING.labels("originated").inc()
+        task = asyncio.create_task(
+            self._fetch_and_store(key, url, params, priority, min_shared_ttl, max_shared_age)
+        )
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return task
+
+    def stats(self) -> dict:
+        """Cache, request-coalescing and rate-limit counters."""
+        return {
+            "cache": self.cache.stats() if self.cache is not None else None,
+            "ttl_policy": ttl_policy.stats(),
+            "shared_cache": self.shared_cache.stats() if self.shared_cache is not None else None,
+            "entities": self.entities.stats() if self.entities is not None else None,
+            "rate_limit": self.scheduler.stats(),
+            "transport": self._transport.stats() if self._transport is not None else {"mode": "live"},
+            "coalescing": {
+                "originated": self.originated,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._inflight),
+            },
+        }
+
+    # ──────────────────────────────────────────────
+    # CACHE HELPERS
+    # ──────────────────────────────────────────────
+
+    async def _fetch_and_store(
+        self, key: str, url: str, params: dict, priority: Priority, min_shared_ttl: float = 0.0,
+        max_shared_age: Optional[float] = None,
+    ) -> CacheEntry:
+        if self.shared_cache is not None:
+            entry = await self._shared_entry(key, min_shared_ttl, max_shared_age)
+            if entry is not None:
+                return entry
+        try:
+            payload, body = await self._fetch_payload(url, params, priority)
+            decision = ttl_policy.decide(url, params, payload)
+            swr = settings.cache_stale_while_revalidate
+            entry = new_entry(
+                key, payload, body, decision.ttl, swr if self.cache is not None else 0.0,
+                decision.policy, decision.reason,
+            )
+            if not payload.get("error"):
+                if self.cache is not None:
+                    self.cache.put(entry)
+                if self.shared_cache is not None:
+                    await asyncio.to_thread(
+                        self.shared_cache.put, key, body, decision.ttl, swr, decision.policy, decision.reason
+                    )
+                if settings.store_enabled:
+                    await record_fetched_page(article_store, url, params, payload)
+            return entry
+        finally:
+            if self.shared_cache is not None:
+                await asyncio.to_thread(self.shared_cache.release, key)
+
+    async def _fetch_payload(self, url: str, params: dict, priority: Priority) -> tuple:
+        """(payload, raw body) from upstream — slim plus the entity cache where it can, else in full."""
+        payload, body = None, b""
+        if self.entities is not None and "/news/" in url:
+            payload, body = await self._fetch_slim(url, params, priority)
+        if payload is None:
+            payload, body = await self._fetch(url, params, priority)
+            if self.entities is not None:
+                self.entities.learn(payload)
+        return payload, body
+
+    async def _shared_entry(
+        self, key: str, min_ttl: float = 0.0, max_age: Optional[float] = None
+    ) -> Optional[CacheEntry]:
+        """A copy from another worker with more than `min_ttl` seconds of freshness left (and, with
+        `max_age`, fetched at most that many seconds ago) — waiting while
+        one of them fetches it — or None once this worker holds the fetch lease (or the wait ran out)
+        and should go upstream itself."""
+        deadline = time.monotonic() + settings.shared_cache_lease
+        while True:
+            found = await asyncio.to_thread(self.shared_cache.get, key)
+            if found is not None and found[1] > min_ttl and (max_age is None or found[3] - found[1] <= max_age):
+                body, ttl, servable, assigned, policy, reason = found
+                with phase("decode"):
+                    payload = orjson.loads(body)
+                if self.entities is not None:
+                    self.entities.learn(payload)
+                entry = new_entry(
+                    key, payload, body, ttl, servable - ttl if self.cache is not None else 0.0, policy, reason, assigned
+                )
+                if self.cache is not None:
+                    self.cache.put(entry)
+                metrics.CACHE_LOOKUPS.labels("shared").inc()
+                return entry
+            if time.monotonic() >= deadline:
+                return None
+            if await asyncio.to_thread(self.shared_cache.claim, key, settings.shared_cache_lease):
+                return None
+            await asyncio.sleep(0.05)
+
+    # ──────────────────────────────────────────────
+    # ENTITY CACHE — slim upstream includes, joined locally
+    # ──────────────────────────────────────────────
+
+    async def _fetch_slim(self, url: str, params: dict, priority: Priority) -> tuple:
+        """Fetch without the league/fixture includes and join them from the entity cache.
+        Returns (None, b"") when the cache can't answer, so the caller makes the full request."""
+        include = params.get("include")
+        slim = self.entities.slim_include(include)
+        if slim is None:
+            return None, b""
+        slim_params = {k: v for k, v in params.items() if k != "include"}
+        if slim:
+            slim_params["include"] = slim
+        payload, body = await self._fetch(url, slim_params, priority)
+        if payload.get("error") and self.mode == "replay":
+            # The recording may hold the full request instead (the entity cache was colder then)
+            return None, b""
+        if payload.get("error") or not isinstance(payload.get("data"), list):
+            return payload, body
+        missing = self.entities.missing_fixtures(payload["data"], include)
+        if missing:
+            await self._fetch_fixtures(missing, priority)
+            missing = self.entities.missing_fixtures(payload["data"], include)
+        if missing is None or missing:
+            self.entities.fallbacks += 1
+            return None, b""
+        self.entities.slim_fetches += 1
+        with phase("entity-join"):
+            joined = self.entities.join_payload(payload, include)
+            return joined, orjson.dumps(joined)
+
+    async def _fetch_fixtures(self, fixture_ids: set, priority: Priority):
+        """Bulk-load fixtures (with participants and league) into the entity cache, 50 ids per call."""
+        ids = sorted(fixture_ids)
+        for start in range(0, len(ids), 50):
+            chunk = ",".join(str(i) for i in ids[start:start + 50])
+            payload, _ = await self._fetch(
+                f"{self.base_url}/fixtures/multi/{chunk}",
+                {"api_token": self.api_token, "include": "participants;league"},
+                priority,
+            )
+            self.entities.bulk_fetches += 1
+            if payload.get("error"):
+                return
+            data = payload.get("data") or []
+            for fixture in data if isinstance(data, list) else [data]:
+                self.entities.learn_fixture(fixture)
 
     # ──────────────────────────────────────────────
     # NEWS ENDPOINTS (Pro plan — real data)
     # ──────────────────────────────────────────────
 
+    def news_key(self, path: str, include: str, order: str, per_page: int, page: int) -> tuple:
+        """(url, params, cache key) of a news request, as request_news would make it."""
+        url = f"{self.base_url}/{path}"
+        params = self._build_params(include, order, per_page, page)
+        return url, params, make_cache_key(url, params)
+
+    async def refresh(self, path: str, include: str, order: str, per_page: int, page: int,
+                      min_shared_ttl: float = 0.0, max_shared_age: Optional[float] = None) -> CacheEntry:
+        """Fetch a news page again even though it is cached (refresh-ahead, live polling). A copy another
+        worker refreshed with more than `min_shared_ttl` seconds left, and at most `max_shared_age`
+        seconds ago, is taken instead of calling upstream."""
+        url, params, key = self.news_key(path, include, order, per_page, page)
+        return await asyncio.shield(
+            self._flight(key, url, params, Priority.BACKGROUND, min_shared_ttl, max_shared_age)
+        )
+
+    async def fetch_uncached(
+        self, path: str, include: str, order: str, per_page: int, page: int, priority=Priority.BACKGROUND,
+        bypass: bool = False,
+    ) -> dict:
+        """A news page for a crawl or the store sync: a fresh cached copy or an in-flight fetch is
+        reused (never with `bypass` — the page comes straight from upstream), but a page fetched here
+        is not cached — hundreds of crawled pages would push out what readers use."""
+        url, params, key = self.news_key(path, include, order, per_page, page)
+        if self.cache is not None and not bypass:
+            entry = self.cache.peek(key)
+            if entry is not None and entry.is_fresh(time.monotonic()):
+                return entry.payload
+        task = None if bypass else self._inflight.get(key)
+        if task is not None:
+            return (await asyncio.shield(task)).payload
+        payload, _ = await self._fetch_payload(url, params, priority)
+        return payload
+
+    async def request_news(
+        self, path: str, include="fixture.participants;league;lines", order="desc", per_page=25, page=1,
+        priority=Priority.INTERACTIVE,
+    ) -> CacheEntry:
+        """GET any news path (e.g. `news/pre-match/upcoming`) — returns the entry with its raw body."""
+        url = f"{self.base_url}/{path}"
+        return await self._request(
+            url, self._build_params(include, order, per_page, page), priority
+        )
+
     async def get_pre_match_news(
-        self, include="fixture.participants;league;lines", order="desc", per_page=25, page=1
+        self, include="fixture.participants;league;lines", order="desc", per_page=25, page=1,
+        priority=Priority.INTERACTIVE,
     ):
         """GET Pre-Match News — all available pre-match articles."""
         url = f"{self.base_url}/news/pre-match"
         return await self._make_request(
-            url, self._build_params(include, order, per_page, page)
+            url, self._build_params(include, order, per_page, page), priority
         )
 
     async def get_pre_match_news_by_season(
-        self, season_id: int, include="fixture.participants;league;lines", order="desc", per_page=25, page=1
+        self, season_id: int, include="fixture.participants;league;lines", order="desc", per_page=25, page=1,
+        priority=Priority.INTERACTIVE,
     ):
         """GET Pre-Match News by Season ID."""
         url = f"{self.base_url}/news/pre-match/seasons/{season_id}"
         return await self._make_request(
-            url, self._build_params(include, order, per_page, page)
+            url, self._build_params(include, order, per_page, page), priority
         )
 
     async def get_pre_match_news_upcoming(
-        self, include="fixture.participants;league;lines", order="desc", per_page=25, page=1
+        self, include="fixture.participants;league;lines", order="desc", per_page=25, page=1,
+        priority=Priority.INTERACTIVE,
     ):
         """GET Pre-Match News for Upcoming Fixtures."""
         url = f"{self.base_url}/news/pre-match/upcoming"
         return await self._make_request(
-            url, self._build_params(include, order, per_page, page)
+            url, self._build_params(include, order, per_page, page), priority
         )
 
     async def get_post_match_news(
-        self, include="fixture.participants;league;lines", order="desc", per_page=25, page=1
+        self, include="fixture.participants;league;lines", order="desc", per_page=25, page=1,
+        priority=Priority.INTERACTIVE,
     ):
         """GET Post-Match News — all post-match articles."""
         url = f"{self.base_url}/news/post-match"
         return await self._make_request(
-            url, self._build_params(include, order, per_page, page)
+            url, self._build_params(include, order, per_page, page), priority
         )
 
     async def get_post_match_news_by_season(
-        self, season_id: int, include="fixture.participants;league;lines", order="desc", per_page=25, page=1
+        self, season_id: int, include="fixture.participants;league;lines", order="desc", per_page=25, page=1,
+        priority=Priority.INTERACTIVE,
     ):
         """GET Post-Match News by Season ID."""
         url = f"{self.base_url}/news/post-match/seasons/{season_id}"
         return await self._make_request(
-            url, self._build_params(include, order, per_page, page)
+            url, self._build_params(include, order, per_page, page), priority
         )
 
 
@@ -0,0 +1,784 @@
+"""
+Article Store Module.
+Local SQLite copy of SportMonks news: articles, fixtures, leagues, participants and lines.
+A background job syncs only what is newer than each feed's high-water mark,
+and `source=local` on the news routes answers straight from here — no upstream call.
+Titles and paragraph lines are also kept in an FTS5 index for /api/news/search, and every
+insert or real update bumps the article's version in a change log for /api/news/changes —
+whether the sync found it or a request fetched the feed page it is on.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Optional
+from urllib.parse import urlsplit
+
+from backend.config import settings
+from backend.services.merged_feed import with_next_cursor
+from backend.services.scheduler import Priority
+
+logger = logging.getLogger(__name__)
+
+FEEDS = ("pre-match", "post-match")
+# What the sync requests and the store keeps; fetched pages with other includes are not recorded
+STORE_INCLUDE = "fixture.participants;league;lines"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS leagues (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    image_path TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS participants (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    image_path TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS fixtures (
+    id INTEGER PRIMARY KEY,
+    league_id INTEGER,
+    season_id INTEGER,
+    name TEXT,
+    starting_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS fixture_participants (
+    fixture_id INTEGER NOT NULL,
+    participant_id INTEGER NOT NULL,
+    location TEXT,
+    PRIMARY KEY (fixture_id, participant_id)
+);
+CREATE TABLE IF NOT EXISTS articles (
+    feed TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    type TEXT,
+    title TEXT,
+    fixture_id INTEGER,
+    league_id INTEGER,
+    season_id INTEGER,
+    created_at TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (feed, id)
+);
+CREATE TABLE IF NOT EXISTS lines (
+    feed TEXT NOT NULL,
+    article_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    line TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (feed, article_id, position)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    feed TEXT PRIMARY KEY,
+    high_water_created_at TEXT,
+    high_water_id INTEGER,
+    synced_at TEXT
+);
+-- A sync that stopped (page cap, upstream error) before reaching back to the high-water mark:
+-- where the next run resumes, and the newest article seen so far (the mark once it catches up)
+CREATE TABLE IF NOT EXISTS sync_progress (
+    feed TEXT PRIMARY KEY,
+    next_page INTEGER NOT NULL,
+    newest_created_at TEXT,
+    newest_id INTEGER
+);
+-- Oldest article of the first sync's contiguous import: every article from here up to the high-water
+-- mark is stored. A NULL floor means that sync reached the end of the feed, so nothing older exists.
+CREATE TABLE IF NOT EXISTS sync_floor (
+    feed TEXT PRIMARY KEY,
+    floor_created_at TEXT,
+    floor_id INTEGER
+);
+CREATE TABLE IF NOT EXISTS changes (
+    version INTEGER PRIMARY KEY AUTOINCREMENT,
+    feed TEXT NOT NULL,
+    article_id INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    changed_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_articles_created ON articles (feed, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_articles_league ON articles (league_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_articles_fixture ON articles (fixture_id);
+CREATE INDEX IF NOT EXISTS idx_articles_season ON articles (feed, season_id, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_fixtures_starting ON fixtures (starting_at);
+CREATE INDEX IF NOT EXISTS idx_fixtures_league ON fixtures (league_id);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_changes_article ON changes (feed, article_id);
+CREATE INDEX IF NOT EXISTS idx_changes_feed ON changes (feed, version);
+CREATE INDEX IF NOT EXISTS idx_changes_time ON changes (changed_at);
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5 (
+    title,
+    body,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+);
+"""
+
+# Full-text index rows share the article's rowid, so re-indexing one article is a point delete
+REINDEX_SQL = """
+INSERT INTO articles_fts (rowid, title, body)
+SELECT a.rowid, COALESCE(a.title, ''),
+       COALESCE((SELECT group_concat(line, char(10)) FROM (
+           SELECT line FROM lines l WHERE l.feed = a.feed AND l.article_id = a.id ORDER BY position
+       )), '')
+FROM articles a
+"""
+
+# Databases created before the change log existed start it with every stored article. The empty
+# digest never matches, so the next sync of an article logs it once more with its real digest.
+BACKFILL_CHANGES_SQL = """
+INSERT INTO changes (feed, article_id, digest, changed_at)
+SELECT feed, id, '', ? FROM articles ORDER BY created_at, id
+"""
+
+# Title matches count ten times a body match in the BM25 ranking
+SEARCH_WEIGHTS = (10.0, 1.0)
+
+# Keys SportMonks embeds through `include` — stored in their own tables, not on the article row
+EMBEDDED_KEYS = ("fixture", "league", "lines")
+
+
+def parse_includes(include: Optional[str]) -> set:
+    parts = {p.strip() for p in str(include or "").split(";") if p.strip()}
+    if "fixture.participants" in parts:
+        parts.add("fixture")
+    return parts
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _now() -> str:
+    # Same format as SportMonks timestamps, so change times compare as strings
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def article_digest(article: dict) -> str:
+    raw = json.dumps(article, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode()
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+class ArticleStore:
+    """SQLite (WAL) article store. Blocking methods — call them through asyncio.to_thread."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._initialized = False
+
+    # ──────────────────────────────────────────────
+    # CONNECTIONS
+    # ──────────────────────────────────────────────
+
+    def _conn(self) -> sqlite3.Connection:
+        # One connection per thread: WAL lets readers proceed while the sync job writes
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            if os.path.dirname(self.path):
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        if not self._initialized:
+            with self._write_lock:
+                conn.executescript(SCHEMA)
+                # Databases created before the search index existed get a one-off backfill
+                if conn.execute("SELECT 1 FROM articles_fts LIMIT 1").fetchone() is None:
+                    with conn:
+                        conn.execute(REINDEX_SQL)
+                if conn.execute("SELECT 1 FROM changes LIMIT 1").fetchone() is None:
+                    with conn:
+                        conn.execute(BACKFILL_CHANGES_SQL, (_now(),))
+                self._initialized = True
+        return conn
+
+    # ──────────────────────────────────────────────
+    # WRITES
+    # ──────────────────────────────────────────────
+
+    def upsert_articles(self, feed: str, articles: list) -> int:
+        """Insert or update articles plus their embedded fixture, league, participants and lines.
+        Articles identical to the stored copy are skipped; returns how many were inserted or changed."""
+        conn = self._conn()
+        count = 0
+        changed_at = _now()
+        with self._write_lock, conn:
+            for article in articles:
+                if not isinstance(article, dict) or article.get("id") is None:
+                    continue
+                digest = article_digest(article)
+                row = conn.execute(
+                    "SELECT digest FROM changes WHERE feed = ? AND article_id = ?", (feed, article["id"])
+                ).fetchone()
+                if row is not None and row["digest"] == digest:
+                    continue
+                self._upsert_article(conn, feed, article)
+                # REPLACE drops the article's previous entry: the log holds each article once, at its latest version
+                conn.execute(
+                    "INSERT OR REPLACE INTO changes (feed, article_id, digest, changed_at) VALUES (?, ?, ?, ?)",
+                    (feed, article["id"], digest, changed_at),
+                )
+                count += 1
+        return count
+
+    def _upsert_article(self, conn: sqlite3.Connection, feed: str, article: dict):
+        league = article.get("league") if isinstance(article.get("league"), dict) else None
+        fixture = article.get("fixture") if isinstance(article.get("fixture"), dict) else None
+        lines = article.get("lines") if isinstance(article.get("lines"), list) else None
+
+        if league and league.get("id") is not None:
+            conn.execute(
+                "INSERT INTO leagues (id, name, image_path, data) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET name=excluded.name, image_path=excluded.image_path, data=excluded.data",
+                (league["id"], league.get("name"), league.get("image_path"), _dumps(league)),
+            )
+
+        season_id = article.get("season_id")
+        if fixture and fixture.get("id") is not None:
+            participants = fixture.get("participants") if isinstance(fixture.get("participants"), list) else None
+            fixture_row = {k: v for k, v in fixture.items() if k != "participants"}
+            season_id = season_id or fixture.get("season_id")
+            conn.execute(
+                "INSERT INTO fixtures (id, league_id, season_id, name, starting_at, data) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET league_id=excluded.league_id, season_id=excluded.season_id, "
+                "name=excluded.name, starting_at=excluded.starting_at, data=excluded.data",
+                (fixture["id"], fixture.get("league_id"), fixture.get("season_id"), fixture.get("name"),
+                 fixture.get("starting_at"), _dumps(fixture_row)),
+            )
+            for participant in participants or []:
+                if not isinstance(participant, dict) or participant.get("id") is None:
+                    continue
+                meta = participant.get("meta") or {}
+                team = {k: v for k, v in participant.items() if k != "meta"}
+                conn.execute(
+                    "INSERT INTO participants (id, name, image_path, data) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(id) DO UPDATE SET name=excluded.name, image_path=excluded.image_path, data=excluded.data",
+                    (team["id"], team.get("name"), team.get("image_path"), _dumps(team)),
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO fixture_participants (fixture_id, participant_id, location) VALUES (?, ?, ?)",
+                    (fixture["id"], team["id"], meta.get("location")),
+                )
+
+        row = {k: v for k, v in article.items() if k not in EMBEDDED_KEYS}
+        conn.execute(
+            "INSERT INTO articles (feed, id, type, title, fixture_id, league_id, season_id, created_at, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(feed, id) DO UPDATE SET type=excluded.type, title=excluded.title, "
+            "fixture_id=excluded.fixture_id, league_id=excluded.league_id, "
+            "season_id=COALESCE(excluded.season_id, articles.season_id), "
+            "created_at=excluded.created_at, data=excluded.data",
+            (feed, article["id"], article.get("type"), article.get("title"),
+             article.get("fixture_id", (fixture or {}).get("id")), article.get("league_id", (league or {}).get("id")),
+             season_id, article.get("created_at"), _dumps(row)),
+        )
+
+        if lines is not None:
+            conn.execute("DELETE FROM lines WHERE feed = ? AND article_id = ?", (feed, article["id"]))
+            conn.executemany(
+                "INSERT INTO lines (feed, article_id, position, line, data) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (feed, article["id"], position,
+                     line.get("line") if isinstance(line, dict) else str(line),
+                     _dumps(line))
+                    for position, line in enumerate(lines)
+                ],
+            )
+
+        rowid = conn.execute(
+            "SELECT rowid FROM articles WHERE feed = ? AND id = ?", (feed, article["id"])
+        ).fetchone()[0]
+        conn.execute("DELETE FROM articles_fts WHERE rowid = ?", (rowid,))
+        conn.execute(REINDEX_SQL + " WHERE a.rowid = ?", (rowid,))
+
+    def high_water(self, feed: str) -> Optional[tuple]:
+        row = self._conn().execute(
+            "SELECT high_water_created_at, high_water_id FROM sync_state WHERE feed = ?", (feed,)
+        ).fetchone()
+        if row is None or row["high_water_created_at"] is None:
+            return None
+        return (row["high_water_created_at"], row["high_water_id"])
+
+    def sync_progress(self, feed: str) -> Optional[tuple]:
+        """(next page, newest (created_at, id) seen) of an unfinished catch-up sync, or None."""
+        row = self._conn().execute(
+            "SELECT next_page, newest_created_at, newest_id FROM sync_progress WHERE feed = ?", (feed,)
+        ).fetchone()
+        if row is None:
+            return None
+        newest = (row["newest_created_at"], row["newest_id"]) if row["newest_created_at"] is not None else None
+        return row["next_page"], newest
+
+    def set_sync_progress(self, feed: str, next_page: int, newest: Optional[tuple]):
+        conn = self._conn()
+        with self._write_lock, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO sync_progress (feed, next_page, newest_created_at, newest_id) VALUES (?, ?, ?, ?)",
+                (feed, next_page, *(newest or (None, None))),
+            )
+
+    def sync_floor(self, feed: str) -> tuple:
+        """(recorded, floor): whether the first sync recorded how deep it imported, and the oldest
+        (created_at, id) it reached — None when it reached the end of the feed."""
+        row = self._conn().execute(
+            "SELECT floor_created_at, floor_id FROM sync_floor WHERE feed = ?", (feed,)
+        ).fetchone()
+        if row is None:
+            return False, None
+        return True, (row["floor_created_at"], row["floor_id"]) if row["floor_created_at"] is not None else None
+
+    def set_sync_floor(self, feed: str, floor: Optional[tuple]):
+        conn = self._conn()
+        with self._write_lock, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO sync_floor (feed, floor_created_at, floor_id) VALUES (?, ?, ?)",
+                (feed, *(floor or (None, None))),
+            )
+
+    def coverage(self, feeds: tuple) -> Optional[tuple]:
+        """(low, high) keys between which the store holds every article of `feeds` — low None when it
+        reaches back to their first articles — or None while some feed has no fully synced range.
+        Articles above `high` or below `low` may be stored too (record_page), but with gaps."""
+        low, high = None, None
+        for feed in feeds:
+            mark = self.high_water(feed)
+            recorded, floor = self.sync_floor(feed)
+            if mark is None or not recorded:
+                return None
+            high = tuple(mark) if high is None else min(high, tuple(mark))
+            if floor is not None:
+                low = tuple(floor) if low is None else max(low, tuple(floor))
+        if low is not None and high is not None and low > high:
+            return None
+        return low, high
+
+    def covered_page(
+        self, feeds: tuple, include: Optional[str], order: str, per_page: int, after: tuple
+    ) -> Optional[tuple]:
+        """The keyset page after `after` if the store fully holds it, as (payload, articles per feed);
+        None when it would run into a gap, so the caller pages upstream instead. `has_more` is only
+        False where the store is known to reach the end of the feed."""
+        coverage = self.coverage(feeds)
+        if coverage is None:
+            return None
+        low, high = coverage
+        after = tuple(after)
+        if after > high or (low is not None and after < low):
+            return None
+        conn = self._conn()
+        direction = "ASC" if order == "asc" else "DESC"
+        per_page = max(1, int(per_page or 25))
+        where = [f"a.feed IN ({','.join('?' * len(feeds))})",
+                 f"(a.created_at, a.id) {'>' if direction == 'ASC' else '<'} (?, ?)"]
+        args: list = [*feeds, *after]
+        if direction == "ASC":
+            where.append("(a.created_at, a.id) <= (?, ?)")
+            args.extend(high)
+        elif low is not None:
+            where.append("(a.created_at, a.id) >= (?, ?)")
+            args.extend(low)
+        rows = conn.execute(
+            f"SELECT a.feed, a.data FROM articles a WHERE {' AND '.join(where)} "
+            f"ORDER BY a.created_at {direction}, a.id {direction} LIMIT ?",
+            args + [per_page + 1],
+        ).fetchall()
+        # Only a descending walk over a feed imported back to its first article can end in the store
+        ends_here = direction == "DESC" and low is None
+        if len(rows) > per_page:
+            has_more = True
+        elif len(rows) == per_page:
+            has_more = not ends_here
+        elif ends_here:
+            has_more = False
+        else:
+            return None
+        rows = rows[:per_page]
+        counts = {feed: sum(1 for row in rows if row["feed"] == feed) for feed in feeds}
+        payload = {
+            "data": self._hydrate(conn, rows, parse_includes(include)),
+            "pagination": {"count": len(rows), "per_page": per_page, "has_more": has_more},
+            "source": "local",
+        }
+        return payload, counts
+
+    def set_high_water(self, feed: str, mark: tuple):
+        """Move the mark (the sync has caught up with it) and drop any unfinished catch-up."""
+        conn = self._conn()
+        with self._write_lock, conn:
+            conn.execute("DELETE FROM sync_progress WHERE feed = ?", (feed,))
+            conn.execute(
+                "INSERT INTO sync_state (feed, high_water_created_at, high_water_id, synced_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(feed) DO UPDATE SET high_water_created_at=excluded.high_water_created_at, "
+                "high_water_id=excluded.high_water_id, synced_at=excluded.synced_at",
+                (feed, mark[0], mark[1], datetime.now(timezone.utc).isoformat()),
+            )
+
+    # ──────────────────────────────────────────────
+    # READS
+    # ──────────────────────────────────────────────
+
+    def query_articles(
+        self,
+        feeds: tuple,
+        include: Optional[str] = None,
+        order: str = "desc",
+        per_page: int = 25,
+        page: int = 1,
+        season_id: Optional[int] = None,
+        upcoming: bool = False,
+        after: Optional[tuple] = None,
+    ) -> dict:
+        """Answer a news request from the store, in the same shape SportMonks returns.
+        With `after` = (created_at, id) it is a keyset page: an index seek, as cheap at depth as page 1."""
+        conn = self._conn()
+        direction = "ASC" if order == "asc" else "DESC"
+        per_page = max(1, int(per_page or 25))
+        page = max(1, int(page or 1))
+
+        where = [f"a.feed IN ({','.join('?' * len(feeds))})"]
+        args: list = list(feeds)
+        if season_id is not None:
+            where.append("a.season_id = ?")
+            args.append(season_id)
+        join = ""
+        if upcoming:
+            join = "JOIN fixtures f ON f.id = a.fixture_id"
+            where.append("f.starting_at >= ?")
+            args.append(datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"))
+        offset = (page - 1) * per_page
+        if after is not None:
+            where.append(f"(a.created_at, a.id) {'>' if direction == 'ASC' else '<'} (?, ?)")
+            args.extend(after)
+            offset = 0
+
+        rows = conn.execute(
+            f"SELECT a.feed, a.data FROM articles a {join} WHERE {' AND '.join(where)} "
+            f"ORDER BY a.created_at {direction}, a.id {direction} LIMIT ? OFFSET ?",
+            args + [per_page + 1, offset],
+        ).fetchall()
+        has_more = len(rows) > per_page
+        rows = rows[:per_page]
+        return with_next_cursor({
+            "data": self._hydrate(conn, rows, parse_includes(include)),
+            "pagination": {"count": len(rows), "per_page": per_page, "current_page": page, "has_more": has_more},
+            "source": "local",
+        }, direction.lower())
+
+    def _hydrate(self, conn: sqlite3.Connection, rows: list, includes: set) -> list:
+        """Re-attach requested includes, batching each related table into one IN query."""
+        articles = [(row["feed"], json.loads(row["data"])) for row in rows]
+        if not articles:
+            return []
+
+        def fetch_map(sql: str, ids: set) -> dict:
+            ids = [i for i in ids if i is not None]
+            if not ids:
+                return {}
+            return {r[0]: r for r in conn.execute(sql.format(",".join("?" * len(ids))), ids)}
+
+        leagues: dict = {}
+        fixtures: dict = {}
+        participants_by_fixture: dict = {}
+        lines_by_article: dict = {}
+
+        if "league" in includes:
+            leagues = {k: json.loads(r["data"]) for k, r in fetch_map(
+                "SELECT id, data FROM leagues WHERE id IN ({})", {a.get("league_id") for _, a in articles}
+            ).items()}
+        if "fixture" in includes:
+            fixtures = {k: json.loads(r["data"]) for k, r in fetch_map(
+                "SELECT id, data FROM fixtures WHERE id IN ({})", {a.get("fixture_id") for _, a in articles}
+            ).items()}
+        if "fixture.participants" in includes and fixtures:
+            ids = list(fixtures)
+            for r in conn.execute(
+                f"SELECT fp.fixture_id, fp.location, p.data FROM fixture_participants fp "
+                f"JOIN participants p ON p.id = fp.participant_id WHERE fp.fixture_id IN ({','.join('?' * len(ids))}) "
+                f"ORDER BY fp.fixture_id, fp.location DESC",
+                ids,
+            ):
+                team = json.loads(r["data"])
+                team["meta"] = {"location": r["location"]}
+                participants_by_fixture.setdefault(r["fixture_id"], []).append(team)
+        if "lines" in includes:
+            for feed in {f for f, _ in articles}:
+                ids = [a["id"] for f, a in articles if f == feed]
+                for r in conn.execute(
+                    f"SELECT article_id, data FROM lines WHERE feed = ? AND article_id IN ({','.join('?' * len(ids))}) "
+                    f"ORDER BY article_id, position",
+                    [feed] + ids,
+                ):
+                    lines_by_article.setdefault((feed, r["article_id"]), []).append(json.loads(r["data"]))
+
+        result = []
+        for feed, article in articles:
+            if "league" in includes:
+                article["league"] = leagues.get(article.get("league_id"))
+            if "fixture" in includes:
+                fixture = fixtures.get(article.get("fixture_id"))
+                if fixture is not None and "fixture.participants" in includes:
+                    fixture = {**fixture, "participants": participants_by_fixture.get(fixture["id"], [])}
+                article["fixture"] = fixture
+            if "lines" in includes:
+                article["lines"] = lines_by_article.get((feed, article["id"]), [])
+            result.append(article)
+        return result
+
+    def changes(
+        self,
+        feeds: tuple = FEEDS,
+        since_version: Optional[int] = None,
+        since_time: Optional[str] = None,
+        include: Optional[str] = None,
+        limit: int = 100,
+    ) -> dict:
+        """Articles inserted or changed after a version (or a "YYYY-MM-DD HH:MM:SS" UTC time), oldest
+        change first, plus the version to pass next time. With neither, just the current version."""
+        conn = self._conn()
+        limit = max(1, int(limit or 100))
+        # Read first: anything committed after this is left for the next call, never skipped
+        current = conn.execute("SELECT COALESCE(MAX(version), 0) FROM changes").fetchone()[0]
+        if since_version is None and since_time is None:
+            return {"data": [], "version": current, "count": 0, "has_more": False, "source": "local"}
+
+        where = [f"c.feed IN ({','.join('?' * len(feeds))})", "c.version <= ?"]
+        args: list = [*feeds, current]
+        if since_version is not None:
+            where.append("c.version > ?")
+            args.append(since_version)
+        else:
+            where.append("c.changed_at > ?")
+            args.append(since_time)
+        rows = conn.execute(
+            f"SELECT c.version, a.feed, a.data FROM changes c "
+            f"JOIN articles a ON a.feed = c.feed AND a.id = c.article_id "
+            f"WHERE {' AND '.join(where)} ORDER BY c.version LIMIT ?",
+            args + [limit + 1],
+        ).fetchall()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        return {
+            "data": self._hydrate(conn, rows, parse_includes(include)),
+            # A full batch resumes after its last change; otherwise the client is caught up
+            "version": rows[-1]["version"] if has_more else current,
+            "count": len(rows),
+            "has_more": has_more,
+            "source": "local",
+        }
+
+    def search(
+        self,
+        query: str,
+        feeds: tuple = FEEDS,
+        include: Optional[str] = None,
+        per_page: int = 25,
+        page: int = 1,
+    ) -> dict:
+        """BM25-ranked full-text search over titles and lines, with highlighted matches."""
+        conn = self._conn()
+        match = build_fts_query(query)
+        per_page = max(1, int(per_page or 25))
+        page = max(1, int(page or 1))
+        started = time.perf_counter()
+        rows = conn.execute(
+            f"SELECT a.feed, a.data, bm25(articles_fts, ?, ?) AS score, "
+            f"highlight(articles_fts, 0, '<mark>', '</mark>') AS title_highlight, "
+            f"snippet(articles_fts, 1, '<mark>', '</mark>', '…', 24) AS snippet "
+            f"FROM articles_fts JOIN articles a ON a.rowid = articles_fts.rowid "
+            f"WHERE articles_fts MATCH ? AND a.feed IN ({','.join('?' * len(feeds))}) "
+            f"ORDER BY score LIMIT ? OFFSET ?",
+            [*SEARCH_WEIGHTS, match, *feeds, per_page + 1, (page - 1) * per_page],
+        ).fetchall()
+        has_more = len(rows) > per_page
+        rows = rows[:per_page]
+        articles = self._hydrate(conn, rows, parse_includes(include))
+        for article, row in zip(articles, rows):
+            article["search"] = {
+                "score": round(-row["score"], 4),
+                "title_highlight": row["title_highlight"],
+                "snippet": row["snippet"],
+            }
+        return {
+            "data": articles,
+            "pagination": {"count": len(rows), "per_page": per_page, "current_page": page, "has_more": has_more},
+            "query": match,
+            "took_ms": round((time.perf_counter() - started) * 1000, 2),
+            "source": "local",
+        }
+
+    def load_entities(self, max_fixtures: int) -> dict:
+        """Leagues and the most recent fixtures with their participants — warm start for the entity cache."""
+        conn = self._conn()
+        leagues = [json.loads(r["data"]) for r in conn.execute("SELECT data FROM leagues")]
+        fixtures = {
+            r["id"]: json.loads(r["data"])
+            for r in conn.execute(
+                "SELECT id, data FROM fixtures ORDER BY starting_at DESC LIMIT ?", (max_fixtures,)
+            )
+        }
+        if fixtures:
+            for r in conn.execute(
+                "SELECT fp.fixture_id, fp.location, p.data FROM fixture_participants fp "
+                "JOIN participants p ON p.id = fp.participant_id "
+                "ORDER BY fp.fixture_id, fp.location DESC"
+            ):
+                fixture = fixtures.get(r["fixture_id"])
+                if fixture is not None:
+                    fixture.setdefault("participants", []).append({**json.loads(r["data"]), "meta": {"location": r["location"]}})
+        return {"leagues": leagues, "fixtures": list(fixtures.values())}
+
+    def stats(self) -> dict:
+        conn = self._conn()
+        counts = {
+            table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ("articles", "fixtures", "leagues", "participants", "lines")
+        }
+        counts["high_water"] = {feed: self.high_water(feed) for feed in FEEDS}
+        counts["sync_progress"] = {feed: self.sync_progress(feed) for feed in FEEDS}
+        counts["sync_floor"] = {feed: self.sync_floor(feed)[1] for feed in FEEDS}
+        counts["version"] = conn.execute("SELECT COALESCE(MAX(version), 0) FROM changes").fetchone()[0]
+        return counts
+
+
+# ──────────────────────────────────────────────
+# SEARCH QUERY PARSING
+# ──────────────────────────────────────────────
+
+_QUERY_TOKEN = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def build_fts_query(text: str) -> str:
+    """
+    Turn user input into a safe FTS5 MATCH expression.
+
+    `"exact phrase"` stays a phrase, `word*` is a prefix match and everything else
+    is a quoted term — so FTS5 operators and punctuation in user input can't break the query.
+    Terms are ANDed together.
+    """
+    terms = []
+    for phrase, word in _QUERY_TOKEN.findall(text or ""):
+        if phrase.strip():
+            terms.append('"' + phrase.strip().replace('"', '""') + '"')
+            continue
+        prefix = word.endswith("*")
+        word = re.sub(r"[^\w]+", " ", word).strip()
+        if not word:
+            continue
+        term = '"' + word + '"'
+        terms.append(term + "*" if prefix else term)
+    if not terms:
+        raise ValueError("Search query is empty")
+    return " ".join(terms)
+
+
+# ──────────────────────────────────────────────
+# INCREMENTAL SYNC
+# ──────────────────────────────────────────────
+
+async def sync_feed(service, store: ArticleStore, feed: str) -> int:
+    """Pull pages newest-first until we reach what the store already has. Returns articles upserted.
+
+    The high-water mark only moves once a run reaches back past it (or, on the first sync, after the
+    initial pages). A run that hits the page cap or an upstream error first records where it stopped,
+    and the next run carries on from there — new articles only push older ones to later pages, so
+    resuming by page number can repeat articles but never skip them."""
+    path = f"news/{feed}"
+    mark = await asyncio.to_thread(store.high_water, feed)
+    progress = await asyncio.to_thread(store.sync_progress, feed) if mark else None
+    start, newest = progress if progress else (1, mark)
+    max_pages = settings.store_sync_max_pages if mark else settings.store_sync_initial_pages
+    upserted = 0
+    caught_up = False
+    ended = False
+    oldest = None
+    page = start
+
+    for page in range(start, start + max_pages):
+        # Past the response cache: a page served stale (or older than its neighbours) could move the
+        # mark past articles this run never saw where they now are
+        payload = await service.fetch_uncached(path, STORE_INCLUDE, "desc", 50, page, Priority.BACKGROUND, bypass=True)
+        if payload.get("error"):
+            break
+        data = [a for a in payload.get("data") or [] if isinstance(a, dict)]
+        fresh = [a for a in data if mark is None or (a.get("created_at") or "", a.get("id") or 0) > tuple(mark)]
+        # Older articles on the page go in too: unchanged ones are skipped, edited ones reach the change log
+        url, params, _ = service.news_key(path, STORE_INCLUDE, "desc", 50, page)
+        upserted += await record_page(store, url, params, payload)
+        if fresh:
+            top = max((a.get("created_at") or "", a.get("id") or 0) for a in fresh)
+            newest = top if newest is None or top > tuple(newest) else newest
+        if data:
+            bottom = min((a.get("created_at") or "", a.get("id") or 0) for a in data)
+            oldest = bottom if oldest is None or bottom < oldest else oldest
+        # Stop once a page reaches back past the high-water mark, or the feed ends
+        ended = not data or not (payload.get("pagination") or {}).get("has_more")
+        if len(fresh) < len(data) or ended:
+            caught_up = True
+            break
+    else:
+        # The first sync imports a bounded history on purpose — its cap counts as caught up
+        caught_up = mark is None
+        page += 1
+
+    if caught_up:
+        if mark is None and newest is not None:
+            # The first import is contiguous: cursor walks may read the store down to its oldest article
+            await asyncio.to_thread(store.set_sync_floor, feed, None if ended else oldest)
+        if newest is not None and (newest != mark or progress):
+            await asyncio.to_thread(store.set_high_water, feed, newest)
+    elif mark is not None:
+        await asyncio.to_thread(store.set_sync_progress, feed, page, newest)
+        logger.info("Store sync of %s stopped at page %d before reaching its high-water mark", feed, page)
+    return upserted
+
+
+async def record_page(store: ArticleStore, url: str, params: dict, payload: dict) -> int:
+    """Upsert the articles of a feed page fetched upstream, so the change log sees them as soon as
+    anyone fetches the page. Other paths and includes are ignored; store errors propagate."""
+    feed = urlsplit(url).path.rstrip("/").rsplit("/news/", 1)[-1]
+    if (
+        feed not in FEEDS or payload.get("error") or not isinstance(payload.get("data"), list)
+        or parse_includes(params.get("include")) != parse_includes(STORE_INCLUDE)
+    ):
+        return 0
+    return await asyncio.to_thread(store.upsert_articles, feed, payload["data"])
+
+
+async def record_fetched_page(store: ArticleStore, url: str, params: dict, payload: dict) -> int:
+    """record_page for pages fetched for a request — instead of at the next sync."""
+    try:
+        return await record_page(store, url, params, payload)
+    except Exception as e:
+        # The page is served either way; the next sync records what this missed
+        logger.warning("Recording a fetched page of %s in the store failed: %s", url, e)
+        return 0
+
+
+async def run_sync_loop(service, store: ArticleStore, interval: float):
+    """Background task started from the app lifespan."""
+    while True:
+        started = time.monotonic()
+        for feed in FEEDS:
+            try:
+                await sync_feed(service, store, feed)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Store sync of %s failed: %s", feed, e)
+        await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+
+article_store = ArticleStore(settings.store_path)
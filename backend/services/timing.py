@@ -0,0 +1,147 @@
+"""
+Request Timing Module.
+Phase timings (upstream queue, upstream, decode, transform, serialize, compress, …) recorded
+per request and sent back as a `Server-Timing` header, plus an opt-in sampling profiler
+that writes one request's stacks in collapsed (flamegraph.pl / speedscope) format.
+"""
+
+import asyncio
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import nullcontext
+from contextvars import ContextVar
+from typing import Optional
+
+_timings: ContextVar[Optional[list]] = ContextVar("timings", default=None)
+_NOOP = nullcontext()
+
+
+class _Phase:
+    __slots__ = ("timings", "name", "started")
+
+    def __init__(self, timings: list, name: str):
+        self.timings = timings
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.timings.append((self.name, time.perf_counter() - self.started))
+
+
+def phase(name: str):
+    """`with phase("decode"): ...` — a no-op unless the current request is being timed."""
+    timings = _timings.get()
+    if timings is None:
+        return _NOOP
+    return _Phase(timings, name)
+
+
+def server_timing_header(timings: list, total: float) -> str:
+    # Phases repeat (two upstream pages, say) — report each name once, summed
+    totals: dict = {}
+    for name, seconds in timings:
+        totals[name] = totals.get(name, 0.0) + seconds
+    entries = [f"{name};dur={seconds * 1000:.2f}" for name, seconds in totals.items()]
+    entries.append(f"total;dur={total * 1000:.2f}")
+    return ", ".join(entries)
+
+
+# ──────────────────────────────────────────────
+# SAMPLING PROFILER
+# ──────────────────────────────────────────────
+
+class StackSampler:
+    """Samples one thread's Python stack every `interval` seconds from a helper thread."""
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                frame = frame.f_back
+            if stack:
+                self.samples[";".join(reversed(stack))] += 1
+
+    def collapsed(self) -> str:
+        """One `frame;frame;frame count` line per distinct stack."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+
+def _write_profile(path: str, text: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+class ServerTimingMiddleware:
+    """Pure ASGI middleware: Server-Timing on every HTTP response, profiling on request."""
+
+    def __init__(self, app, profiling: bool = False, profile_dir: str = "data/profiles", interval: float = 0.005):
+        self.app = app
+        self.profiling = profiling
+        self.profile_dir = profile_dir
+        self.interval = interval
+
+    def _wants_profile(self, scope) -> bool:
+        if not self.profiling:
+            return False
+        if re.search(rb"(^|&)profile=(1|true)(&|$)", scope.get("query_string", b"")):
+            return True
+        return any(name == b"x-profile" and value in (b"1", b"true") for name, value in scope["headers"])
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        timings: list = []
+        token = _timings.set(timings)
+        started = time.perf_counter()
+        sampler = profile_name = None
+        if self._wants_profile(scope):
+            # The event loop thread runs this request's code (and, caveat, any request sharing the loop)
+            sampler = StackSampler(threading.get_ident(), self.interval)
+            slug = scope["path"].strip("/").replace("/", "_") or "root"
+            profile_name = f"{time.strftime('%Y%m%d-%H%M%S')}-{slug}-{os.getpid()}.collapsed"
+            sampler.start()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                value = server_timing_header(timings, time.perf_counter() - started)
+                headers.append((b"server-timing", value.encode("latin-1")))
+                if profile_name:
+                    headers.append((b"x-profile", profile_name.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _timings.reset(token)
+            if sampler is not None:
+                sampler.stop()
+                await asyncio.to_thread(
+                    _write_profile, os.path.join(self.profile_dir, profile_name), sampler.collapsed()
+                )
@@ -0,0 +1,132 @@
+"""
+TTL Policy Module.
+Picks the TTL of each cached news page from what it contains instead of its endpoint alone: pages
+with a fixture about to kick off (or in play) expire within seconds, quiet pages stretch with the
+time since their newest article, and finished season archives are kept for weeks.
+"""
+
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+from urllib.parse import urlsplit
+
+from backend.config import settings
+from backend.services.cache import ttl_for_url
+
+POLICIES = ("default", "kickoff", "live", "upcoming", "quiet", "archive")
+
+# Feed paths whose first-page activity is remembered (one per feed and season — a handful in practice)
+MAX_TRACKED_FEEDS = 4096
+
+
+@dataclass(frozen=True)
+class TtlDecision:
+    ttl: float
+    policy: str
+    reason: str
+
+
+def parse_time(value) -> Optional[float]:
+    """A SportMonks timestamp ("2024-10-05 15:00:00", UTC) or ISO-8601 string as epoch seconds."""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+def span(seconds: float) -> str:
+    """Short human duration for reasons: 40s, 25m, 3h, 12d."""
+    seconds = abs(seconds)
+    for unit, size in (("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds >= size:
+            return f"{seconds / size:.0f}{unit}"
+    return f"{seconds:.0f}s"
+
+
+def page_times(data: list) -> tuple:
+    """(kick-off times of the page's fixtures, newest article created_at) as epoch seconds."""
+    kickoffs, newest = [], None
+    for article in data:
+        if not isinstance(article, dict):
+            continue
+        fixture = article.get("fixture") or {}
+        kickoff = fixture.get("starting_at_timestamp") or parse_time(fixture.get("starting_at"))
+        if kickoff:
+            kickoffs.append(float(kickoff))
+        created = parse_time(article.get("created_at"))
+        if created is not None and (newest is None or created > newest):
+            newest = created
+    return kickoffs, newest
+
+
+class TtlPolicy:
+    """Adaptive TTLs for news responses; anything else keeps its per-endpoint TTL from ttl_for_url."""
+
+    def __init__(self, config=settings):
+        self.config = config
+        # news path -> newest created_at seen on its first page (desc). Later pages and ascending
+        # pages hold older articles and can't tell by themselves whether the feed is still active.
+        self._activity: dict = {}
+        self.decisions = {policy: 0 for policy in POLICIES}
+
+    def decide(self, url: str, params: dict, payload: dict, now: Optional[float] = None) -> TtlDecision:
+        decision = self._decide(url, params, payload, time.time() if now is None else now)
+        self.decisions[decision.policy] += 1
+        return decision
+
+    def _decide(self, url: str, params: dict, payload: dict, now: float) -> TtlDecision:
+        config = self.config
+        base = ttl_for_url(url)
+        path = urlsplit(url).path.rstrip("/")
+        data = payload.get("data")
+        if not config.cache_adaptive_ttl or payload.get("error") or "/news/" not in path or not isinstance(data, list):
+            return TtlDecision(base, "default", "endpoint default")
+
+        kickoffs, newest = page_times(data)
+        first_page = int(params.get("page") or 1) == 1 and str(params.get("order") or "desc").lower() == "desc"
+        if first_page and newest is not None:
+            self._remember(path, newest)
+        activity = newest if first_page else self._activity.get(path)
+
+        ahead = min((k - now for k in kickoffs if k >= now), default=None)
+        since = min((now - k for k in kickoffs if k < now), default=None)
+        if ahead is not None and ahead <= config.cache_kickoff_window:
+            return TtlDecision(min(base, config.cache_ttl_kickoff), "kickoff", f"kick-off in {span(ahead)}")
+        if since is not None and since <= config.cache_live_window:
+            return TtlDecision(min(base, config.cache_ttl_kickoff), "live", f"kicked off {span(since)} ago")
+        if path.endswith("/upcoming"):
+            return TtlDecision(base, "upcoming", "fixtures join the upcoming list as they are scheduled")
+
+        if activity is None:
+            return TtlDecision(base, "default", "endpoint default (feed activity not seen yet)")
+
+        idle = max(0.0, now - activity)
+        if "/seasons/" in path and ahead is None and idle >= config.cache_archive_after:
+            return TtlDecision(
+                max(base, config.cache_ttl_archive), "archive", f"season archive, newest article {span(idle)} old"
+            )
+        horizon = idle if ahead is None else min(idle, ahead)
+        ttl = min(config.cache_ttl_max, horizon * config.cache_quiet_fraction)
+        if ttl <= base:
+            return TtlDecision(base, "default", f"endpoint default (newest article {span(idle)} old)")
+        reason = f"newest article {span(idle)} old" + (f", next kick-off in {span(ahead)}" if ahead is not None else "")
+        return TtlDecision(ttl, "quiet", reason)
+
+    def _remember(self, path: str, newest: float):
+        self._activity.pop(path, None)
+        self._activity[path] = newest
+        if len(self._activity) > MAX_TRACKED_FEEDS:
+            self._activity.pop(next(iter(self._activity)))
+
+    def stats(self) -> dict:
+        return {"adaptive": self.config.cache_adaptive_ttl, "decisions": dict(self.decisions),
+                "tracked_feeds": len(self._activity)}
+
+
+ttl_policy = TtlPolicy()
@@ -0,0 +1,4 @@
+"""
+Benchmarks for the SportMonks News API backend.
+Run from the repository root, e.g. `python -m benchmarks.pooled_client`.
+"""
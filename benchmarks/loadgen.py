@@ -0,0 +1,327 @@
+"""
+Load generator — drives every backend route at chosen concurrency levels against the offline
+SportMonks stand-in and writes throughput, p50/p95/p99 and status counts to a JSON results file.
+`--baseline` compares the run with an earlier results file and exits non-zero on regressions.
+
+By default the mock and the backend run in this process (one event loop each, sharing the GIL),
+which is fine for spotting regressions. To size a deployment, start the mock on its own
+(`python -m benchmarks.mock_sportmonks`), point the deployment at it with SPORTMONKS_BASE_URL,
+and pass `--target http://host:port --mock-url http://mock:8765`.
+
+Usage: python -m benchmarks.loadgen [--concurrency 1,10,50] [--duration 5] [--routes pre-match,latest]
+       [--latency-ms 80 --jitter-ms 40 --error-rate 0.01] [--output results.json]
+       [--baseline previous.json --tolerance 0.2]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Optional
+
+import httpx
+
+from benchmarks.mock_sportmonks import add_mock_arguments, mock_config, serve_app_in_thread, serve_in_thread
+
+SEASON_ID = 23614  # Premier League in the generated corpus
+
+# Long-lived or setup-dependent routes a request/response loop can't measure
+SKIPPED = {
+    "/api/news/stream": "Server-Sent Events stream never completes",
+    "/api/news/ws": "WebSocket",
+    "/api/profiles/{name}": "needs PROFILING_ENABLED and a recorded profile",
+}
+
+
+@dataclass
+class Scenario:
+    name: str
+    route: str  # route template in backend/main.py
+    params: dict = field(default_factory=dict)
+
+    def path(self, values: dict) -> str:
+        return self.route.format(**values)
+
+
+SCENARIOS = (
+    Scenario("root", "/"),
+    Scenario("token-status", "/api/token-status"),
+    Scenario("stats", "/api/stats"),
+    Scenario("metrics", "/metrics"),
+    Scenario("competitions", "/api/competitions"),
+    Scenario("store-status", "/api/store/status"),
+    Scenario("search", "/api/news/search", {"q": "preview"}),
+    Scenario("pre-match", "/api/news/pre-match"),
+    Scenario("pre-match-normalized", "/api/news/pre-match", {"shape": "normalized", "images": "proxy"}),
+    Scenario("pre-match-competitions", "/api/news/pre-match", {"competitions": "premier-league,champions-league"}),
+    Scenario("pre-match-local", "/api/news/pre-match", {"source": "local"}),
+    Scenario("pre-match-season", "/api/news/pre-match/seasons/{season_id}"),
+    Scenario("pre-match-upcoming", "/api/news/pre-match/upcoming"),
+    Scenario("post-match", "/api/news/post-match"),
+    Scenario("post-match-season", "/api/news/post-match/seasons/{season_id}"),
+    Scenario("latest", "/api/news/latest"),
+    Scenario("latest-normalized", "/api/news/latest", {"shape": "normalized"}),
+    Scenario("seasons-batch", "/api/news/seasons", {"season_ids": "23614,23672,23670,23671,23752,23753"}),
+    Scenario("changes", "/api/news/changes", {"since": "0", "limit": 50, "shape": "normalized"}),
+    Scenario("pre-match-crawl", "/api/news/pre-match/seasons/{season_id}/crawl"),
+    Scenario("post-match-crawl", "/api/news/post-match/seasons/{season_id}/crawl"),
+    Scenario("image", "/api/images/{image_hash}", {"size": 68}),
+)
+
+
+def percentile(samples: list, pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# ──────────────────────────────────────────────
+# SETUP
+# ──────────────────────────────────────────────
+
+def start_in_process(args: argparse.Namespace) -> tuple:
+    """Mock upstream + backend on background threads. Returns (backend URL, mock URL, backend routes)."""
+    mock_url = f"http://127.0.0.1:{args.mock_port}"
+    serve_in_thread(port=args.mock_port, config=mock_config(args, f"{mock_url}/images/soccer"))
+
+    # Settings are read at import time, so the environment has to be in place before backend is imported
+    workdir = tempfile.mkdtemp(prefix="loadgen-")
+    os.environ["SPORTMONKS_BASE_URL"] = f"{mock_url}/v3/football"
+    os.environ["SPORTMONKS_API_TOKEN"] = "mock"
+    os.environ["STORE_PATH"] = os.path.join(workdir, "sportmonks.db")
+    os.environ["IMAGE_CACHE_DIR"] = os.path.join(workdir, "images")
+    os.environ["PROFILE_DIR"] = os.path.join(workdir, "profiles")
+    os.environ["RATE_LIMIT_CAPACITY"] = str(args.rate_limit)
+    from fastapi.routing import APIRoute, APIWebSocketRoute
+
+    from backend.main import app
+
+    serve_app_in_thread(app, port=args.port)
+    routes = sorted({r.path for r in app.routes if isinstance(r, (APIRoute, APIWebSocketRoute))})
+    return f"http://127.0.0.1:{args.port}", mock_url, routes
+
+
+async def remote_routes(client: httpx.AsyncClient) -> list:
+    # Routes hidden from the schema (/metrics, /api/profiles/…) can't be discovered remotely
+    response = await client.get("/openapi.json")
+    response.raise_for_status()
+    return sorted(response.json().get("paths", {}))
+
+
+async def discover_values(client: httpx.AsyncClient) -> dict:
+    """Path parameters for the scenarios: the season id and one proxied image hash."""
+    values = {"season_id": SEASON_ID, "image_hash": None}
+    response = await client.get("/api/news/pre-match", params={"images": "proxy", "per_page": 5})
+    match = re.search(r"/api/images/([0-9a-f]{32})", response.text)
+    if match:
+        values["image_hash"] = match.group(1)
+    return values
+
+
+async def wait_for_store(client: httpx.AsyncClient, timeout: float = 30.0):
+    """Give the startup sync a chance to fill the local store that source=local and search read."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        status = (await client.get("/api/store/status")).json()
+        if not status.get("enabled") or status.get("articles"):
+            return
+        await asyncio.sleep(0.5)
+
+
+async def upstream_calls(mock_url: Optional[str]) -> Optional[int]:
+    if not mock_url:
+        return None
+    async with httpx.AsyncClient(base_url=mock_url, timeout=5.0) as client:
+        try:
+            return (await client.get("/mock/stats")).json()["requests"]
+        except (httpx.HTTPError, ValueError, KeyError):
+            return None
+
+
+# ──────────────────────────────────────────────
+# MEASUREMENT
+# ──────────────────────────────────────────────
+
+async def measure(target: str, scenario: Scenario, path: str, concurrency: int, duration: float,
+                  max_requests: Optional[int], mock_url: Optional[str]) -> dict:
+    """Closed loop: `concurrency` workers each send the next request as soon as the last one finishes."""
+    latencies = []
+    statuses: Counter = Counter()
+    sent = 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=target, timeout=60.0, limits=limits) as client:
+        calls_before = await upstream_calls(mock_url)
+        deadline = time.perf_counter() + duration
+
+        async def worker():
+            nonlocal sent
+            while time.perf_counter() < deadline and (max_requests is None or sent < max_requests):
+                sent += 1
+                started = time.perf_counter()
+                try:
+                    response = await client.get(path, params=scenario.params)
+                    statuses[str(response.status_code)] += 1
+                except httpx.HTTPError as e:
+                    statuses[type(e).__name__] += 1
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        calls_after = await upstream_calls(mock_url)
+
+    total = len(latencies)
+    errors = sum(count for status, count in statuses.items() if not status.startswith(("2", "3")))
+    result = {
+        "route": scenario.name,
+        "template": scenario.route,
+        "path": path,
+        "params": scenario.params,
+        "concurrency": concurrency,
+        "requests": total,
+        "errors": errors,
+        "status": dict(statuses),
+        "elapsed_s": round(elapsed, 3),
+        "rps": round(total / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(statistics.mean(latencies), 3) if latencies else None,
+        "p50_ms": round(percentile(latencies, 50), 3) if latencies else None,
+        "p95_ms": round(percentile(latencies, 95), 3) if latencies else None,
+        "p99_ms": round(percentile(latencies, 99), 3) if latencies else None,
+        "max_ms": round(max(latencies), 3) if latencies else None,
+    }
+    if calls_before is not None and calls_after is not None and total:
+        result["upstream_calls"] = calls_after - calls_before
+        result["upstream_calls_per_request"] = round((calls_after - calls_before) / total, 4)
+    return result
+
+
+def compare(results: list, baseline: dict, tolerance: float) -> list:
+    """Human-readable regressions against a previous results file: slower p95 or lower throughput."""
+    previous = {(r["route"], r["concurrency"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        before = previous.get((result["route"], result["concurrency"]))
+        if before is None or not result["requests"] or not before.get("requests"):
+            continue
+        label = f"{result['route']} @ c={result['concurrency']}"
+        if before["p95_ms"] and result["p95_ms"] > before["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{label}: p95 {before['p95_ms']:.2f}ms -> {result['p95_ms']:.2f}ms")
+        if before["rps"] and result["rps"] < before["rps"] * (1 - tolerance):
+            regressions.append(f"{label}: throughput {before['rps']:.1f} -> {result['rps']:.1f} req/s")
+    return regressions
+
+
+async def main(args: argparse.Namespace) -> int:
+    if args.target:
+        target, mock_url = args.target.rstrip("/"), args.mock_url
+        async with httpx.AsyncClient(base_url=target, timeout=30.0) as client:
+            routes = await remote_routes(client)
+    else:
+        target, mock_url, routes = start_in_process(args)
+
+    wanted = {name.strip() for name in args.routes.split(",")} if args.routes else None
+    scenarios = [s for s in SCENARIOS if wanted is None or s.name in wanted]
+    covered = {s.route for s in SCENARIOS}
+    skipped = [{"template": route, "reason": SKIPPED.get(route, "no scenario")}
+               for route in routes if route not in covered]
+
+    async with httpx.AsyncClient(base_url=target, timeout=60.0) as client:
+        await wait_for_store(client)
+        values = await discover_values(client)
+        runnable = []
+        for scenario in scenarios:
+            if "{image_hash}" in scenario.route and not values["image_hash"]:
+                skipped.append({"template": scenario.route, "reason": "no proxied image found"})
+                continue
+            path = scenario.path(values)
+            # One untimed call per scenario: results describe steady state, not the first cold miss
+            await client.get(path, params=scenario.params)
+            runnable.append((scenario, path))
+
+    levels = [int(level) for level in args.concurrency.split(",")]
+    results = []
+    print(f"{'route':<24} {'c':>4} {'req/s':>9} {'p50':>9} {'p95':>9} {'p99':>9} {'errors':>7}")
+    for concurrency in levels:
+        for scenario, path in runnable:
+            result = await measure(target, scenario, path, concurrency, args.duration, args.requests, mock_url)
+            results.append(result)
+            if result["requests"]:
+                print(f"{result['route']:<24} {concurrency:>4} {result['rps']:>9.1f} {result['p50_ms']:>7.2f}ms "
+                      f"{result['p95_ms']:>7.2f}ms {result['p99_ms']:>7.2f}ms {result['errors']:>7}")
+
+    report = {
+        "meta": {
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "git_commit": git_commit(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "target": target,
+            "in_process": not args.target,
+            "duration_s": args.duration,
+            "max_requests": args.requests,
+            "concurrency": levels,
+            "mock": {
+                "latency_ms": args.latency_ms,
+                "jitter_ms": args.jitter_ms,
+                "error_rate": args.error_rate,
+                "rate_limit": args.rate_limit,
+                "fixtures": args.fixtures,
+                "seed": args.seed,
+                "corpus": args.corpus,
+            },
+        },
+        "results": results,
+        "skipped": skipped,
+    }
+    output = args.output or os.path.join("benchmarks", "results", f"loadgen-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {output}")
+    for item in skipped:
+        print(f"skipped {item['template']}: {item['reason']}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load-test every backend route against the SportMonks mock")
+    parser.add_argument("--concurrency", default="1,10,50", help="Comma-separated concurrency levels")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per route and concurrency level")
+    parser.add_argument("--requests", type=int, default=None, help="Stop a measurement after this many requests")
+    parser.add_argument("--routes", default=None, help="Comma-separated scenario names (default: all)")
+    parser.add_argument("--target", default=None, help="Backend URL to load instead of an in-process one")
+    parser.add_argument("--mock-url", default=None, help="With --target: the mock's URL, to count upstream calls")
+    parser.add_argument("--port", type=int, default=8766, help="In-process backend port")
+    parser.add_argument("--mock-port", type=int, default=8765, help="In-process mock port")
+    parser.add_argument("--output", default=None, help="Results file (default: benchmarks/results/loadgen-<time>.json)")
+    parser.add_argument("--baseline", default=None, help="Earlier results file to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed p95 / throughput drift vs. baseline")
+    add_mock_arguments(parser)
+    sys.exit(asyncio.run(main(parser.parse_args())))
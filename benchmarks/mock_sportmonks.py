@@ -0,0 +1,451 @@
+"""
+Local mock of the SportMonks News API used by the benchmarks and the load generator.
+Serves a seeded, realistic corpus (or a recorded one) over the real routes — pre-match, post-match,
+upcoming, seasons and fixtures/multi — with includes, pagination, a `rate_limit` budget, and
+configurable latency and error injection, so we can measure the backend without spending API quota.
+
+Usage: python -m benchmarks.mock_sportmonks [--port 8765] [--latency-ms 80] [--jitter-ms 40]
+       [--error-rate 0.01] [--rate-limit 3000] [--corpus recorded.json] [--dump corpus.json]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import struct
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse, Response
+
+CDN = "https://cdn.sportmonks.com/images/soccer"
+FEEDS = ("pre-match", "post-match")
+MAX_PER_PAGE = 50
+
+LEAGUES = (
+    {"id": 8, "name": "Premier League", "short_code": "UK PL", "country_id": 462, "season_id": 23614},
+    {"id": 9, "name": "Championship", "short_code": "UK Champ", "country_id": 462, "season_id": 23672},
+    {"id": 12, "name": "League One", "short_code": "UK L1", "country_id": 462, "season_id": 23670},
+    {"id": 14, "name": "League Two", "short_code": "UK L2", "country_id": 462, "season_id": 23671},
+    {"id": 24, "name": "FA Cup", "short_code": "UK FA Cup", "country_id": 462, "season_id": 23752},
+    {"id": 27, "name": "Carabao Cup", "short_code": "UK LC", "country_id": 462, "season_id": 23753},
+    {"id": 2, "name": "Champions League", "short_code": "UEFA CL", "country_id": 41, "season_id": 23619},
+    {"id": 5, "name": "Europa League", "short_code": "UEFA EL", "country_id": 41, "season_id": 23620},
+    {"id": 2286, "name": "Europa Conference League", "short_code": "UEFA ECL", "country_id": 41, "season_id": 23621},
+)
+
+TEAMS = (
+    (19, "Arsenal", "ARS"), (18, "Chelsea", "CHE"), (8, "Liverpool", "LIV"), (9, "Manchester City", "MCI"),
+    (14, "Manchester United", "MUN"), (6, "Tottenham Hotspur", "TOT"), (20, "Newcastle United", "NEW"),
+    (15, "Aston Villa", "AVL"), (52, "Crystal Palace", "CRY"), (51, "Brighton & Hove Albion", "BHA"),
+    (1, "West Ham United", "WHU"), (13, "Everton", "EVE"), (3, "Leeds United", "LEE"),
+    (27, "Burnley", "BUR"), (11, "Fulham", "FUL"), (236, "Brentford", "BRE"), (29, "Wolverhampton", "WOL"),
+    (63, "Nottingham Forest", "NFO"), (591, "Real Madrid", "RMA"), (83, "FC Barcelona", "FCB"),
+    (503, "FC Bayern München", "FCB"), (68, "Borussia Dortmund", "BVB"), (597, "Paris Saint-Germain", "PSG"),
+    (625, "Juventus", "JUV"), (113, "AC Milan", "MIL"), (2930, "Inter", "INT"), (7980, "Atlético Madrid", "ATM"),
+    (3468, "Ajax", "AJA"), (282, "Celtic", "CEL"), (62, "Rangers", "RAN"),
+)
+
+PRE_MATCH_TITLES = (
+    "{home} vs {away}: Team News, Predicted Line-ups and Preview",
+    "{home} v {away} preview: {league} prediction, odds and key stats",
+    "Can {away} stop {home}? {league} match preview",
+    "{home} injury update ahead of {away} clash",
+    "{league}: five things to watch in {home} vs {away}",
+)
+POST_MATCH_TITLES = (
+    "{home} {home_goals}-{away_goals} {away}: Player ratings and match report",
+    "{league} report: {home} {home_goals}-{away_goals} {away}",
+    "Talking points from {home} vs {away}",
+    "{away} manager reacts after {home} {home_goals}-{away_goals} {away}",
+)
+SENTENCES = (
+    "{home} come into this {league} fixture on the back of a run of {n} games without defeat.",
+    "{away} have won only {n} of their last eight away matches in all competitions.",
+    "The manager confirmed in his press conference that {n} senior players are doubtful with minor knocks.",
+    "Set pieces could prove decisive, with {home} scoring {n} goals from corners this season.",
+    "{away} pressed high from the opening whistle and forced {n} turnovers in the final third.",
+    "The midfield battle will shape the game, and {home} have dominated possession in recent weeks.",
+    "A crowd of more than {n},000 is expected as the hosts look to build momentum.",
+    "Both sides met {n} times last season, and the reverse fixture ended in a tense draw.",
+    "The visitors' back line has looked vulnerable in transition, conceding {n} goals on the counter.",
+    "{home}'s top scorer has been directly involved in {n} goals across the {league} campaign.",
+)
+
+
+# ──────────────────────────────────────────────
+# CORPUS
+# ──────────────────────────────────────────────
+
+def make_article(article_id: int, news_type: str = "prematch") -> dict:
+    """Build one news article shaped like the real SportMonks payload."""
+    return {
+        "id": article_id,
+        "fixture_id": 19000000 + article_id,
+        "league_id": 8,
+        "title": f"Mock article {article_id}",
+        "type": news_type,
+        "created_at": "2024-10-01 12:00:00",
+        "league": {"id": 8, "name": "Premier League", "image_path": f"{CDN}/leagues/8/8.png"},
+        "fixture": {
+            "id": 19000000 + article_id,
+            "name": "Arsenal vs Chelsea",
+            "starting_at": "2024-10-05 15:00:00",
+            "participants": [
+                {"id": 19, "name": "Arsenal", "image_path": f"{CDN}/teams/19/19.png", "meta": {"location": "home"}},
+                {"id": 18, "name": "Chelsea", "image_path": f"{CDN}/teams/18/18.png", "meta": {"location": "away"}},
+            ],
+        },
+        "lines": [{"id": article_id * 10 + i, "line": f"Paragraph {i} of mock article {article_id}."} for i in range(6)],
+    }
+
+
+def _timestamp(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _league(league: dict, image_base: str) -> dict:
+    return {
+        "id": league["id"],
+        "sport_id": 1,
+        "country_id": league["country_id"],
+        "name": league["name"],
+        "active": True,
+        "short_code": league["short_code"],
+        "image_path": f"{image_base}/leagues/{league['id'] % 32}/{league['id']}.png",
+        "type": "league",
+        "sub_type": "domestic",
+        "category": 1,
+        "has_jerseys": False,
+    }
+
+
+def _participant(team: tuple, location: str, winner: Optional[bool], image_base: str) -> dict:
+    team_id, name, short_code = team
+    return {
+        "id": team_id,
+        "sport_id": 1,
+        "country_id": 462,
+        "gender": "male",
+        "name": name,
+        "short_code": short_code,
+        "image_path": f"{image_base}/teams/{team_id % 32}/{team_id}.png",
+        "type": "domestic",
+        "placeholder": False,
+        "meta": {"location": location, "winner": winner, "position": None},
+    }
+
+
+def _paragraphs(rng: random.Random, article_id: int, names: dict) -> list:
+    lines = []
+    for position in range(rng.randint(6, 14)):
+        text = " ".join(
+            rng.choice(SENTENCES).format(n=rng.randint(2, 9), **names) for _ in range(rng.randint(2, 5))
+        )
+        lines.append({"id": article_id * 100 + position, "line": text})
+    return lines
+
+
+def generate_corpus(seed: int = 7, fixtures: int = 180, image_base: str = CDN,
+                    now: Optional[datetime] = None) -> dict:
+    """{feed: [article with fixture.participants, league and lines]} around `now`, newest first."""
+    rng = random.Random(seed)
+    now = (now or datetime.now(timezone.utc).replace(tzinfo=None)).replace(microsecond=0)
+    feeds: dict = {feed: [] for feed in FEEDS}
+    next_id = {"pre-match": 480000, "post-match": 310000}
+    for fixture_id in range(19100000, 19100000 + fixtures):
+        league = rng.choice(LEAGUES)
+        home, away = rng.sample(TEAMS, 2)
+        # Mostly played fixtures, some in the next two weeks (the /upcoming feed)
+        kick_off = now + timedelta(minutes=15 * rng.randint(-4 * 24 * 30, 4 * 24 * 14))
+        played = kick_off + timedelta(hours=2) < now
+        home_goals, away_goals = (rng.randint(0, 4), rng.randint(0, 3)) if played else (None, None)
+        home_won = played and home_goals > away_goals
+        away_won = played and away_goals > home_goals
+        fixture = {
+            "id": fixture_id,
+            "sport_id": 1,
+            "league_id": league["id"],
+            "season_id": league["season_id"],
+            "name": f"{home[1]} vs {away[1]}",
+            "starting_at": _timestamp(kick_off),
+            "result_info": f"{(home if home_won else away)[1]} won after full-time." if home_won or away_won else None,
+            "length": 90,
+            "has_odds": True,
+            "starting_at_timestamp": int(kick_off.replace(tzinfo=timezone.utc).timestamp()),
+            "participants": [
+                _participant(home, "home", home_won if played else None, image_base),
+                _participant(away, "away", away_won if played else None, image_base),
+            ],
+        }
+        names = {"home": home[1], "away": away[1], "league": league["name"],
+                 "home_goals": home_goals, "away_goals": away_goals}
+        windows = [("pre-match", "prematch", PRE_MATCH_TITLES, kick_off - timedelta(days=5),
+                    min(kick_off, now), rng.randint(1, 4))]
+        if played:
+            windows.append(("post-match", "postmatch", POST_MATCH_TITLES, kick_off + timedelta(hours=2),
+                            min(kick_off + timedelta(hours=30), now), rng.randint(1, 3)))
+        for feed, news_type, titles, start, end, count in windows:
+            if end <= start:
+                continue
+            for _ in range(count):
+                article_id = next_id[feed]
+                next_id[feed] += 1
+                created = start + timedelta(seconds=rng.randint(0, int((end - start).total_seconds())))
+                feeds[feed].append({
+                    "id": article_id,
+                    "fixture_id": fixture_id,
+                    "league_id": league["id"],
+                    "title": rng.choice(titles).format(**names),
+                    "type": news_type,
+                    "created_at": _timestamp(created),
+                    "league": _league(league, image_base),
+                    "fixture": fixture,
+                    "lines": _paragraphs(rng, article_id, names),
+                })
+    for articles in feeds.values():
+        articles.sort(key=lambda a: (a["created_at"], a["id"]), reverse=True)
+    return feeds
+
+
+def load_corpus(path: str) -> dict:
+    """A recorded corpus: {"pre-match": [...], "post-match": [...]} with every include embedded."""
+    with open(path, encoding="utf-8") as f:
+        feeds = json.load(f)
+    for feed in FEEDS:
+        feeds.setdefault(feed, []).sort(key=lambda a: (a.get("created_at") or "", a.get("id") or 0), reverse=True)
+    return feeds
+
+
+def solid_png(size: int, rgb: tuple) -> bytes:
+    """A size×size single-colour PNG, standing in for a CDN logo."""
+    raw = b"".join(b"\x00" + bytes(rgb) * size for _ in range(size))
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+    header = struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(raw)) + chunk(b"IEND", b"")
+
+
+# ──────────────────────────────────────────────
+# SERVER
+# ──────────────────────────────────────────────
+
+@dataclass
+class MockConfig:
+    latency_ms: float = 0.0  # added to every API response
+    jitter_ms: float = 0.0  # uniform extra latency on top
+    error_rate: float = 0.0  # fraction of API calls answered with one of `error_statuses`
+    error_statuses: tuple = (500, 502, 503)
+    rate_limit: int = 3000  # calls per entity per window, as on the SportMonks plans
+    rate_limit_window: float = 3600.0
+    seed: int = 7
+    fixtures: int = 180
+    corpus: Optional[str] = None  # recorded corpus JSON instead of the generated one
+    image_base: str = CDN
+    stats: dict = field(default_factory=lambda: {"requests": 0, "errors": 0, "throttled": 0, "images": 0})
+
+
+def _includes(include: Optional[str]) -> set:
+    return {part.strip() for part in str(include or "").split(";") if part.strip()}
+
+
+def _view(article: dict, includes: set) -> dict:
+    """The article as upstream returns it for `include`."""
+    out = {k: v for k, v in article.items() if k not in ("fixture", "league", "lines")}
+    if "league" in includes:
+        out["league"] = article.get("league")
+    if "fixture.participants" in includes:
+        out["fixture"] = article.get("fixture")
+    elif "fixture" in includes and isinstance(article.get("fixture"), dict):
+        out["fixture"] = {k: v for k, v in article["fixture"].items() if k != "participants"}
+    if "lines" in includes:
+        out["lines"] = article.get("lines") or []
+    return out
+
+
+def create_app(config: Optional[MockConfig] = None) -> FastAPI:
+    config = config or MockConfig()
+    feeds = load_corpus(config.corpus) if config.corpus else generate_corpus(
+        config.seed, config.fixtures, config.image_base
+    )
+    fixtures = {}
+    for articles in feeds.values():
+        for article in articles:
+            fixture = article.get("fixture")
+            if isinstance(fixture, dict):
+                fixtures.setdefault(fixture["id"], {**fixture, "league": article.get("league")})
+    budgets: dict = {}  # entity -> [remaining, resets_at]
+    jitter = random.Random(config.seed)
+    images: dict = {}
+
+    app = FastAPI(title="Mock SportMonks")
+    app.state.config = config
+    app.state.feeds = feeds
+
+    def take_budget(entity: str) -> tuple:
+        """(rate_limit block, whether the call fits the entity's budget)."""
+        now = time.monotonic()
+        budget = budgets.get(entity)
+        if budget is None or now >= budget[1]:
+            budget = budgets[entity] = [config.rate_limit, now + config.rate_limit_window]
+        allowed = budget[0] > 0
+        if allowed:
+            budget[0] -= 1
+        block = {"resets_in_seconds": max(0, int(budget[1] - now)), "remaining": budget[0], "requested_entity": entity}
+        return block, allowed
+
+    async def respond(request: Request, entity: str, build) -> Response:
+        config.stats["requests"] += 1
+        delay = config.latency_ms + jitter.uniform(0, config.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        if config.error_rate and jitter.random() < config.error_rate:
+            config.stats["errors"] += 1
+            status = jitter.choice(config.error_statuses)
+            return ORJSONResponse({"message": f"Injected upstream error ({status})"}, status_code=status)
+        rate_limit, allowed = take_budget(entity)
+        headers = {
+            "X-RateLimit-Limit": str(config.rate_limit),
+            "X-RateLimit-Remaining": str(rate_limit["remaining"]),
+            "X-RateLimit-Reset": str(rate_limit["resets_in_seconds"]),
+        }
+        if not allowed:
+            config.stats["throttled"] += 1
+            headers["Retry-After"] = str(rate_limit["resets_in_seconds"])
+            return ORJSONResponse(
+                {"message": "You have reached the rate limit for this entity.", "rate_limit": rate_limit},
+                status_code=429, headers=headers,
+            )
+        return ORJSONResponse({**build(), "rate_limit": rate_limit}, headers=headers)
+
+    def news_page(request: Request, articles: list, include: Optional[str], order: Optional[str],
+                  per_page: int, page: int) -> dict:
+        per_page = max(1, min(per_page or 25, MAX_PER_PAGE))
+        page = max(1, page or 1)
+        if str(order or "asc").lower() == "asc":
+            articles = articles[::-1]
+        start = (page - 1) * per_page
+        items = articles[start:start + per_page]
+        includes = _includes(include)
+        has_more = start + per_page < len(articles)
+        return {
+            "data": [_view(article, includes) for article in items],
+            "pagination": {
+                "count": len(items),
+                "per_page": per_page,
+                "current_page": page,
+                "next_page": str(request.url.include_query_params(page=page + 1)) if has_more else None,
+                "has_more": has_more,
+            },
+        }
+
+    @app.get("/v3/football/news/{feed}")
+    async def news(request: Request, feed: str, include: Optional[str] = None, order: Optional[str] = None,
+                   per_page: int = 25, page: int = 1):
+        articles = feeds.get(feed, [])
+        return await respond(request, "News", lambda: news_page(request, articles, include, order, per_page, page))
+
+    @app.get("/v3/football/news/{feed}/upcoming")
+    async def upcoming(request: Request, feed: str, include: Optional[str] = None, order: Optional[str] = None,
+                       per_page: int = 25, page: int = 1):
+        now = _timestamp(datetime.now(timezone.utc))
+        articles = [a for a in feeds.get(feed, []) if ((a.get("fixture") or {}).get("starting_at") or "") > now]
+        return await respond(request, "News", lambda: news_page(request, articles, include, order, per_page, page))
+
+    @app.get("/v3/football/news/{feed}/seasons/{season_id}")
+    async def season(request: Request, feed: str, season_id: int, include: Optional[str] = None,
+                     order: Optional[str] = None, per_page: int = 25, page: int = 1):
+        articles = [a for a in feeds.get(feed, []) if (a.get("fixture") or {}).get("season_id") == season_id]
+        return await respond(request, "News", lambda: news_page(request, articles, include, order, per_page, page))
+
+    @app.get("/v3/football/fixtures/multi/{ids}")
+    async def fixtures_multi(request: Request, ids: str, include: Optional[str] = None):
+        includes = _includes(include)
+
+        def build() -> dict:
+            data = []
+            for fixture_id in ids.split(","):
+                fixture = fixtures.get(int(fixture_id)) if fixture_id.strip().isdigit() else None
+                if fixture is not None:
+                    drop = {"participants", "league"} - includes
+                    data.append({k: v for k, v in fixture.items() if k not in drop})
+            return {"data": data}
+
+        return await respond(request, "Fixture", build)
+
+    @app.get("/images/soccer/{kind}/{bucket}/{name}")
+    async def image(kind: str, bucket: str, name: str):
+        config.stats["images"] += 1
+        key = f"{kind}/{name}"
+        if key not in images:
+            rng = random.Random(key)
+            images[key] = solid_png(150, (rng.randrange(256), rng.randrange(256), rng.randrange(256)))
+        return Response(images[key], media_type="image/png")
+
+    @app.get("/mock/stats")
+    async def mock_stats():
+        """Calls served so far — the load generator reads this to count upstream calls per request."""
+        return {**config.stats, "articles": {feed: len(articles) for feed, articles in feeds.items()}}
+
+    return app
+
+
+def serve_app_in_thread(app, host: str = "127.0.0.1", port: int = 8765) -> uvicorn.Server:
+    """Run an ASGI app on a background thread; returns the running server."""
+    server = uvicorn.Server(uvicorn.Config(app, host=host, port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+def serve_in_thread(host: str = "127.0.0.1", port: int = 8765, config: Optional[MockConfig] = None) -> uvicorn.Server:
+    """Start the mock upstream on a background thread; returns the running server."""
+    return serve_app_in_thread(create_app(config), host, port)
+
+
+def add_mock_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=int, default=3000)
+    parser.add_argument("--fixtures", type=int, default=180)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--corpus", default=None, help="Recorded corpus JSON to serve instead of generated data")
+
+
+def mock_config(args: argparse.Namespace, image_base: str = CDN) -> MockConfig:
+    return MockConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        seed=args.seed,
+        fixtures=args.fixtures,
+        corpus=args.corpus,
+        image_base=image_base,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve a local SportMonks stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--dump", default=None, help="Write the generated corpus to this file and exit")
+    add_mock_arguments(parser)
+    args = parser.parse_args()
+    # Logos are served by the mock itself, so image proxying stays offline too
+    config = mock_config(args, f"http://{args.host}:{args.port}/images/soccer")
+    if args.dump:
+        with open(args.dump, "w", encoding="utf-8") as f:
+            json.dump(generate_corpus(config.seed, config.fixtures, config.image_base), f)
+    else:
+        uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
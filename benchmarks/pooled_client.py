@@ -0,0 +1,96 @@
+"""
+Benchmark — per-request httpx client vs. the shared pooled client.
+Fires the same news request at a local mock upstream and reports p50/p99 latency.
+
+Usage: python -m benchmarks.pooled_client [--requests 500] [--concurrency 10]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+from benchmarks.mock_sportmonks import serve_in_thread
+from backend.services.scheduler import Priority
+from backend.services.sportmonks import SportMonksService
+
+
+def percentile(samples: list, pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def per_request_client(url: str, params: dict) -> None:
+    # The pre-pooling behaviour: a fresh client (and connection) for every call
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        response = await client.get(url, params=params)
+        response.raise_for_status()
+        response.json()
+
+
+async def pooled_client(service: SportMonksService, url: str, params: dict) -> None:
+    # Straight to the upstream call: the response cache, shared cache, entity joins and store
+    # recording would otherwise answer (or add to) every call after the first
+    payload, _ = await service._fetch(url, params, Priority.INTERACTIVE)
+    if payload.get("error"):
+        raise RuntimeError(payload.get("message"))
+
+
+async def run(label: str, call, total: int, concurrency: int) -> dict:
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            await call()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    elapsed = time.perf_counter() - started
+    result = {
+        "label": label,
+        "p50_ms": percentile(latencies, 50),
+        "p99_ms": percentile(latencies, 99),
+        "mean_ms": statistics.mean(latencies),
+        "rps": total / elapsed,
+    }
+    print(f"{label:<20} p50={result['p50_ms']:7.2f}ms  p99={result['p99_ms']:7.2f}ms  "
+          f"mean={result['mean_ms']:7.2f}ms  {result['rps']:8.1f} req/s")
+    return result
+
+
+async def main(total: int, concurrency: int, port: int):
+    serve_in_thread(port=port)
+    base_url = f"http://127.0.0.1:{port}/v3/football"
+    url = f"{base_url}/news/pre-match"
+    params = {"include": "fixture.participants;league;lines", "per_page": 25, "page": 1}
+
+    service = SportMonksService()
+    service.base_url = base_url
+    await service.start()
+    pooled_params = service._build_params(params["include"], None, params["per_page"], params["page"])
+
+    # Warm both paths once so neither pays import/first-connection costs in the sample
+    await per_request_client(url, params)
+    await pooled_client(service, url, pooled_params)
+
+    before = await run("per-request client", lambda: per_request_client(url, params), total, concurrency)
+    after = await run("pooled client", lambda: pooled_client(service, url, pooled_params), total, concurrency)
+    await service.close()
+
+    print(f"\np50 speed-up: {before['p50_ms'] / after['p50_ms']:.2f}x   "
+          f"p99 speed-up: {before['p99_ms'] / after['p99_ms']:.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.port))
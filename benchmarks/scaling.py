@@ -0,0 +1,156 @@
+"""
+Benchmark — throughput scaling of the gunicorn production mode from 1 to N workers.
+Starts the SportMonks mock and `gunicorn -c gunicorn.conf.py` as subprocesses, loads each
+worker count with benchmarks.loadgen and reports req/s, p95 and the speed-up over one worker.
+
+The load generator needs spare cores too: on an N-core box measure up to N-1 workers, or use
+--clients to spread the load over several loadgen processes (their req/s are summed, p95 is the
+worst client's). Results go to a JSON file next to the loadgen ones.
+
+Usage: python -m benchmarks.scaling [--workers 1,2,4] [--routes pre-match,latest] [--concurrency 64]
+       [--duration 10] [--clients 1] [--output scaling.json]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+from benchmarks.loadgen import git_commit
+
+DEFAULT_ROUTES = "root,pre-match,pre-match-normalized,post-match-season,latest,search"
+
+
+def wait_until_up(url: str, process: subprocess.Popen, timeout: float = 60.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"process serving {url} exited with status {process.returncode}")
+        try:
+            httpx.get(url, timeout=2.0)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    raise RuntimeError(f"{url} did not come up within {timeout:.0f}s")
+
+
+def start_gunicorn(workers: int, port: int, mock_url: str, workdir: str) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "WEB_CONCURRENCY": str(workers),
+        "PORT": str(port),
+        "SPORTMONKS_BASE_URL": f"{mock_url}/v3/football",
+        "SPORTMONKS_API_TOKEN": "mock",
+        # A fresh store and shared cache per run, so every worker count starts equally cold
+        "STORE_PATH": os.path.join(workdir, f"store-{workers}.db"),
+        "SHARED_CACHE_PATH": os.path.join(workdir, f"shared-{workers}.db"),
+        "IMAGE_CACHE_DIR": os.path.join(workdir, "images"),
+        "PROMETHEUS_MULTIPROC_DIR": os.path.join(workdir, f"prometheus-{workers}"),
+    }
+    return subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "backend.main:app", "-c", "gunicorn.conf.py", "--log-level", "warning"],
+        env=env,
+    )
+
+
+def run_clients(args: argparse.Namespace, target: str, mock_url: str, workdir: str, workers: int) -> list:
+    """One loadgen process per client; returns their results files, parsed."""
+    processes, outputs = [], []
+    for client in range(args.clients):
+        output = os.path.join(workdir, f"loadgen-{workers}-{client}.json")
+        outputs.append(output)
+        processes.append(subprocess.Popen(
+            [sys.executable, "-m", "benchmarks.loadgen", "--target", target, "--mock-url", mock_url,
+             "--routes", args.routes, "--concurrency", str(args.concurrency),
+             "--duration", str(args.duration), "--output", output],
+            stdout=subprocess.DEVNULL,
+        ))
+    for process in processes:
+        process.wait()
+    reports = []
+    for output in outputs:
+        with open(output, encoding="utf-8") as f:
+            reports.append(json.load(f))
+    return reports
+
+
+def merge(reports: list, workers: int) -> list:
+    by_route: dict = {}
+    for report in reports:
+        for result in report["results"]:
+            merged = by_route.setdefault(result["route"], {
+                "workers": workers, "route": result["route"], "requests": 0, "errors": 0, "rps": 0.0, "p95_ms": 0.0,
+            })
+            merged["requests"] += result["requests"]
+            merged["errors"] += result["errors"]
+            merged["rps"] = round(merged["rps"] + result["rps"], 2)
+            merged["p95_ms"] = max(merged["p95_ms"], result["p95_ms"] or 0.0)
+    return list(by_route.values())
+
+
+def main(args: argparse.Namespace):
+    workdir = tempfile.mkdtemp(prefix="scaling-")
+    mock_url = f"http://127.0.0.1:{args.mock_port}"
+    mock = subprocess.Popen([
+        sys.executable, "-m", "benchmarks.mock_sportmonks", "--port", str(args.mock_port),
+        "--latency-ms", str(args.latency_ms), "--jitter-ms", str(args.jitter_ms),
+    ])
+    results = []
+    try:
+        wait_until_up(f"{mock_url}/mock/stats", mock)
+        for workers in [int(w) for w in args.workers.split(",")]:
+            server = start_gunicorn(workers, args.port, mock_url, workdir)
+            try:
+                target = f"http://127.0.0.1:{args.port}"
+                wait_until_up(f"{target}/", server)
+                results.extend(merge(run_clients(args, target, mock_url, workdir, workers), workers))
+            finally:
+                server.terminate()
+                server.wait()
+    finally:
+        mock.terminate()
+        mock.wait()
+
+    baseline = {r["route"]: r["rps"] for r in results if r["workers"] == min(x["workers"] for x in results)}
+    print(f"{'route':<24} {'workers':>7} {'req/s':>9} {'speed-up':>9} {'p95':>9}")
+    for result in results:
+        result["speedup"] = round(result["rps"] / baseline[result["route"]], 2) if baseline.get(result["route"]) else None
+        print(f"{result['route']:<24} {result['workers']:>7} {result['rps']:>9.1f} "
+              f"{(result['speedup'] or 0):>8.2f}x {result['p95_ms']:>7.2f}ms")
+
+    output = args.output or os.path.join("benchmarks", "results", f"scaling-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({
+            "meta": {
+                "started_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "git_commit": git_commit(),
+                "cpu_count": os.cpu_count(),
+                "concurrency": args.concurrency,
+                "duration_s": args.duration,
+                "clients": args.clients,
+                "mock": {"latency_ms": args.latency_ms, "jitter_ms": args.jitter_ms},
+            },
+            "results": results,
+        }, f, indent=2)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Throughput scaling of gunicorn workers")
+    parser.add_argument("--workers", default=",".join(str(2 ** i) for i in range(8) if 2 ** i <= (os.cpu_count() or 1)))
+    parser.add_argument("--routes", default=DEFAULT_ROUTES, help="loadgen scenario names")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per route")
+    parser.add_argument("--clients", type=int, default=1, help="Parallel loadgen processes")
+    parser.add_argument("--latency-ms", type=float, default=80.0, help="Mock upstream latency")
+    parser.add_argument("--jitter-ms", type=float, default=40.0)
+    parser.add_argument("--port", type=int, default=8780)
+    parser.add_argument("--mock-port", type=int, default=8779)
+    parser.add_argument("--output", default=None)
+    main(parser.parse_args())
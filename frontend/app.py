@@ -369,25 +369,28 @@ st.markdown("""
 
 BACKEND = os.environ.get("BACKEND_URL", "http://127.0.0.1:8000")
 
-# English football leagues & competitions for quick filters
+# English football leagues & competitions for quick filters.
+# Matching happens in the backend — `slug` is the value sent as `competitions=`.
 ENGLISH_LEAGUES = {
-    "Premier League": {"icon": "🏆", "keywords": ["premier league"]},
-    "Championship": {"icon": "🥈", "keywords": ["championship"]},
-    "League One": {"icon": "🥉", "keywords": ["league one"]},
-    "League Two": {"icon": "4️⃣", "keywords": ["league two"]},
+    "Premier League": {"icon": "🏆", "slug": "premier-league"},
+    "Championship": {"icon": "🥈", "slug": "championship"},
+    "League One": {"icon": "🥉", "slug": "league-one"},
+    "League Two": {"icon": "4️⃣", "slug": "league-two"},
 }
 
 DOMESTIC_CUPS = {
-    "FA Cup": {"icon": "🏅", "keywords": ["fa cup"]},
-    "Carabao Cup": {"icon": "🍵", "keywords": ["carabao", "efl cup", "league cup"]},
+    "FA Cup": {"icon": "🏅", "slug": "fa-cup"},
+    "Carabao Cup": {"icon": "🍵", "slug": "carabao-cup"},
 }
 
 EUROPEAN_COMPETITIONS = {
-    "Champions League": {"icon": "⭐", "keywords": ["champions league", "ucl"]},
-    "Europa League": {"icon": "🌍", "keywords": ["europa league"]},
-    "Conference League": {"icon": "🌐", "keywords": ["conference league"]},
+    "Champions League": {"icon": "⭐", "slug": "champions-league"},
+    "Europa League": {"icon": "🌍", "slug": "europa-league"},
+    "Conference League": {"icon": "🌐", "slug": "conference-league"},
 }
 
+ALL_COMPETITIONS = {**ENGLISH_LEAGUES, **DOMESTIC_CUPS, **EUROPEAN_COMPETITIONS}
+
 # Simple news type options for the user
 NEWS_TYPES = {
     "latest": {"name": "📰 Latest News", "desc": "Most recent pre-match & post-match combined"},
@@ -395,6 +398,10 @@ NEWS_TYPES = {
     "post_match": {"name": "✅ Match Results", "desc": "Post-match reports & analysis"},
 }
 
+# Views whose first page "Refresh" patches from /api/news/changes. Upcoming is left out: articles
+# also leave it as fixtures kick off, and the change log only records inserts and edits.
+CHANGES_FEEDS = {"latest": "pre-match,post-match", "post_match": "post-match"}
+
 
 # ──────────────────────────────────────────────
 # HELPERS
@@ -408,9 +415,27 @@ def backend_alive():
 
 
 def call(endpoint: str, params: dict = None) -> dict:
+    # Revalidate with the last ETag: an unchanged feed comes back as an empty 304 and is not re-parsed
+    validators = st.session_state.setdefault("validators", {})
+    key = (endpoint, tuple(sorted((params or {}).items())))
+    cached = validators.get(key)
+    headers = {"If-None-Match": cached[0]} if cached else {}
     try:
-        resp = requests.get(f"{BACKEND}{endpoint}", params=params, timeout=30)
-        return resp.json()
+        resp = requests.get(f"{BACKEND}{endpoint}", params=params, headers=headers, timeout=30)
+        if resp.status_code == 304 and cached:
+            return cached[1]
+        data = resp.json()
+        # An untouched upstream body has no next_cursor of its own — the backend sends it as a header
+        cursor = resp.headers.get("X-Next-Cursor")
+        if cursor and isinstance(data.get("pagination"), dict) and not data["pagination"].get("next_cursor"):
+            data["pagination"]["next_cursor"] = cursor
+        etag = resp.headers.get("ETag")
+        if etag and resp.ok and not data.get("error"):
+            validators.pop(key, None)
+            validators[key] = (etag, data)
+            while len(validators) > 32:
+                validators.pop(next(iter(validators)))
+        return data
     except requests.exceptions.ConnectionError:
         return {"error": True, "message": "Backend not running. Please start the FastAPI server first."}
     except Exception as e:
@@ -428,43 +453,55 @@ def format_datetime(dt_str: str) -> str:
         return dt_str[:16] if len(dt_str) >= 16 else dt_str
 
 
-def match_league_filter(league_name: str, selected_filters: list) -> bool:
-    """Check if a league name matches any of the selected filter keywords."""
-    if not selected_filters:
-        return True  # No filter = show all
-    if not league_name:
-        return False
-
-    league_lower = league_name.lower()
-
-    all_filters = {}
-    all_filters.update(ENGLISH_LEAGUES)
-    all_filters.update(DOMESTIC_CUPS)
-    all_filters.update(EUROPEAN_COMPETITIONS)
-
-    for filter_name in selected_filters:
-        if filter_name in all_filters:
-            for keyword in all_filters[filter_name]["keywords"]:
-                if keyword in league_lower:
-                    return True
-    return False
-
-
-def filter_articles_by_league(articles: list, selected_filters: list) -> list:
-    """Filter articles by selected league/competition filters."""
-    if not selected_filters:
-        return articles
-    filtered = []
-    for article in articles:
-        league = article.get("league", {}) or {}
-        league_name = league.get("name", "") if isinstance(league, dict) else ""
-        if match_league_filter(league_name, selected_filters):
-            filtered.append(article)
-    return filtered
-
-
-def render_article(article: dict, index: int):
+def competitions_param(selected_filters: list) -> str:
+    """Selected sidebar filters -> backend `competitions` query value (empty = no filter)."""
+    return ",".join(ALL_COMPETITIONS[name]["slug"] for name in selected_filters if name in ALL_COMPETITIONS)
+
+
+def image_mode() -> str:
+    """`proxy` only when the backend has PUBLIC_BASE_URL: proxied logo URLs are otherwise built from
+    the address this app reaches the backend at, which the browser may not. Else the CDN URLs."""
+    if "image_mode" not in st.session_state:
+        try:
+            images = requests.get(f"{BACKEND}/api/stats", timeout=5).json().get("images") or {}
+            st.session_state.image_mode = "proxy" if images.get("public_base_url") else "origin"
+        except Exception:
+            return "origin"  # asked again on the next run
+    return st.session_state.image_mode
+
+
+def sized(image_url: str, size: int) -> str:
+    """Logos served by the backend image proxy come pre-resized to the size the card draws them."""
+    if image_url and "/api/images/" in image_url:
+        return f"{image_url}?size={size}"
+    return image_url
+
+
+def expand_article(article: dict, tables: dict) -> dict:
+    """Re-attach league, fixture and teams to an article from a `shape=normalized` response."""
+    leagues = tables.get("leagues") or {}
+    fixtures = tables.get("fixtures") or {}
+    teams = tables.get("teams") or {}
+    article = dict(article)
+    league = leagues.get(str(article.get("league_id")))
+    if league:
+        article["league"] = league
+    fixture = fixtures.get(str(article.get("fixture_id")))
+    if fixture:
+        article["fixture"] = {
+            **fixture,
+            "participants": [
+                {**teams.get(str(ref.get("team_id")), {}), "meta": ref.get("meta") or {}}
+                for ref in fixture.get("participants") or []
+            ],
+        }
+    return article
+
+
+def render_article(article: dict, index: int, tables: dict = None):
     """Render a single news article as a rich card with team images."""
+    if tables:
+        article = expand_article(article, tables)
     title = article.get("title", "Untitled Article")
     news_type = article.get("type", "news")
     created = article.get("created_at", "")
@@ -502,11 +539,11 @@ def render_article(article: dict, index: int):
     # Build match banner HTML with team logos
     banner_html = ""
     if home_team or away_team:
-        home_img = home_team.get("image_path", "") if home_team else ""
+        home_img = sized(home_team.get("image_path", ""), 68) if home_team else ""
         home_name = home_team.get("name", "Home") if home_team else ""
-        away_img = away_team.get("image_path", "") if away_team else ""
+        away_img = sized(away_team.get("image_path", ""), 68) if away_team else ""
         away_name = away_team.get("name", "Away") if away_team else ""
-        league_badge = f"<img src='{league_img}' class='league-badge-img'>" if league_img else ""
+        league_badge = f"<img src='{sized(league_img, 32)}' class='league-badge-img'>" if league_img else ""
 
         home_logo_html = f'<img src="{home_img}" class="team-logo" alt="{home_name}">' if home_img else '<div class="team-logo-placeholder">🏠</div>'
         away_logo_html = f'<img src="{away_img}" class="team-logo" alt="{away_name}">' if away_img else '<div class="team-logo-placeholder">✈️</div>'
@@ -536,7 +573,7 @@ def render_article(article: dict, index: int):
     # League image for meta chip
     league_html = ""
     if league_img:
-        league_html = f"<img src='{league_img}' width='20' style='vertical-align:middle;margin-right:4px;border-radius:3px;'>"
+        league_html = f"<img src='{sized(league_img, 32)}' width='20' style='vertical-align:middle;margin-right:4px;border-radius:3px;'>"
 
     # Meta chips
     meta_chips = []
@@ -576,14 +613,20 @@ def render_article(article: dict, index: int):
                     st.markdown(f'<div class="article-paragraph">{line}</div>', unsafe_allow_html=True)
 
 
-def render_stats_row(articles: list, pagination: dict = None):
+def article_league(article: dict, tables: dict = None) -> dict:
+    if tables:
+        return (tables.get("leagues") or {}).get(str(article.get("league_id"))) or {}
+    return article.get("league", {})
+
+
+def render_stats_row(articles: list, pagination: dict = None, tables: dict = None):
     """Show stats cards for the fetched data."""
     total_articles = len(articles)
     total_paragraphs = sum(len(a.get("lines", [])) for a in articles)
 
     leagues_seen = set()
     for a in articles:
-        lg = a.get("league", {})
+        lg = article_league(a, tables)
         if isinstance(lg, dict) and lg.get("name"):
             leagues_seen.add(lg["name"])
 
@@ -605,11 +648,11 @@ def render_stats_row(articles: list, pagination: dict = None):
             st.markdown(f'<div class="stat-card"><div class="stat-value" style="font-size:1.4rem;">{label}</div><div class="stat-label">Preview / Results</div></div>', unsafe_allow_html=True)
 
 
-def render_league_breakdown(articles: list):
+def render_league_breakdown(articles: list, tables: dict = None):
     """Show which leagues are covered."""
     league_counts = {}
     for a in articles:
-        lg = a.get("league", {})
+        lg = article_league(a, tables)
         if isinstance(lg, dict) and lg.get("name"):
             name = lg["name"]
             league_counts[name] = league_counts.get(name, 0) + 1
@@ -624,8 +667,42 @@ def render_league_breakdown(articles: list):
                     st.markdown(f'<div class="stat-card" style="margin-bottom:0.5rem;padding:0.8rem;"><div class="stat-value" style="font-size:1.3rem;">{count}</div><div class="stat-label" style="font-size:0.7rem;">{lg_name}</div></div>', unsafe_allow_html=True)
 
 
-def render_results_section(data: dict, selected_filters: list):
-    """Full results renderer with filtering support."""
+def reset_pages():
+    st.session_state.page_cursor = None
+    st.session_state.cursor_trail = []
+
+
+def go_next(next_cursor: str):
+    st.session_state.cursor_trail.append(st.session_state.page_cursor)
+    st.session_state.page_cursor = next_cursor
+    st.session_state.page_changed = True
+
+
+def go_previous():
+    trail = st.session_state.cursor_trail
+    st.session_state.page_cursor = trail.pop() if trail else None
+    st.session_state.page_changed = True
+
+
+def render_pager(pagination: dict):
+    """Cursor pagination: each page resumes after the last article shown, so nothing shifts or repeats.
+    Feeds without a cursor (upcoming) page by number instead — "page:N" in the same slot."""
+    next_cursor = pagination.get("next_cursor")
+    if not next_cursor and pagination.get("has_more") and pagination.get("current_page"):
+        next_cursor = f"page:{int(pagination['current_page']) + 1}"
+    has_previous = bool(st.session_state.get("cursor_trail"))
+    if not next_cursor and not has_previous:
+        return
+    col_newer, col_older = st.columns(2)
+    with col_newer:
+        st.button("◀ Previous", use_container_width=True, disabled=not has_previous, on_click=go_previous)
+    with col_older:
+        st.button("Next ▶", use_container_width=True, disabled=not next_cursor,
+                  on_click=go_next, args=(next_cursor,))
+
+
+def render_results_section(data: dict):
+    """Full results renderer — league filtering has already been applied by the backend."""
     if not data:
         st.warning("No response received from the API.")
         return
@@ -645,24 +722,25 @@ def render_results_section(data: dict, selected_filters: list):
         st.json(data)
         return
 
-    # Apply league filter
-    filtered_articles = filter_articles_by_league(articles, selected_filters)
+    filter_info = data.get("filter") or {}
+    # shape=normalized: fixtures, leagues and teams arrive once, in side tables keyed by id
+    tables = data if data.get("shape") == "normalized" else None
 
     # Filter indicator
-    if selected_filters and len(filtered_articles) != len(articles):
+    if filter_info and filter_info.get("matched") != filter_info.get("total"):
         st.markdown(f"""
         <div class="filter-info">
-            Showing <span>{len(filtered_articles)}</span> of {len(articles)} articles matching your league filters
+            Showing <span>{filter_info.get("matched")}</span> of {filter_info.get("total")} articles matching your league filters
         </div>
         """, unsafe_allow_html=True)
 
     # Stats row
-    render_stats_row(filtered_articles, pagination)
+    render_stats_row(articles, pagination, tables)
     st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
 
     # League breakdown
-    if filtered_articles:
-        render_league_breakdown(filtered_articles)
+    if articles:
+        render_league_breakdown(articles, tables)
         st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
 
     # Subscription & Rate Limit (compact)
@@ -681,10 +759,10 @@ def render_results_section(data: dict, selected_filters: list):
         st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
 
     # Articles
-    if filtered_articles:
-        st.markdown(f"### 📰 News Articles ({len(filtered_articles)})")
-        for i, article in enumerate(filtered_articles):
-            render_article(article, i + 1)
+    if articles:
+        st.markdown(f"### 📰 News Articles ({len(articles)})")
+        for i, article in enumerate(articles):
+            render_article(article, i + 1, tables)
     else:
         st.markdown("""
         <div class="empty-state">
@@ -694,6 +772,8 @@ def render_results_section(data: dict, selected_filters: list):
         </div>
         """, unsafe_allow_html=True)
 
+    render_pager(pagination)
+
     # Raw JSON
     with st.expander("🔍 View Raw JSON Response", expanded=False):
         st.json(data)
@@ -709,6 +789,13 @@ if "news_type" not in st.session_state:
     st.session_state.news_type = "latest"
 if "auto_loaded" not in st.session_state:
     st.session_state.auto_loaded = False
+if "news_filters" not in st.session_state:
+    st.session_state.news_filters = ""
+if "news_version" not in st.session_state:
+    st.session_state.news_version = None  # /api/news/changes token of the first page on screen
+if "page_cursor" not in st.session_state:
+    st.session_state.page_cursor = None  # None = first page
+    st.session_state.cursor_trail = []  # cursors of the pages before this one, for "Previous"
 
 
 # ──────────────────────────────────────────────
@@ -783,8 +870,6 @@ with st.sidebar:
                              help="Newest first (desc) or oldest first (asc)")
         per_page = st.slider("Articles Per Page", 1, 50, 50,
                              help="Number of articles per request")
-        page = st.number_input("Page", min_value=1, value=1,
-                               help="Pagination page number")
         season_id = st.number_input("Season ID (for season endpoints)", min_value=1, value=23614, step=1,
                                     help="SportMonks Season ID (e.g., 23614 for EPL 2024/25)")
 
@@ -813,10 +898,6 @@ try:
     _ = per_page
 except NameError:
     per_page = 50
-try:
-    _ = page
-except NameError:
-    page = 1
 try:
     _ = season_id
 except NameError:
@@ -827,9 +908,15 @@ except NameError:
 # FETCH FUNCTIONS
 # ──────────────────────────────────────────────
 
-def fetch_news(ntype: str, p: int = 1, pp: int = 50) -> dict:
+def fetch_news(ntype: str, cursor: str = None, pp: int = 50, competitions: str = "") -> dict:
     """Fetch news based on the simple news type selector."""
-    params = {"include": include, "order": order, "per_page": pp, "page": p}
+    params = {"include": include, "order": order, "per_page": pp, "shape": "normalized", "images": image_mode()}
+    if competitions:
+        params["competitions"] = competitions
+    if cursor and cursor.startswith("page:"):
+        params["page"] = int(cursor[len("page:"):])
+    elif cursor:
+        params["cursor"] = cursor
 
     if ntype == "latest":
         return call("/api/news/pre-match", params)
@@ -840,39 +927,84 @@ def fetch_news(ntype: str, p: int = 1, pp: int = 50) -> dict:
     return {"error": True, "message": "Unknown news type"}
 
 
-def fetch_combined_latest(pp: int = 50) -> dict:
-    """Fetch both pre-match and post-match for the 'Latest News' view."""
-    params = {"include": include, "order": order, "per_page": pp, "page": 1}
+def fetch_combined_latest(cursor: str = None, pp: int = 50, competitions: str = "") -> dict:
+    """Fetch the merged pre-match + post-match feed for the 'Latest News' view (one round trip)."""
+    params = {"include": include, "order": order, "per_page": pp, "shape": "normalized", "images": image_mode()}
+    if competitions:
+        params["competitions"] = competitions
+    if cursor:
+        params["cursor"] = cursor
+    return call("/api/news/latest", params)
+
+
+def fetch_changes(feeds: str, since: int = None, competitions: str = "") -> dict:
+    """Articles inserted or edited since a version token — or, without one, just the current token."""
+    params = {"feeds": feeds, "include": include, "shape": "normalized", "images": image_mode(), "limit": 200}
+    if since is not None:
+        params["since"] = since
+    if competitions:
+        params["competitions"] = competitions
+    try:
+        # Not through call(): every token is a new URL, so ETag revalidation never applies
+        resp = requests.get(f"{BACKEND}/api/news/changes", params=params, timeout=30)
+        return resp.json() if resp.ok else {"error": True, "message": f"HTTP {resp.status_code}"}
+    except Exception as e:
+        return {"error": True, "message": str(e)}
 
-    pre_data = call("/api/news/pre-match", params)
-    post_data = call("/api/news/post-match", params)
 
-    combined_articles = []
-    pagination = {}
-    rate_limit = {}
-    subscription = []
+def article_key(article: dict) -> tuple:
+    return (article.get("type"), article.get("id"))
 
-    if not pre_data.get("error") and isinstance(pre_data.get("data"), list):
-        combined_articles.extend(pre_data["data"])
-        pagination = pre_data.get("pagination", {})
-        rate_limit = pre_data.get("rate_limit", {})
-        subscription = pre_data.get("subscription", [])
 
-    if not post_data.get("error") and isinstance(post_data.get("data"), list):
-        combined_articles.extend(post_data["data"])
+def article_position(article: dict) -> tuple:
+    return (article.get("created_at") or "", article.get("id") or 0)
 
-    # Sort combined by created_at desc
-    combined_articles.sort(
-        key=lambda x: x.get("created_at", "") or "",
-        reverse=True
-    )
 
-    return {
-        "data": combined_articles,
-        "pagination": pagination,
-        "rate_limit": rate_limit,
-        "subscription": subscription,
+def patch_news(data: dict, delta: dict) -> dict:
+    """Merge changed articles into a cached first page (newest first): edits replace their old copy,
+    new articles go on top. Nothing is trimmed, so the page's next cursor still resumes where it did."""
+    current = data.get("data") or []
+    present = {article_key(a) for a in current}
+    pagination = data.get("pagination") or {}
+    tail = min((article_position(a) for a in current), default=None)
+    more = pagination.get("has_more") or pagination.get("next_cursor")
+    # An edit to an article beyond this page belongs to a later page — it is fetched when that page is
+    changed = {
+        article_key(a): a for a in delta.get("data") or []
+        if article_key(a) in present or not more or tail is None or article_position(a) >= tail
     }
+    if not changed:
+        return data
+    added = len(set(changed) - present)
+    articles = [a for a in current if article_key(a) not in changed] + list(changed.values())
+    articles.sort(key=article_position, reverse=True)
+    patched = {**data, "data": articles, "pagination": {**pagination, "count": len(articles)}}
+    for table in ("fixtures", "leagues", "teams"):
+        if delta.get(table):
+            patched[table] = {**(data.get(table) or {}), **delta[table]}
+    if data.get("filter"):
+        patched["filter"] = {**data["filter"], "matched": len(articles), "total": data["filter"].get("total", 0) + added}
+    return patched
+
+
+def refresh_from_changes(ntype: str, competitions: str) -> bool:
+    """Patch the first page on screen with what changed since it was loaded; False if it must be re-fetched."""
+    data = st.session_state.news_data
+    version = st.session_state.get("news_version")
+    feeds = CHANGES_FEEDS.get(ntype)
+    if (
+        not data or data.get("error") or version is None or feeds is None or order != "desc"
+        or ntype != st.session_state.news_type or competitions != st.session_state.news_filters
+        or st.session_state.page_cursor is not None or data.get("shape") != "normalized"
+    ):
+        return False
+    delta = fetch_changes(feeds, version, competitions)
+    if delta.get("error") or delta.get("has_more"):
+        # Store off, or more changed than one batch holds — a full page is cheaper
+        return False
+    st.session_state.news_data = patch_news(data, delta)
+    st.session_state.news_version = delta.get("version", version)
+    return True
 
 
 # ──────────────────────────────────────────────
@@ -932,11 +1064,22 @@ st.markdown("---")
 # ──────────────────────────────────────────────
 
 should_fetch = False
+selected_competitions = competitions_param(selected_filters)
 
-# Manual refresh button pressed
-if fetch_btn:
+# Manual refresh button pressed — the first page on screen only downloads what changed
+if fetch_btn and not refresh_from_changes(news_type, selected_competitions):
     should_fetch = True
     st.session_state.news_data = None  # Clear cache to force re-fetch
+    reset_pages()
+
+# League filters are applied server-side, so a filter change needs a fresh fetch
+if st.session_state.news_data and selected_competitions != st.session_state.news_filters:
+    should_fetch = True
+    reset_pages()
+
+# Previous / Next pressed — the callback already moved the cursor
+if st.session_state.pop("page_changed", False):
+    should_fetch = True
 
 # Auto-load on first visit
 if not st.session_state.auto_loaded and alive:
@@ -954,17 +1097,24 @@ if should_fetch and alive:
     """, unsafe_allow_html=True)
 
     with st.spinner("Fetching latest football news..."):
+        # Change-log version taken before the page, so nothing that lands in between is missed
+        feeds = CHANGES_FEEDS.get(news_type)
+        version = None
+        if feeds and st.session_state.page_cursor is None:
+            version = fetch_changes(feeds, competitions=selected_competitions).get("version")
+        st.session_state.news_version = version
         if news_type == "latest":
-            data = fetch_combined_latest(per_page)
+            data = fetch_combined_latest(st.session_state.page_cursor, per_page, selected_competitions)
         else:
-            data = fetch_news(news_type, page, per_page)
+            data = fetch_news(news_type, st.session_state.page_cursor, per_page, selected_competitions)
 
     st.session_state.news_data = data
     st.session_state.news_type = news_type
-    render_results_section(data, selected_filters)
+    st.session_state.news_filters = selected_competitions
+    render_results_section(data)
 
 elif st.session_state.news_data and alive:
-    # Re-render cached data (when filters change, no re-fetch needed)
+    # Re-render cached data (nothing changed since the last fetch)
     type_info = NEWS_TYPES.get(st.session_state.news_type, NEWS_TYPES["latest"])
     st.markdown(f"""
     <div style="display:flex;align-items:center;gap:12px;margin-bottom:0.5rem;">
@@ -972,7 +1122,7 @@ elif st.session_state.news_data and alive:
         <span class="badge-live">LIVE</span>
     </div>
     """, unsafe_allow_html=True)
-    render_results_section(st.session_state.news_data, selected_filters)
+    render_results_section(st.session_state.news_data)
 
 elif not alive:
     st.markdown("""
@@ -0,0 +1,41 @@
+"""
+gunicorn config — production serving mode for the FastAPI backend.
+Usage: gunicorn backend.main:app -c gunicorn.conf.py
+
+One uvicorn worker per core (WEB_CONCURRENCY overrides); uvicorn's "auto" loop and HTTP
+parser pick uvloop and httptools when they are installed. Workers share upstream responses
+through the SQLite tier in backend/services/shared_cache.py and aggregate Prometheus samples
+through PROMETHEUS_MULTIPROC_DIR. A lease in the same SQLite file elects the one worker that runs
+the store sync and the prefetcher (backend/services/leader.py). benchmarks/scaling.py measures throughput from 1 to N workers.
+"""
+
+import os
+import shutil
+
+# Settings are read when backend.config is imported — defaults for the workers go in first
+os.environ.setdefault("SHARED_CACHE_ENABLED", "true")
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", os.path.join("data", "prometheus"))
+
+from backend.config import settings  # noqa: E402
+
+bind = f"0.0.0.0:{os.getenv('PORT', str(settings.fastapi_port))}"
+workers = settings.web_concurrency
+worker_class = "uvicorn.workers.UvicornWorker"
+# Streaming routes (SSE, crawls) keep connections open; don't let the arbiter kill them as hung
+timeout = 120
+graceful_timeout = 30
+keepalive = 5
+
+
+def on_starting(server):
+    # Samples from a previous run would be summed into this one's — start from an empty directory
+    directory = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory, exist_ok=True)
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    # Drop a dead worker's live gauges (in-flight counts) from the aggregate
+    multiprocess.mark_process_dead(worker.pid)